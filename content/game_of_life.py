@@ -2,15 +2,27 @@
 Conway’s Game of Life Simulation
 
 This module implements core update rules and simulation drivers for Conway’s
-Game of Life on 2D grids, with three backends:
+Game of Life on 2D grids, with four backends:
 - NumPy vectorized updates
 - CuPy GPU-accelerated updates
 - Naive Python nested loops
-
-It also provides an animation exporter (GIF via matplotlib) and CLI entry points:
+- Bit-packed NumPy updates (64 cells per uint64 word)
+
+The NumPy and naive backends also accept HaloGrid boards (see
+game_of_life_halo.py), which add "dead" and "reflect" boundaries alongside
+the default toroidal wrap. The simulate and iter functions can stop early
+once the board repeats (see game_of_life_cycles.py). All
+simulate functions can record history into a disk-backed HistoryStore (see
+game_of_life_history.py) instead of a list, so large boards can be animated.
+The iter_life_* generators yield each generation lazily as a read-only view
+of the engine's buffers, for streaming analysis (see
+game_of_life_reducers.py).
+
+It also provides an animation exporter (GIF via game_of_life_gif.py) and CLI entry points:
 - run_life_numpy()
 - run_life_cupy()
 - run_life_naive()
+- run_life_bitpacked()
 """
 
 # -------------------------------------------------------------------
@@ -18,17 +30,23 @@ It also provides an animation exporter (GIF via matplotlib) and CLI entry points
 # -------------------------------------------------------------------
 import argparse
 from pathlib import Path
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
 import numpy as np
 import cupy as cp
 
+from content.game_of_life_checkpoint import DEFAULT_EVERY, Checkpointer
+from content.game_of_life_cycles import CycleDetector
+from content.game_of_life_gif import write_gif
+from content.game_of_life_halo import BOUNDARIES, HaloGrid
+from content.game_of_life_history import HistoryStore
+from content.game_of_life_init import random_board
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 1) Core update functions (no plotting/animation)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def life_step_numpy(grid: np.ndarray) -> np.ndarray:
+def life_step_numpy(grid: np.ndarray, out: HaloGrid = None, neighbours: np.ndarray = None,
+                    rows: np.ndarray = None) -> np.ndarray:
     """
     Compute the next generation of the Game of Life using NumPy.
 
@@ -37,12 +55,38 @@ def life_step_numpy(grid: np.ndarray) -> np.ndarray:
       - A live cell with 2 or 3 neighbors stays alive.
       - Otherwise, the cell dies or remains dead.
 
+    A uint8 HaloGrid may be passed instead of an array, in which case the
+    step is life_step_halo_into: neighbours are read through zero-copy
+    slices, its boundary mode is used and the next generation is written
+    into out. Loops should pass a preallocated out (and work buffers) and
+    swap the two grids, so no board is allocated per generation:
+
+        nxt = life_step_numpy(grid, out, neighbours, rows)
+        grid, out = nxt, grid
+
     Args:
-        grid (np.ndarray): 2D array of 0s and 1s representing the current state.
+        grid (np.ndarray or HaloGrid): 2D array of 0s and 1s representing
+            the current state.
+        out (HaloGrid, optional): HaloGrid-only: grid receiving the next
+            generation (allocated if omitted).
+        neighbours (np.ndarray, optional): HaloGrid-only: (N, M) uint8 work
+            array (allocated if omitted).
+        rows (np.ndarray, optional): HaloGrid-only: (N + 2, M) uint8 work
+            array (allocated if omitted).
 
     Returns:
-        np.ndarray: 2D array of the same shape for the next generation.
+        np.ndarray or HaloGrid: Next generation, of the same kind as grid.
     """
+    if isinstance(grid, HaloGrid):
+        N, M = grid.shape
+        if out is None:
+            out = HaloGrid(grid.interior, grid.boundary)
+        if neighbours is None:
+            neighbours = np.empty((N, M), dtype=np.uint8)
+        if rows is None:
+            rows = np.empty((N + 2, M), dtype=np.uint8)
+        return life_step_halo_into(grid, out, neighbours, rows)
+
     neighbours = (
         np.roll(np.roll(grid, 1, axis=0), 1, axis=1) +
         np.roll(np.roll(grid, 1, axis=0), -1, axis=1) +
@@ -56,6 +100,151 @@ def life_step_numpy(grid: np.ndarray) -> np.ndarray:
     return np.where((neighbours == 3) | ((grid == 1) & (neighbours == 2)), 1, 0)
 
 
+def _roll_into(src, shift: int, axis: int, out, xp=np):
+    """
+    Write xp.roll(src, shift, axis) into a preallocated array.
+
+    Only slice views are created, so no array data is allocated. The axis
+    counts from the last two dimensions, so a stack of boards of shape
+    (..., N, M) is rolled board by board.
+
+    Args:
+        src (np.ndarray or cp.ndarray): Array of shape (..., N, M) to roll.
+        shift (int): Roll distance (1 or -1).
+        axis (int): Board axis along which to roll (0 for rows, 1 for columns).
+        out (np.ndarray or cp.ndarray): Destination with the same shape as src.
+        xp (module): Array module owning the arrays (numpy or cupy).
+
+    Returns:
+        np.ndarray or cp.ndarray: The out array.
+    """
+    if axis == 0:
+        xp.copyto(out[..., shift:, :], src[..., :-shift, :])
+        xp.copyto(out[..., :shift, :], src[..., -shift:, :])
+    else:
+        xp.copyto(out[..., shift:], src[..., :-shift])
+        xp.copyto(out[..., :shift], src[..., -shift:])
+    return out
+
+
+def neighbour_count(grid, xp=np, out=None, scratch=None):
+    """
+    Count the 8 toroidal neighbours of every cell with a separable 3x3 sum.
+
+    The 3x3 box sum is separable: each row is first summed with its left and
+    right neighbours, those row sums are then summed with the rows above and
+    below, and finally the centre cell is subtracted. This needs 4 rolls and
+    5 additions/subtractions per step, instead of the 12 rolls and 7
+    additions of the direct 8-term sum in life_step_numpy.
+
+    Works for NumPy and CuPy arrays through the array-module argument, and
+    for a stack of boards of shape (..., N, M), each wrapping on its own.
+    When out and scratch are supplied nothing is allocated.
+
+    Args:
+        grid (np.ndarray or cp.ndarray): 2D array of 0s and 1s, or a stack
+            of such boards.
+        xp (module): Array module owning grid (numpy or cupy).
+        out (array, optional): Array shaped like grid receiving the counts.
+            Allocated with the dtype of grid if omitted.
+        scratch (array, optional): Work array of shape (2,) + grid.shape with
+            the dtype of out. Allocated if omitted.
+
+    Returns:
+        np.ndarray or cp.ndarray: Array of neighbour counts (0–8).
+    """
+    if out is None:
+        out = xp.empty_like(grid)
+    if scratch is None:
+        scratch = xp.empty((2,) + grid.shape, dtype=out.dtype)
+    rows, shifted = scratch[0], scratch[1]
+
+    # Horizontal pass: rows = west + centre + east
+    xp.add(grid, _roll_into(grid, 1, 1, shifted, xp), out=rows)
+    xp.add(rows, _roll_into(grid, -1, 1, shifted, xp), out=rows)
+
+    # Vertical pass: out = rows above + rows + rows below - centre
+    _roll_into(rows, 1, 0, out, xp)
+    xp.add(out, _roll_into(rows, -1, 0, shifted, xp), out=out)
+    xp.add(out, rows, out=out)
+    xp.subtract(out, grid, out=out)
+    return out
+
+
+def life_step_numpy_into(grid: np.ndarray, out: np.ndarray,
+                         neighbours: np.ndarray, scratch: np.ndarray) -> np.ndarray:
+    """
+    Compute the next generation into preallocated buffers using NumPy.
+
+    Applies the same toroidal rules as life_step_numpy, but the separable
+    neighbour count and the rule comparisons are written into caller-provided
+    uint8 buffers, so a step allocates no array memory. Callers alternate
+    (ping-pong) between two grids:
+
+        life_step_numpy_into(grid, out, neighbours, scratch)
+        grid, out = out, grid
+
+    A stack of boards of shape (B, N, M) is stepped in the same call, with
+    every board wrapping independently.
+
+    Args:
+        grid (np.ndarray): 2D uint8 array of 0s and 1s (current state), or a
+            (B, N, M) stack of boards.
+        out (np.ndarray): uint8 array shaped like grid receiving the next
+            generation. Must not share memory with grid.
+        neighbours (np.ndarray): uint8 work array shaped like grid.
+        scratch (np.ndarray): uint8 work array of shape (2,) + grid.shape.
+
+    Returns:
+        np.ndarray: The out array.
+    """
+    neighbour_count(grid, np, neighbours, scratch)
+
+    # Rules: (neighbours == 3) | (alive & (neighbours == 2)), written as bools
+    # straight into the uint8 buffers
+    born = out.view(np.bool_)
+    survive = scratch[1].view(np.bool_)
+    np.equal(neighbours, 3, out=born)
+    np.equal(neighbours, 2, out=survive)
+    np.logical_and(survive, grid.view(np.bool_), out=survive)
+    np.logical_or(born, survive, out=born)
+    return out
+
+
+def life_step_halo_into(grid: HaloGrid, out: HaloGrid,
+                        neighbours: np.ndarray, rows: np.ndarray) -> HaloGrid:
+    """
+    Compute the next generation between two preallocated HaloGrids.
+
+    Neighbours are counted with zero-copy slices of the padded board, the
+    rules are written into out's interior and only out's halo is refreshed,
+    so a step neither rolls the board nor allocates array memory. Callers
+    ping-pong between the two grids as with life_step_numpy_into. A
+    HaloGrid holding a (B, N, M) stack of boards is stepped in one call.
+
+    Args:
+        grid (HaloGrid): Current state (uint8 storage).
+        out (HaloGrid): Grid receiving the next generation, with the same
+            shape and boundary mode as grid.
+        neighbours (np.ndarray): (..., N, M) uint8 work array for neighbour
+            counts.
+        rows (np.ndarray): (..., N + 2, M) uint8 work array for row sums.
+
+    Returns:
+        HaloGrid: The out grid.
+    """
+    grid.neighbour_count(neighbours, rows)
+
+    born = out.interior.view(np.bool_)
+    survive = rows[..., 1:-1, :].view(np.bool_)
+    np.equal(neighbours, 3, out=born)
+    np.equal(neighbours, 2, out=survive)
+    np.logical_and(survive, grid.interior.view(np.bool_), out=survive)
+    np.logical_or(born, survive, out=born)
+    out.refresh_halo()
+    return out
+
+
 def life_step_gpu(grid: cp.ndarray) -> cp.ndarray:
     """
     Compute the next generation of the Game of Life using CuPy on GPU.
@@ -81,18 +270,66 @@ def life_step_gpu(grid: cp.ndarray) -> cp.ndarray:
     return cp.where((neighbours == 3) | ((grid == 1) & (neighbours == 2)), 1, 0)
 
 
+def life_step_gpu_into(grid: cp.ndarray, out: cp.ndarray,
+                       neighbours: cp.ndarray, scratch: cp.ndarray) -> cp.ndarray:
+    """
+    Compute the next generation into preallocated CuPy buffers.
+
+    GPU counterpart of life_step_numpy_into, using the same separable
+    neighbour count so no device memory is allocated per step.
+
+    Args:
+        grid (cp.ndarray): 2D uint8 CuPy array of 0s and 1s.
+        out (cp.ndarray): 2D uint8 CuPy array receiving the next generation.
+        neighbours (cp.ndarray): 2D uint8 work array for neighbour counts.
+        scratch (cp.ndarray): uint8 work array of shape (2, N, M).
+
+    Returns:
+        cp.ndarray: The out array.
+    """
+    neighbour_count(grid, cp, neighbours, scratch)
+
+    born = out.view(cp.bool_)
+    survive = scratch[1].view(cp.bool_)
+    cp.equal(neighbours, 3, out=born)
+    cp.equal(neighbours, 2, out=survive)
+    cp.logical_and(survive, grid.view(cp.bool_), out=survive)
+    cp.logical_or(born, survive, out=born)
+    return out
+
+
 def life_step_naive(grid: np.ndarray) -> np.ndarray:
     """
     Compute the next generation with a naive Python loop implementation.
 
-    Iterates over each cell and its 8 neighbors, applying wrap-around.
+    Iterates over each cell and its 8 neighbors, applying wrap-around. If a
+    HaloGrid is passed, neighbours are read from its padded array without
+    wrap-around arithmetic, using its boundary mode.
 
     Args:
-        grid (np.ndarray): 2D array of 0s and 1s.
+        grid (np.ndarray or HaloGrid): 2D array of 0s and 1s.
 
     Returns:
-        np.ndarray: Next-generation 2D array.
+        np.ndarray or HaloGrid: Next generation, of the same kind as grid.
     """
+    if isinstance(grid, HaloGrid):
+        padded = grid.padded
+        N, M = grid.shape
+        new = np.zeros((N, M), dtype=int)
+        for i in range(1, N + 1):
+            for j in range(1, M + 1):
+                cnt = 0
+                for di in (-1, 0, 1):
+                    for dj in (-1, 0, 1):
+                        if di == 0 and dj == 0:
+                            continue
+                        cnt += padded[i + di, j + dj]
+                if padded[i, j] == 1:
+                    new[i - 1, j - 1] = 1 if (cnt == 2 or cnt == 3) else 0
+                else:
+                    new[i - 1, j - 1] = 1 if (cnt == 3) else 0
+        return HaloGrid(new, grid.boundary, padded.dtype)
+
     N, M = grid.shape
     new = np.zeros((N, M), dtype=int)
     for i in range(N):
@@ -111,58 +348,225 @@ def life_step_naive(grid: np.ndarray) -> np.ndarray:
     return new
 
 
+def pack_grid(grid: np.ndarray) -> np.ndarray:
+    """
+    Pack a 2D grid of 0s and 1s into rows of little-endian uint64 words.
+
+    Cell (i, j) is stored in bit j % 64 of word j // 64 of row i. Columns
+    beyond the grid width in the final word are left as zeros.
+
+    Args:
+        grid (np.ndarray): 2D array of 0s and 1s with shape (N, M).
+
+    Returns:
+        np.ndarray: 2D uint64 array of shape (N, ceil(M / 64)).
+    """
+    N, M = grid.shape
+    n_words = (M + 63) // 64
+    packed = np.zeros((N, n_words * 8), dtype=np.uint8)
+    packed[:, :(M + 7) // 8] = np.packbits(grid != 0, axis=1, bitorder='little')
+    return packed.view('<u8').astype(np.uint64)
+
+
+def unpack_grid(packed: np.ndarray, width: int) -> np.ndarray:
+    """
+    Unpack a grid produced by pack_grid back into a 2D array of 0s and 1s.
+
+    Args:
+        packed (np.ndarray): 2D uint64 array of packed rows.
+        width (int): Number of columns (M) in the original grid.
+
+    Returns:
+        np.ndarray: 2D uint8 array of shape (N, width).
+    """
+    as_bytes = np.ascontiguousarray(packed, dtype='<u8').view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, count=width, bitorder='little')
+
+
+def life_step_bitpacked(packed: np.ndarray, width: int) -> np.ndarray:
+    """
+    Compute the next generation on a bit-packed grid using bitwise adders.
+
+    Each uint64 word holds 64 cells, so every bitwise operation updates 64
+    cells at once. The horizontal 3-cell sum of every row is formed with a
+    full adder, then the three row sums above, on and below each cell are
+    added to give the 3x3 box total (neighbours plus the cell itself). A cell
+    is alive next generation when that total is 3, or 4 and it is alive now,
+    which is equivalent to the rules applied by life_step_numpy on the same
+    toroidal grid.
+
+    Args:
+        packed (np.ndarray): 2D uint64 array produced by pack_grid.
+        width (int): Number of columns (M) in the unpacked grid.
+
+    Returns:
+        np.ndarray: Packed next-generation grid of the same shape.
+    """
+    last_bit = np.uint64((width - 1) % 64)
+    one = np.uint64(1)
+    top = np.uint64(63)
+
+    # Bring the west (j - 1) and east (j + 1) neighbour of every cell into
+    # the cell's own bit position, carrying bits across word boundaries and
+    # wrapping the last real column around to the first.
+    carry_west = np.empty_like(packed)
+    carry_west[:, 1:] = packed[:, :-1] >> top
+    carry_west[:, 0] = (packed[:, -1] >> last_bit) & one
+    west = (packed << one) | carry_west
+
+    carry_east = np.empty_like(packed)
+    carry_east[:, :-1] = (packed[:, 1:] & one) << top
+    carry_east[:, -1] = (packed[:, 0] & one) << last_bit
+    east = (packed >> one) | carry_east
+
+    # Horizontal sum west + centre + east as a 2-bit number (row1, row0)
+    row0 = west ^ packed ^ east
+    row1 = (west & packed) | (east & (west ^ packed))
+
+    # Row sums of the rows above and below (toroidal in the vertical axis)
+    up0, up1 = np.roll(row0, 1, axis=0), np.roll(row1, 1, axis=0)
+    down0, down1 = np.roll(row0, -1, axis=0), np.roll(row1, -1, axis=0)
+
+    # Box total = ones + 2 * (up1 + row1 + down1 + twos)
+    ones = up0 ^ row0 ^ down0
+    twos = (up0 & row0) | (down0 & (up0 ^ row0))
+    fours_sum = up1 ^ row1 ^ down1
+    fours_carry = (up1 & row1) | (down1 & (up1 ^ row1))
+    pair_odd = fours_sum ^ twos
+    pair_carry = fours_sum & twos
+
+    # total == 3  ->  ones set and exactly one weight-2 bit
+    # total == 4  ->  ones clear and exactly two weight-2 bits
+    total_is_3 = ones & pair_odd & ~fours_carry
+    total_is_4 = ~ones & ~pair_odd & (fours_carry ^ pair_carry)
+    new = total_is_3 | (total_is_4 & packed)
+
+    # Clear the unused padding bits in the final word of each row
+    new[:, -1] &= ~np.uint64(0) >> (top - last_bit)
+    return new
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 2) Simulation functions (no animation)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def simulate_life_numpy(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False):
+def simulate_life_numpy(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                        boundary: str = "torus", detector: CycleDetector = None,
+                        store: HistoryStore = None, seed: int = None,
+                        checkpointer: Checkpointer = None):
     """
     Run a Game of Life simulation using the NumPy backend.
 
-    Initializes a random NxN grid with alive probability p_alive,
-    then iterates the specified number of timesteps.
+    Initializes a random NxN uint8 grid with alive probability p_alive,
+    then iterates the specified number of timesteps by ping-ponging between
+    two preallocated halo-padded grids with life_step_halo_into.
 
     Args:
         N (int): Grid dimension (N × N).
         timesteps (int): Number of generations to simulate.
         p_alive (float): Probability that a cell starts alive.
         record_history (bool): If True, collect each generation in a list.
+        boundary (str): Boundary mode, one of "torus", "dead" or "reflect".
+        detector (CycleDetector, optional): If given, every generation is
+            passed to it and the run stops at the first repeated state,
+            which is not recorded.
+        store (HistoryStore, optional): If given, each generation is
+            appended to this disk-backed store instead of a list.
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+        checkpointer (Checkpointer, optional): If given, draws the board (or
+            restores it when resuming) and checkpoints the run periodically.
+            timesteps counts from generation 0, so a resumed run only steps
+            the remaining generations.
 
     Returns:
-        list[np.ndarray] or None: History of grids if record_history else None.
+        list[np.ndarray], HistoryStore or None: The store if given, else the
+        history of grids if record_history, else None.
     """
-    grid = np.random.choice([0, 1], size=(N, N), p=[1 - p_alive, p_alive])
+    if checkpointer is None:
+        start, board = 0, random_board((N, N), p_alive, seed)
+    else:
+        start, board = checkpointer.initial_board((N, N), p_alive, seed, boundary=boundary)
+    grid = HaloGrid(board, boundary)
+    # Preallocate the ping-pong partner and work buffers once; the loop
+    # below then allocates nothing unless history is recorded.
+    out = HaloGrid(grid.interior, boundary)
+    neighbours = np.empty((N, N), dtype=np.uint8)
+    rows = np.empty((N + 2, N), dtype=np.uint8)
     history = [] if record_history else None
-    for _ in range(timesteps):
-        if record_history:
-            history.append(grid.copy())
-        grid = life_step_numpy(grid)
-    return history
-
-
-def simulate_life_cupy(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False):
+    for t in range(start, timesteps):
+        if detector is not None and detector.update(grid.interior):
+            break
+        if store is not None:
+            store.append(grid.interior)
+        elif record_history:
+            history.append(grid.to_array())
+        life_step_halo_into(grid, out, neighbours, rows)
+        grid, out = out, grid
+        if checkpointer is not None:
+            checkpointer.update(t + 1, grid.interior)
+    return store if store is not None else history
+
+
+def simulate_life_cupy(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                       detector: CycleDetector = None, store: HistoryStore = None, seed: int = None,
+                       checkpointer: Checkpointer = None):
     """
     Run a Game of Life simulation on GPU using CuPy.
 
+    Steps with life_step_gpu_into, ping-ponging between two preallocated
+    device grids.
+
     Args:
         N (int): Grid dimension (N × N).
         timesteps (int): Number of generations.
         p_alive (float): Initial alive probability.
         record_history (bool): If True, collect grids (converted to NumPy).
+        detector (CycleDetector, optional): If given, every generation is
+            bit-packed on the device and only the packed board is copied to
+            the host for it; the run stops at the first repeated state,
+            which is not recorded.
+        store (HistoryStore, optional): If given, each generation is copied
+            to the host and appended to this disk-backed store instead.
+        seed (int, optional): If given, the board is drawn on the host with
+            random_board (same board as the CPU backends); otherwise on the GPU.
+        checkpointer (Checkpointer, optional): If given, draws the board on
+            the host (or restores it when resuming) and checkpoints the run
+            periodically, copying the board to the host. timesteps counts
+            from generation 0, so a resumed run only steps the remaining
+            generations.
 
     Returns:
-        list[np.ndarray] or None: History of grids as NumPy arrays if recorded.
+        list[np.ndarray], HistoryStore or None: The store if given, else the
+        history of grids as NumPy arrays if recorded.
     """
-    grid_gpu = (cp.random.random((N, N)) < p_alive).astype(cp.int32)
-    history = [] if record_history else None
-    for _ in range(timesteps):
-        if record_history:
+    start = 0
+    if checkpointer is not None:
+        start, board = checkpointer.initial_board((N, N), p_alive, seed)
+        grid_gpu = cp.asarray(board)
+    elif seed is None:
+        grid_gpu = (cp.random.random((N, N)) < p_alive).astype(cp.uint8)
+    else:
+        grid_gpu = cp.asarray(random_board((N, N), p_alive, seed))
+    out_gpu = cp.empty_like(grid_gpu)
+    neighbours_gpu = cp.empty_like(grid_gpu)
+    scratch_gpu = cp.empty((2, N, N), dtype=cp.uint8)
+    history = store if store is not None else ([] if record_history else None)
+    for t in range(start, timesteps):
+        if detector is not None and detector.update_packed(cp.packbits(grid_gpu).get()):
+            break
+        if history is not None:
             history.append(cp.asnumpy(grid_gpu))
-        grid_gpu = life_step_gpu(grid_gpu)
+        life_step_gpu_into(grid_gpu, out_gpu, neighbours_gpu, scratch_gpu)
+        grid_gpu, out_gpu = out_gpu, grid_gpu
+        if checkpointer is not None:
+            checkpointer.update(t + 1, grid_gpu)
     return history
 
 
-def simulate_life_naive(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False):
+def simulate_life_naive(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                        boundary: str = "torus", detector: CycleDetector = None,
+                        store: HistoryStore = None, seed: int = None,
+                        checkpointer: Checkpointer = None):
     """
     Run a Game of Life simulation with the naive Python implementation.
 
@@ -171,19 +575,219 @@ def simulate_life_naive(N: int, timesteps: int, p_alive: float = 0.2, record_his
         timesteps (int): Number of generations.
         p_alive (float): Starting alive probability.
         record_history (bool): Whether to collect each generation.
+        boundary (str): Boundary mode, one of "torus", "dead" or "reflect".
+        detector (CycleDetector, optional): If given, every generation is
+            passed to it and the run stops at the first repeated state,
+            which is not recorded.
+        store (HistoryStore, optional): Disk-backed store to record into
+            instead of a list.
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+        checkpointer (Checkpointer, optional): If given, draws the board (or
+            restores it when resuming) and checkpoints the run periodically.
+            timesteps counts from generation 0, so a resumed run only steps
+            the remaining generations.
 
     Returns:
-        list[np.ndarray] or None: Recorded history if requested.
+        list[np.ndarray], HistoryStore or None: Recorded history if requested.
     """
-    grid = np.random.choice([0, 1], size=(N, N), p=[1 - p_alive, p_alive])
-    history = [] if record_history else None
-    for _ in range(timesteps):
-        if record_history:
-            history.append(grid.copy())
+    if checkpointer is None:
+        start, grid = 0, random_board((N, N), p_alive, seed)
+    else:
+        start, grid = checkpointer.initial_board((N, N), p_alive, seed, boundary=boundary)
+    if boundary != "torus":
+        grid = HaloGrid(grid, boundary)
+    history = store if store is not None else ([] if record_history else None)
+    for t in range(start, timesteps):
+        if detector is not None and detector.update(grid.interior if isinstance(grid, HaloGrid) else grid):
+            break
+        if history is not None:
+            history.append(grid.to_array() if isinstance(grid, HaloGrid) else grid.copy())
         grid = life_step_naive(grid)
+        if checkpointer is not None:
+            checkpointer.update(t + 1, grid.interior if isinstance(grid, HaloGrid) else grid)
     return history
 
 
+def simulate_life_bitpacked(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                            detector: CycleDetector = None, store: HistoryStore = None,
+                            seed: int = None, checkpointer: Checkpointer = None):
+    """
+    Run a Game of Life simulation with the bit-packed NumPy backend.
+
+    The board is held as packed uint64 words (one bit per cell) for the whole
+    run, and only unpacked when a generation is recorded.
+
+    Args:
+        N (int): Grid dimension (N × N).
+        timesteps (int): Number of generations to simulate.
+        p_alive (float): Probability that a cell starts alive.
+        record_history (bool): If True, collect each generation in a list.
+        detector (CycleDetector, optional): If given, the packed words of
+            every generation are passed to it and the run stops at the first
+            repeated state, which is not recorded.
+        store (HistoryStore, optional): If given, the packed words of each
+            generation are appended to this disk-backed store (without
+            unpacking) instead of a list.
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+        checkpointer (Checkpointer, optional): If given, draws the board (or
+            restores it when resuming) and checkpoints the packed words
+            periodically. timesteps counts from generation 0, so a resumed
+            run only steps the remaining generations.
+
+    Returns:
+        list[np.ndarray], HistoryStore or None: The store if given, else the
+        history of grids if record_history, else None.
+    """
+    if checkpointer is None:
+        start, packed = 0, random_board((N, N), p_alive, seed, packed=True)
+    else:
+        start, packed = checkpointer.initial_board((N, N), p_alive, seed, packed=True)
+    history = [] if record_history else None
+    for t in range(start, timesteps):
+        if detector is not None and detector.update_packed(packed):
+            break
+        if store is not None:
+            store.append_packed(packed)
+        elif record_history:
+            history.append(unpack_grid(packed, N))
+        packed = life_step_bitpacked(packed, N)
+        if checkpointer is not None:
+            checkpointer.update(t + 1, packed=packed)
+    return store if store is not None else history
+
+
+def _read_only(grid: np.ndarray) -> np.ndarray:
+    """Return a read-only view of grid."""
+    view = grid.view()
+    view.flags.writeable = False
+    return view
+
+
+def iter_life_numpy(N: int, timesteps: int, p_alive: float = 0.2, every: int = 1,
+                    boundary: str = "torus", initial: np.ndarray = None, seed: int = None,
+                    detector: CycleDetector = None):
+    """
+    Lazily yield the generations of a NumPy-backend run.
+
+    Steps exactly like simulate_life_numpy, but instead of building a
+    history it yields (generation, grid) for generations 0..timesteps. The
+    grid is a read-only view of the engine's ping-pong buffer: it is only
+    valid until the generator is resumed, so copy it to keep it. Each step
+    is computed only when the next generation is requested.
+
+    Args:
+        N (int): Grid dimension (N × N); ignored if initial is given.
+        timesteps (int): Number of generations to step.
+        p_alive (float): Probability that a cell starts alive.
+        every (int): Yield only generations that are multiples of every.
+        boundary (str): Boundary mode, one of "torus", "dead" or "reflect".
+        initial (np.ndarray, optional): Initial board (random if omitted).
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+        detector (CycleDetector, optional): If given, every generation is
+            passed to it (whatever every is) and the generator stops at the
+            first repeated state, which is not yielded.
+
+    Yields:
+        tuple[int, np.ndarray]: Generation number and read-only 2D uint8 view.
+    """
+    if initial is None:
+        initial = random_board((N, N), p_alive, seed)
+    grid = HaloGrid(initial, boundary)
+    out = HaloGrid(grid.interior, boundary)
+    N, M = grid.shape
+    neighbours = np.empty((N, M), dtype=np.uint8)
+    rows = np.empty((N + 2, M), dtype=np.uint8)
+    for t in range(timesteps + 1):
+        if detector is not None and detector.update(grid.interior):
+            return
+        if t % every == 0:
+            yield t, _read_only(grid.interior)
+        if t < timesteps:
+            life_step_halo_into(grid, out, neighbours, rows)
+            grid, out = out, grid
+
+
+def iter_life_cupy(N: int, timesteps: int, p_alive: float = 0.2, every: int = 1,
+                   initial=None, seed: int = None, detector: CycleDetector = None):
+    """
+    Lazily yield the generations of a CuPy-backend run.
+
+    Like iter_life_numpy, but the yielded grids are the engine's device
+    buffers themselves (CuPy arrays have no read-only flag): do not modify
+    them, and copy them to keep them past the next generation. Nothing is
+    copied to the host unless the caller does so.
+
+    Args:
+        N (int): Grid dimension (N × N); ignored if initial is given.
+        timesteps (int): Number of generations to step.
+        p_alive (float): Initial alive probability.
+        every (int): Yield only generations that are multiples of every.
+        initial (array, optional): Initial board (random if omitted).
+        seed (int, optional): If given, the board is drawn on the host with
+            random_board; otherwise on the GPU.
+        detector (CycleDetector, optional): If given, every generation is
+            bit-packed on the device and the packed board is copied to the
+            host for it; the generator stops at the first repeated state,
+            which is not yielded.
+
+    Yields:
+        tuple[int, cp.ndarray]: Generation number and 2D uint8 device array.
+    """
+    if initial is None and seed is not None:
+        initial = random_board((N, N), p_alive, seed)
+    if initial is None:
+        grid_gpu = (cp.random.random((N, N)) < p_alive).astype(cp.uint8)
+    else:
+        grid_gpu = cp.asarray(initial, dtype=cp.uint8)
+    out_gpu = cp.empty_like(grid_gpu)
+    neighbours_gpu = cp.empty_like(grid_gpu)
+    scratch_gpu = cp.empty((2,) + grid_gpu.shape, dtype=cp.uint8)
+    for t in range(timesteps + 1):
+        if detector is not None and detector.update_packed(cp.packbits(grid_gpu).get()):
+            return
+        if t % every == 0:
+            yield t, grid_gpu
+        if t < timesteps:
+            life_step_gpu_into(grid_gpu, out_gpu, neighbours_gpu, scratch_gpu)
+            grid_gpu, out_gpu = out_gpu, grid_gpu
+
+
+def iter_life_naive(N: int, timesteps: int, p_alive: float = 0.2, every: int = 1,
+                    boundary: str = "torus", initial: np.ndarray = None, seed: int = None,
+                    detector: CycleDetector = None):
+    """
+    Lazily yield the generations of a naive-backend run.
+
+    Args:
+        N (int): Grid dimension (N × N); ignored if initial is given.
+        timesteps (int): Number of generations to step.
+        p_alive (float): Starting alive probability.
+        every (int): Yield only generations that are multiples of every.
+        boundary (str): Boundary mode, one of "torus", "dead" or "reflect".
+        initial (np.ndarray, optional): Initial board (random if omitted).
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+        detector (CycleDetector, optional): If given, every generation is
+            passed to it (whatever every is) and the generator stops at the
+            first repeated state, which is not yielded.
+
+    Yields:
+        tuple[int, np.ndarray]: Generation number and read-only 2D view.
+    """
+    grid = initial
+    if grid is None:
+        grid = random_board((N, N), p_alive, seed)
+    if boundary != "torus":
+        grid = HaloGrid(grid, boundary)
+    for t in range(timesteps + 1):
+        board = grid.interior if isinstance(grid, HaloGrid) else grid
+        if detector is not None and detector.update(board):
+            return
+        if t % every == 0:
+            yield t, _read_only(board)
+        if t < timesteps:
+            grid = life_step_naive(grid)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 3) Animation/export
 # ─────────────────────────────────────────────────────────────────────────────
@@ -192,90 +796,159 @@ def animate_life(history, output_file: Path, interval: int = 200, dpi: int = 80)
     """
     Create and save a GIF animation of the Game of Life history.
 
-    Uses matplotlib’s FuncAnimation and the pillow writer.
+    Frames are written with the direct palette encoder (write_gif) rather
+    than through a matplotlib figure. The frame is scaled to fit the 6-inch
+    square the figure used to occupy at the given dpi.
 
     Args:
-        history (list[np.ndarray]): List of 2D grids to animate.
+        history (list[np.ndarray] or HistoryStore): Sequence of 2D grids to
+            animate.
         output_file (Path): Path for the output GIF file.
         interval (int): Delay between frames in ms.
-        dpi (int): Resolution of the saved animation.
+        dpi (int): Resolution of the saved animation (pixels per inch).
     """
-    
-
-    fig, ax = plt.subplots(figsize=(6, 6))
-    im = ax.imshow(history[0], cmap='binary')
-    ax.set_axis_off()
-
-    def _update(idx):
-        im.set_data(history[idx])
-        return [im]
-
-    anim = animation.FuncAnimation(
-        fig, _update,
-        frames=len(history),
-        interval=interval,
-        blit=True
-    )
-    anim.save(str(output_file), writer='pillow', dpi=dpi)
-    plt.close(fig)
+    write_gif(history, output_file, interval=interval, max_display=6 * dpi)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 4) CLI entry-points (only --size, --timesteps, --save-gif)
+# 4) CLI entry-points (--size, --timesteps, --save-gif, --history-file, ...)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def run_life_numpy():
+def _life_parser(title: str, boundary: bool = False, stop_on_cycle: bool = False) -> argparse.ArgumentParser:
     """
-    Command‐line entry for NumPy-based Game of Life.
+    Build the argument parser shared by the run_life_* entry points.
 
-    Parses --size, --timesteps, and --save-gif; runs simulation and optionally saves GIF.
+    Args:
+        title (str): Parser title.
+        boundary (bool): Whether the backend takes --boundary.
+        stop_on_cycle (bool): Whether the backend takes --stop-on-cycle.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
     """
-    p = argparse.ArgumentParser("Game of Life (NumPy)")
+    p = argparse.ArgumentParser(title)
     p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
     p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
     p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
-    args = p.parse_args()
+    p.add_argument("--history-file", type=Path, default=None,
+                   help="Record history to this memory-mapped .npy file (default above size 100)")
+    p.add_argument("--seed",      type=int, default=None, help="Random seed (reproducible board)")
+    p.add_argument("--checkpoint", type=Path, default=None,
+                   help="Periodically checkpoint the run to this .npz file")
+    p.add_argument("--checkpoint-every", type=int, default=DEFAULT_EVERY,
+                   help="Generations between checkpoints")
+    p.add_argument("--resume",    action="store_true", help="Resume from --checkpoint if it exists")
+    if boundary:
+        p.add_argument("--boundary", choices=BOUNDARIES, default="torus", help="Boundary mode")
+    if stop_on_cycle:
+        p.add_argument("--stop-on-cycle", action="store_true", help="Stop once the board repeats")
+    return p
+
+
+def _start_run(p: argparse.ArgumentParser, tag: str, name: str) -> tuple:
+    """
+    Parse and check the CLI arguments and create the run's helpers.
+
+    History is recorded in RAM for a GIF up to size 100, and otherwise (or
+    with --history-file) to a disk-backed HistoryStore, by default
+    game_of_life_<name>_history.npy. A new store overwrites the file, and
+    a resumed run only steps the remaining generations, so --resume is
+    refused whenever a store would be used.
+
+    Args:
+        p (argparse.ArgumentParser): Parser from _life_parser.
+        tag (str): Log prefix, e.g. "NumPy".
+        name (str): Backend name used in the default history file name.
 
-    print(f"[NumPy] Args received: {args}")
+    Returns:
+        tuple: (args, record, store, checkpointer, detector), where record
+        is True if history is kept in RAM and the others may be None.
+    """
+    args = p.parse_args()
+    if args.resume and args.checkpoint is None:
+        p.error("--resume requires --checkpoint")
     record = args.save_gif and args.size <= 100
-    history = simulate_life_numpy(args.size, args.timesteps, record_history=record)
-
-    if args.save_gif:
-        if record:
-            output = Path("game_of_life_cpu.gif")
-            animate_life(history, output)
-            print(f"Saved CPU GIF to {output}")
-        else:
-            print("[NumPy] Problem size > 100: cannot save history or create GIF.")
-    else:
-        print("[NumPy] GIF creation skipped; history not saved.")
+    if args.resume and (args.history_file or (args.save_gif and not record)):
+        p.error("--resume cannot record history to a file (--history-file, or --save-gif above size 100): "
+                "it would overwrite the history recorded before the checkpoint")
+
+    print(f"[{tag}] Args received: {args}")
+    store = None
+    if args.history_file or (args.save_gif and not record):
+        # Large boards record to disk instead of RAM
+        path = args.history_file or Path(f"game_of_life_{name}_history.npy")
+        store = HistoryStore(path, (args.size, args.size), args.timesteps)
+    checkpointer = None
+    if args.checkpoint:
+        checkpointer = Checkpointer(args.checkpoint, args.checkpoint_every, args.resume)
+    detector = CycleDetector() if getattr(args, "stop_on_cycle", False) else None
+    return args, record, store, checkpointer, detector
+
+
+def _finish_run(args, tag: str, label: str, name: str, history, store: HistoryStore,
+                checkpointer: Checkpointer, detector: CycleDetector):
+    """
+    Report on a finished CLI run, save its GIF and close its history store.
+
+    Args:
+        args (argparse.Namespace): Arguments from _start_run.
+        tag (str): Log prefix, e.g. "NumPy".
+        label (str): Backend label in the GIF message, e.g. "CPU".
+        name (str): Backend name; the GIF is game_of_life_<name>.gif.
+        history (list, HistoryStore or None): Value returned by the
+            simulate function.
+        store (HistoryStore or None): Store created by _start_run.
+        checkpointer (Checkpointer or None): Checkpointer of the run.
+        detector (CycleDetector or None): Cycle detector of the run.
+    """
+    if checkpointer is not None:
+        checkpointer.close()
+        print(f"[{tag}] {checkpointer.report()}")
+    if detector is not None:
+        print(f"[{tag}] {detector.report()}")
+
+    if args.save_gif and len(history) == 0:
+        # --timesteps 0, or resumed from a checkpoint at the last generation
+        print(f"[{tag}] No generations stepped; GIF creation skipped.")
+    elif args.save_gif:
+        output = Path(f"game_of_life_{name}.gif")
+        animate_life(history, output)
+        print(f"Saved {label} GIF to {output}")
+    elif store is None:
+        print(f"[{tag}] GIF creation skipped; history not saved.")
+    if store is not None:
+        store.close()
+        print(f"[{tag}] History saved to {store.path}")
+
+
+def run_life_numpy():
+    """
+    Command‐line entry for NumPy-based Game of Life.
+
+    Parses --size, --timesteps, --save-gif, --history-file, --boundary and
+    --stop-on-cycle; runs simulation and optionally saves GIF. Above size 100
+    (or with --history-file) history is recorded to a disk-backed
+    HistoryStore instead of RAM.
+    """
+    p = _life_parser("Game of Life (NumPy)", boundary=True, stop_on_cycle=True)
+    args, record, store, checkpointer, detector = _start_run(p, "NumPy", "cpu")
+    history = simulate_life_numpy(args.size, args.timesteps, record_history=record, boundary=args.boundary,
+                                  detector=detector, store=store, seed=args.seed,
+                                  checkpointer=checkpointer)
+    _finish_run(args, "NumPy", "CPU", "cpu", history, store, checkpointer, detector)
 
 
 def run_life_cupy():
     """
     Command‐line entry for CuPy-based Game of Life.
 
-    Same arguments as run_life_numpy, but runs on GPU.
+    Same arguments as run_life_numpy except --boundary, but runs on GPU.
     """
-    p = argparse.ArgumentParser("Game of Life (CuPy)")
-    p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
-    p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
-    p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
-    args = p.parse_args()
-
-    print(f"[CuPy] Args received: {args}")
-    record = args.save_gif and args.size <= 100
-    history = simulate_life_cupy(args.size, args.timesteps, record_history=record)
-
-    if args.save_gif:
-        if record:
-            output = Path("game_of_life_gpu.gif")
-            animate_life(history, output)
-            print(f"Saved GPU GIF to {output}")
-        else:
-            print("[CuPy] Problem size > 100: cannot save history or create GIF.")
-    else:
-        print("[CuPy] GIF creation skipped; history not saved.")
+    p = _life_parser("Game of Life (CuPy)", stop_on_cycle=True)
+    args, record, store, checkpointer, detector = _start_run(p, "CuPy", "gpu")
+    history = simulate_life_cupy(args.size, args.timesteps, record_history=record, detector=detector,
+                                 store=store, seed=args.seed, checkpointer=checkpointer)
+    _finish_run(args, "CuPy", "GPU", "gpu", history, store, checkpointer, detector)
 
 
 def run_life_naive():
@@ -284,22 +957,23 @@ def run_life_naive():
 
     Same CLI interface, uses the nested-loop implementation.
     """
-    p = argparse.ArgumentParser("Game of Life (Naive)")
-    p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
-    p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
-    p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
-    args = p.parse_args()
+    p = _life_parser("Game of Life (Naive)", boundary=True, stop_on_cycle=True)
+    args, record, store, checkpointer, detector = _start_run(p, "Naive", "naive")
+    history = simulate_life_naive(args.size, args.timesteps, record_history=record, boundary=args.boundary,
+                                  detector=detector, store=store, seed=args.seed,
+                                  checkpointer=checkpointer)
+    _finish_run(args, "Naive", "Naive", "naive", history, store, checkpointer, detector)
 
-    print(f"[Naive] Args received: {args}")
-    record = args.save_gif and args.size <= 100
-    history = simulate_life_naive(args.size, args.timesteps, record_history=record)
-
-    if args.save_gif:
-        if record:
-            output = Path("game_of_life_naive.gif")
-            animate_life(history, output)
-            print(f"Saved Naive GIF to {output}")
-        else:
-            print("[Naive] Problem size > 100: cannot save history or create GIF.")
-    else:
-        print("[Naive] GIF creation skipped; history not saved.")
+
+def run_life_bitpacked():
+    """
+    Command‐line entry for the bit-packed NumPy Game of Life.
+
+    Same CLI interface plus --stop-on-cycle, uses the bit-packed
+    implementation.
+    """
+    p = _life_parser("Game of Life (Bit-packed)", stop_on_cycle=True)
+    args, record, store, checkpointer, detector = _start_run(p, "Bit-packed", "bitpacked")
+    history = simulate_life_bitpacked(args.size, args.timesteps, record_history=record, detector=detector,
+                                      store=store, seed=args.seed, checkpointer=checkpointer)
+    _finish_run(args, "Bit-packed", "Bit-packed", "bitpacked", history, store, checkpointer, detector)
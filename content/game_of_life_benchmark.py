@@ -0,0 +1,421 @@
+"""
+In-Process Benchmark Harness for the Game of Life and Diffusion Backends
+
+game_of_life_experiment.py times whole `poetry run <entry_point>`
+subprocesses, so for small grids its numbers are dominated by interpreter
+start-up and imports (CuPy, matplotlib) rather than by the simulation. This
+harness calls the backends in-process instead and times each phase of a run
+separately:
+
+  - import:  importing the backend module, measured in a fresh interpreter
+             (the only phase that needs one);
+  - init:    drawing the initial board and allocating the work buffers;
+  - warm-up: steps run before the timed ones, absorbing JIT compilation,
+             CUDA context creation and cache warming;
+  - step:    the timed generations (GPU work synchronised before stopping
+             the clock), reported in total and per step;
+  - output:  copying the final board to the host and saving it with np.save.
+
+Grid sizes, timesteps, repeats, warm-up steps and the methods to run are
+read from a TOML (or JSON) config file; game_of_life_benchmark.toml next to
+this module is the default. Results are written per timesteps value to
+
+  ../output/<prefix>_<gpu>_<cpu>_inprocess_<backends>_ts<T>.csv
+  ../output/<prefix>_<gpu>_<cpu>_inprocess_<backends>_ts<T>.json
+
+where <prefix> is the config's output_prefix (gol_timings by default). The
+CSV keeps the gol_timings columns read by game_of_life_create_plots.py,
+with mean_time_sec = init + step + output (everything except imports and
+warm-up), followed by the per-phase columns. The JSON holds the config, the
+environment and every individual timing.
+
+The temperature diffusion backends (explicit NumPy and CuPy, ocean-only
+sparse and implicit) are driven through their iter_diffusion* generators on
+a synthetic (DIFFUSION_DEPTH, N, N) field for grid size N, with the
+operator or solver built in the init phase. They are selected by
+temperature_diffusion_benchmark.toml, whose results use the
+diffusion_timings prefix:
+
+  poetry run game_of_life_benchmark --config content/temperature_diffusion_benchmark.toml
+
+Entry points:
+- run_benchmark(): command-line entry.
+- benchmark_method(): time one backend at one grid size.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import csv
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tomllib
+from pathlib import Path
+import numpy as np
+
+from content.game_of_life_init import random_board
+from content.temperature_diffusion_synthetic import synthetic_field
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output directory for CSV and JSON results
+out_dir = "../output"
+
+# Repository root, put on PYTHONPATH for the import-timing interpreters
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Default config file
+DEFAULT_CONFIG_FILE = Path(__file__).with_suffix(".toml")
+
+# Settings used when the config file omits them
+DEFAULT_CONFIG = {
+    "grid_sizes": [50, 100, 250, 500, 1000],
+    "timesteps": [100],
+    "repeats": 3,
+    "warmup": 3,
+    "p_alive": 0.2,
+    "seed": 0,
+    "methods": {"NumPy (CPU, in-process)": "numpy"},
+    "max_size": {},
+    "output_prefix": "gol_timings",
+}
+
+# Synthetic diffusion field for grid size N: (DIFFUSION_DEPTH, N, N) with
+# this land fraction (the model data has 50 depth levels)
+DIFFUSION_DEPTH = 50
+DIFFUSION_LAND_FRACTION = 0.3
+
+# Diffusion coefficient of the diffusion backends
+DIFFUSION_COEFF = 0.1
+
+# Timestep of the implicit backend, in explicit steps
+IMPLICIT_DT = 10.0
+
+
+def get_gpu_name():
+    """
+    Query the system GPU name via nvidia-smi.
+
+    Returns:
+        The first GPU’s name, or 'Unknown_GPU' if the command fails.
+    """
+    try:
+        out = subprocess.check_output(
+            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
+            stderr=subprocess.DEVNULL
+        ).decode().strip().splitlines()
+        return out[0]
+    except Exception:
+        return "Unknown_GPU"
+
+
+def get_cpu_name():
+    """
+    Query the CPU model name via lscpu (Linux).
+
+    Returns:
+        The CPU model string, or 'Unknown_CPU' if detection fails.
+    """
+    try:
+        out = subprocess.check_output(["lscpu"], stderr=subprocess.DEVNULL).decode().splitlines()
+        for line in out:
+            if line.startswith("Model name:"):
+                return line.split(":", 1)[1].strip()
+    except Exception:
+        pass
+    return "Unknown_CPU"
+
+
+# -------------------------------------------------------------------
+# Backends
+# -------------------------------------------------------------------
+
+class Backend:
+    """
+    How to drive one Game of Life engine a step at a time.
+
+    The callables take the imported backend module m: init(m, N, p_alive,
+    seed) returns the engine state, step(m, state) advances it one
+    generation and returns it, result(m, state) returns the board as a host
+    uint8 array, and sync(m) waits for outstanding device work.
+    """
+
+    def __init__(self, module: str, init, step, result, sync=None):
+        self.module = module
+        self.init = init
+        self.step = step
+        self.result = result
+        self.sync = sync or (lambda m: None)
+
+
+def _numpy_init(m, N, p_alive, seed):
+    grid = m.HaloGrid(random_board((N, N), p_alive, seed))
+    return [grid, m.HaloGrid(grid.interior),
+            np.empty((N, N), dtype=np.uint8), np.empty((N + 2, N), dtype=np.uint8)]
+
+
+def _numpy_step(m, state):
+    m.life_step_halo_into(*state)
+    state[0], state[1] = state[1], state[0]
+    return state
+
+
+def _cupy_init(m, N, p_alive, seed):
+    grid = m.cp.asarray(random_board((N, N), p_alive, seed))
+    return [grid, m.cp.empty_like(grid), m.cp.empty_like(grid), m.cp.empty((2, N, N), dtype=m.cp.uint8)]
+
+
+def _cupy_step(m, state):
+    m.life_step_gpu_into(*state)
+    state[0], state[1] = state[1], state[0]
+    return state
+
+
+def _numba_init(m, N, p_alive, seed):
+    grid = random_board((N, N), p_alive, seed)
+    return [grid, np.empty_like(grid)]
+
+
+def _numba_step(m, state):
+    m.life_step_numba(*state)
+    state[0], state[1] = state[1], state[0]
+    return state
+
+
+def _diffusion_field(N, seed):
+    return synthetic_field((DIFFUSION_DEPTH, N, N), DIFFUSION_LAND_FRACTION, seed or 0)
+
+
+def _explicit_init(m, N, p_alive, seed, xp=np):
+    field = xp.asarray(_diffusion_field(N, seed))
+    operator = m.DiffusionOperator(~xp.isnan(field), DIFFUSION_COEFF, xp, field.dtype)
+    return [m.iter_diffusion(field, sys.maxsize, DIFFUSION_COEFF, xp, operator=operator), field]
+
+
+def _sparse_init(m, N, p_alive, seed):
+    field = _diffusion_field(N, seed)
+    operator = m.SparseDiffusionOperator(~np.isnan(field), DIFFUSION_COEFF, field.dtype)
+    return [m.iter_diffusion_sparse(field, sys.maxsize, DIFFUSION_COEFF, operator=operator), field]
+
+
+def _implicit_init(m, N, p_alive, seed):
+    field = _diffusion_field(N, seed)
+    solver = m.ImplicitDiffusion(field, DIFFUSION_COEFF, IMPLICIT_DT)
+    return [m.iter_diffusion_implicit(field, sys.maxsize, DIFFUSION_COEFF, IMPLICIT_DT, solver=solver),
+            field]
+
+
+def _diffusion_step(m, state):
+    # The generators yield a reused buffer, which result() reads
+    state[1] = next(state[0])
+    return state
+
+
+# Game of Life backends step a board of N × N cells from p_alive and seed;
+# the diffusion_* backends ignore p_alive and step _diffusion_field(N, seed)
+BACKENDS = {
+    "numpy": Backend("content.game_of_life", _numpy_init, _numpy_step,
+                     lambda m, s: s[0].to_array()),
+    "cupy": Backend("content.game_of_life", _cupy_init, _cupy_step,
+                    lambda m, s: m.cp.asnumpy(s[0]),
+                    sync=lambda m: m.cp.cuda.Stream.null.synchronize()),
+    "naive": Backend("content.game_of_life",
+                     lambda m, N, p, seed: random_board((N, N), p, seed),
+                     lambda m, grid: m.life_step_naive(grid),
+                     lambda m, grid: grid),
+    "bitpacked": Backend("content.game_of_life",
+                         lambda m, N, p, seed: (random_board((N, N), p, seed, packed=True), N),
+                         lambda m, s: (m.life_step_bitpacked(s[0], s[1]), s[1]),
+                         lambda m, s: m.unpack_grid(s[0], s[1])),
+    "numba": Backend("content.game_of_life_numba", _numba_init, _numba_step,
+                     lambda m, s: s[0]),
+    "diffusion_numpy": Backend("content.temperature_diffusion", _explicit_init, _diffusion_step,
+                               lambda m, s: s[1]),
+    "diffusion_cupy": Backend("content.temperature_diffusion",
+                              lambda m, N, p, seed: _explicit_init(m, N, p, seed, m.cp),
+                              _diffusion_step, lambda m, s: m.cp.asnumpy(s[1]),
+                              sync=lambda m: m.cp.cuda.Stream.null.synchronize()),
+    "diffusion_sparse": Backend("content.temperature_diffusion_sparse", _sparse_init, _diffusion_step,
+                                lambda m, s: s[1]),
+    "diffusion_implicit": Backend("content.temperature_diffusion", _implicit_init, _diffusion_step,
+                                  lambda m, s: s[1]),
+}
+
+
+# -------------------------------------------------------------------
+# Timing
+# -------------------------------------------------------------------
+
+def load_config(path) -> dict:
+    """
+    Read a benchmark config file, filling in DEFAULT_CONFIG for missing keys.
+
+    Args:
+        path (str or Path): .toml or .json file.
+
+    Returns:
+        dict: The config.
+
+    Raises:
+        ValueError: If a method names an unknown backend.
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        config = json.load(f) if path.suffix == ".json" else tomllib.load(f)
+    config = {**DEFAULT_CONFIG, **config}
+    unknown = set(config["methods"].values()) - set(BACKENDS)
+    if unknown:
+        raise ValueError(f"Unknown backend(s) {sorted(unknown)} in {path}; "
+                         f"choose from {sorted(BACKENDS)}")
+    return config
+
+
+def time_import(module: str, repeats: int) -> list:
+    """
+    Time importing a module in fresh interpreters.
+
+    Args:
+        module (str): Dotted module name.
+        repeats (int): Number of interpreters to start.
+
+    Returns:
+        list[float]: Import time of each repeat in seconds.
+    """
+    code = f"import time; t0 = time.perf_counter(); import {module}; print(time.perf_counter() - t0)"
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT_DIR),
+                                                                     os.environ.get("PYTHONPATH")]))}
+    return [float(subprocess.check_output([sys.executable, "-c", code], env=env).decode().split()[-1])
+            for _ in range(repeats)]
+
+
+def benchmark_method(backend: Backend, N: int, timesteps: int, repeats: int = 3, warmup: int = 3,
+                     p_alive: float = 0.2, seed: int = None) -> list:
+    """
+    Time the init, warm-up, step and output phases of one backend in-process.
+
+    Args:
+        backend (Backend): Engine to run (its module is imported first).
+        N (int): Grid dimension (N × N).
+        timesteps (int): Timed generations per repeat.
+        repeats (int): Number of runs.
+        warmup (int): Generations stepped before the timed ones.
+        p_alive (float): Probability that a cell starts alive.
+        seed (int, optional): Seed for random_board; the same board is used
+            for every repeat.
+
+    Returns:
+        list[dict]: Per-repeat init_sec, warmup_sec, step_sec and output_sec.
+    """
+    m = importlib.import_module(backend.module)
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        out_path = Path(tmp) / "final.npy"
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            state = backend.init(m, N, p_alive, seed)
+            backend.sync(m)
+            t1 = time.perf_counter()
+            for _ in range(warmup):
+                state = backend.step(m, state)
+            backend.sync(m)
+            t2 = time.perf_counter()
+            for _ in range(timesteps):
+                state = backend.step(m, state)
+            backend.sync(m)
+            t3 = time.perf_counter()
+            np.save(out_path, backend.result(m, state))
+            t4 = time.perf_counter()
+            runs.append({"init_sec": t1 - t0, "warmup_sec": t2 - t1,
+                         "step_sec": t3 - t2, "output_sec": t4 - t3})
+    return runs
+
+
+def run_benchmark():
+    """
+    Command-line entry for the in-process benchmark.
+
+    Reads the config file, times every configured method at every grid size
+    and timesteps value, and writes one CSV and one JSON per timesteps value
+    to ../output.
+    """
+    p = argparse.ArgumentParser("Game of Life in-process benchmark")
+    p.add_argument("--config", type=Path, default=DEFAULT_CONFIG_FILE,
+                   help="TOML or JSON file with grid_sizes, timesteps, repeats, warmup and methods")
+    args = p.parse_args()
+
+    config = load_config(args.config)
+    print(f"[Benchmark] Config {args.config}: {config}")
+    gpu_name = get_gpu_name().replace(" ", "_")
+    cpu_name = get_cpu_name().replace(" ", "_")
+    repeats, warmup = config["repeats"], config["warmup"]
+    method_ids = "_".join(sorted(set(config["methods"].values())))
+
+    imports = {}
+    for name in sorted(set(config["methods"].values())):
+        imports[name] = time_import(BACKENDS[name].module, repeats)
+        print(f"  import {name:<10} {np.mean(imports[name]):.3f} s")
+
+    os.makedirs(out_dir, exist_ok=True)
+    for timesteps in config["timesteps"]:
+        stem = os.path.join(out_dir, f"{config['output_prefix']}_{gpu_name}_{cpu_name}_inprocess_"
+                                     f"{method_ids}_ts{timesteps}")
+        results = []
+        with open(stem + ".csv", "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow([
+                "gpu", "cpu", "method",
+                "grid_size", "timesteps",
+                "mean_time_sec", "std_dev_sec",
+                "repeats", "warmup", "import_sec", "init_sec", "warmup_sec",
+                "step_sec", "step_std_sec", "per_step_sec", "output_sec"
+            ])
+
+            print(f"\n==== Running in-process benchmarks for {timesteps} timesteps ====")
+            for size in config["grid_sizes"]:
+                for method_name, name in config["methods"].items():
+                    if size > config["max_size"].get(name, size):
+                        continue
+                    runs = benchmark_method(BACKENDS[name], size, timesteps, repeats, warmup,
+                                            config["p_alive"], config["seed"])
+                    phase = {key: np.array([run[key] for run in runs]) for key in runs[0]}
+                    total = phase["init_sec"] + phase["step_sec"] + phase["output_sec"]
+                    writer.writerow([
+                        gpu_name, cpu_name,
+                        method_name,
+                        size, timesteps,
+                        f"{total.mean():.6f}", f"{total.std():.6f}",
+                        repeats, warmup,
+                        f"{np.mean(imports[name]):.6f}",
+                        f"{phase['init_sec'].mean():.6f}",
+                        f"{phase['warmup_sec'].mean():.6f}",
+                        f"{phase['step_sec'].mean():.6f}",
+                        f"{phase['step_sec'].std():.6f}",
+                        f"{phase['step_sec'].mean() / timesteps:.3e}",
+                        f"{phase['output_sec'].mean():.6f}"
+                    ])
+                    results.append({"method": method_name, "backend": name, "grid_size": size,
+                                    "timesteps": timesteps, "import_sec": imports[name], "runs": runs})
+                    print(f"  {method_name:<28} | {size:6}×{size:<6} | init {phase['init_sec'].mean():.4f} s"
+                          f" | step {phase['step_sec'].mean() / timesteps * 1e3:9.4f} ms"
+                          f" | output {phase['output_sec'].mean():.4f} s")
+
+        with open(stem + ".json", "w") as f:
+            json.dump({
+                "gpu": gpu_name, "cpu": cpu_name,
+                "python": sys.version, "numpy": np.__version__,
+                "config": config, "results": results,
+            }, f, indent=2)
+        print(f"Saved CSV: {stem}.csv")
+        print(f"Saved JSON: {stem}.json")
+
+
+if __name__ == "__main__":
+    run_benchmark()
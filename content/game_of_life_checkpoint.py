@@ -0,0 +1,308 @@
+"""
+Checkpoint/Restart for Long Game of Life Runs
+
+A run killed at its wall-time limit loses everything held in memory. A
+Checkpointer periodically saves everything needed to continue the run:
+
+  - the board, bit-packed (1 bit per cell, the byte layout of pack_grid,
+    so the bit-packed engine saves and restores its words directly);
+  - the generation counter and the boundary mode;
+  - the seed entropy the initial board was drawn from (the simulations
+    draw no random numbers after initialisation, so this is the whole RNG
+    state, and identifies the run);
+  - any named accumulators (e.g. the alive counts of game_of_life_mem_opt).
+
+Each checkpoint is a compressed .npz (deflate level 1) written to a
+temporary file, flushed to disk and then atomically renamed over the
+previous one, so the checkpoint file is always complete even if the job is
+killed mid-write.
+
+The hot loop only takes a snapshot (packing the board and copying the
+accumulators); compression and writing happen in a background thread. If a
+write is still in progress when the next checkpoint is due, the loop waits
+for it. report() gives the time the loop spent on snapshots and waiting,
+and the background write time.
+
+Entry points:
+- Checkpointer: periodic background checkpointing and resume.
+- load_checkpoint(): read a checkpoint file.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import os
+import queue
+import threading
+import time
+import zipfile
+from pathlib import Path
+import numpy as np
+
+from content.game_of_life_init import random_board
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Default number of generations between checkpoints
+DEFAULT_EVERY = 100
+
+# Deflate level: bit-packed boards barely compress further, so the fastest
+# level gives almost the same size as np.savez_compressed in a fraction of
+# the time
+COMPRESS_LEVEL = 1
+
+# Prefix of accumulator arrays in the .npz
+_ACC_PREFIX = "acc_"
+
+# Queue sentinel marking the end of the run
+_STOP = None
+
+
+def load_checkpoint(path) -> dict:
+    """
+    Read a checkpoint file.
+
+    Args:
+        path (str or Path): Checkpoint .npz path.
+
+    Returns:
+        dict: generation (int), shape (tuple), boundary (str), packed (2D
+        uint8, little bit order), seed (int or None) and accumulators
+        (dict of arrays).
+    """
+    with np.load(Path(path)) as data:
+        seed = str(data["seed"])
+        return {
+            "generation": int(data["generation"]),
+            "shape": tuple(int(n) for n in data["shape"]),
+            "boundary": str(data["boundary"]),
+            "packed": data["packed"],
+            "seed": int(seed) if seed else None,
+            "accumulators": {key[len(_ACC_PREFIX):]: data[key]
+                             for key in data.files if key.startswith(_ACC_PREFIX)},
+        }
+
+
+class Checkpointer:
+    """
+    Periodic, atomic, background checkpointing of a Game of Life run.
+
+    Usage:
+        with Checkpointer("run.npz", every=1000, resume=True) as ckpt:
+            start, grid = ckpt.initial_board((N, N), p_alive, seed)
+            for t in range(start, timesteps):
+                grid = step(grid)
+                ckpt.update(t + 1, grid)
+        print(ckpt.report())
+
+    Attributes:
+        path (Path): Checkpoint .npz path.
+        every (int): Generations between checkpoints.
+        resume (bool): Whether initial_board restores an existing checkpoint.
+        shape (tuple[int, int]): Board shape, set by initial_board.
+        boundary (str): Boundary mode of the run, set by initial_board.
+        start (int): Generation the run started (or resumed) from.
+        seed (int or None): Entropy the initial board was drawn from.
+        accumulators (dict[str, np.ndarray]): Accumulators restored by
+            initial_board (empty for a fresh run).
+        saves (int): Number of checkpoints written.
+    """
+
+    def __init__(self, path, every: int = DEFAULT_EVERY, resume: bool = False):
+        """
+        Start the background writer thread.
+
+        Args:
+            path (str or Path): Checkpoint .npz path.
+            every (int): Generations between checkpoints.
+            resume (bool): If True and path exists, initial_board continues
+                from it instead of drawing a new board.
+        """
+        self.path = Path(path)
+        self.every = every
+        self.resume = resume
+        self.shape = None
+        self.boundary = None
+        self.start = 0
+        self.seed = None
+        self.accumulators = {}
+        self.saves = 0
+        self.nbytes = 0
+        self.snapshot_sec = 0.0
+        self.blocked_sec = 0.0
+        self.write_sec = 0.0
+        self._t0 = time.perf_counter()
+        self._elapsed = None
+        self._error = None
+        self._queue = queue.Queue(maxsize=1)
+        self._thread = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+        self._thread.start()
+
+    def initial_board(self, shape: tuple, p_alive: float = 0.2, seed=None,
+                      packed: bool = False, boundary: str = "torus") -> tuple:
+        """
+        Restore the board from the checkpoint, or draw a new one.
+
+        Args:
+            shape (tuple[int, int]): Board shape (N, M).
+            p_alive (float): Probability that a cell starts alive.
+            seed (int, optional): Seed for random_board (fresh entropy if
+                None); ignored when resuming.
+            packed (bool): If True, return pack_grid words instead of a
+                uint8 grid.
+            boundary (str): Boundary mode of the run, saved with every
+                checkpoint.
+
+        Returns:
+            tuple[int, np.ndarray]: Starting generation and board.
+
+        Raises:
+            ValueError: If the checkpoint is for a different board shape or
+                boundary mode.
+        """
+        self._t0 = time.perf_counter()
+        self.shape = tuple(shape)
+        self.boundary = boundary
+        if self.resume and self.path.exists():
+            state = load_checkpoint(self.path)
+            if state["shape"] != self.shape:
+                raise ValueError(f"Checkpoint {self.path} is for a {state['shape']} board, "
+                                 f"not {self.shape}")
+            if state["boundary"] != boundary:
+                raise ValueError(f"Checkpoint {self.path} is for a '{state['boundary']}' boundary, "
+                                 f"not '{boundary}'")
+            self.start, self.seed = state["generation"], state["seed"]
+            self.accumulators = state["accumulators"]
+            board = state["packed"]
+            if packed:
+                words = np.zeros((shape[0], -(-shape[1] // 64) * 8), dtype=np.uint8)
+                words[:, :board.shape[1]] = board
+                return self.start, words.view("<u8")
+            return self.start, np.unpackbits(board, axis=-1, count=shape[1], bitorder="little")
+        seq = np.random.SeedSequence(seed)
+        self.seed = seq.entropy
+        return 0, random_board(shape, p_alive, seq, packed=packed)
+
+    def update(self, generation: int, grid=None, packed: np.ndarray = None, **accumulators):
+        """
+        Checkpoint the run if one is due at this generation.
+
+        Pass either grid or packed; initial_board must have been called
+        first. Nothing is saved at the starting generation, which is
+        already on disk when resuming.
+
+        Args:
+            generation (int): Generation of the board (steps taken so far).
+            grid (array, optional): 2D grid of 0s and 1s (NumPy or CuPy).
+            packed (np.ndarray, optional): pack_grid words.
+            **accumulators (np.ndarray): Arrays to save with the board.
+        """
+        if generation % self.every == 0 and generation != self.start:
+            self.save(generation, grid, packed, **accumulators)
+
+    def save(self, generation: int, grid=None, packed: np.ndarray = None, **accumulators):
+        """
+        Snapshot the run and queue it for writing.
+
+        Blocks while the previous checkpoint is still being written.
+
+        Args:
+            generation (int): Generation of the board (steps taken so far).
+            grid (array, optional): 2D grid of 0s and 1s (NumPy or CuPy).
+            packed (np.ndarray, optional): pack_grid words.
+            **accumulators (np.ndarray): Arrays to save with the board.
+
+        Raises:
+            RuntimeError: If a previous background write failed.
+        """
+        if self._error is not None:
+            raise RuntimeError(f"Checkpoint write to {self.path} failed: {self._error}") from self._error
+        t0 = time.perf_counter()
+        if packed is not None:
+            # pack_grid words are little-endian bits: keep the used bytes
+            bits = packed.view(np.uint8)[:, :-(-self.shape[1] // 8)].copy()
+        else:
+            if hasattr(grid, "get"):
+                # CuPy: copy the board to the host
+                grid = grid.get()
+            bits = np.packbits(grid, axis=-1, bitorder="little")
+        snapshot = {
+            "generation": generation,
+            "shape": self.shape,
+            "boundary": self.boundary,
+            "packed": bits,
+            "seed": "" if self.seed is None else str(self.seed),
+        }
+        for name, value in accumulators.items():
+            snapshot[_ACC_PREFIX + name] = np.array(value.get() if hasattr(value, "get") else value)
+        t1 = time.perf_counter()
+        self.snapshot_sec += t1 - t0
+        self._queue.put(snapshot)
+        self.blocked_sec += time.perf_counter() - t1
+
+    def _run(self):
+        """Writer thread: write queued snapshots until the sentinel."""
+        while True:
+            snapshot = self._queue.get()
+            if snapshot is _STOP:
+                break
+            if self._error is not None:
+                continue
+            try:
+                t0 = time.perf_counter()
+                self._write(snapshot)
+                self.write_sec += time.perf_counter() - t0
+                self.saves += 1
+            except Exception as exc:
+                self._error = exc
+
+    def _write(self, snapshot: dict):
+        """Write one snapshot atomically (temporary file, fsync, rename)."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "wb") as f:
+            # Same layout as np.savez_compressed, at COMPRESS_LEVEL
+            with zipfile.ZipFile(f, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESS_LEVEL) as npz:
+                for name, value in snapshot.items():
+                    with npz.open(name + ".npy", "w", force_zip64=True) as member:
+                        np.lib.format.write_array(member, np.asarray(value))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        self.nbytes = self.path.stat().st_size
+
+    def close(self):
+        """
+        Wait for the last checkpoint to be written.
+
+        Raises:
+            RuntimeError: If a background write failed.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._elapsed = time.perf_counter() - self._t0
+        if self._error is not None:
+            raise RuntimeError(f"Checkpoint write to {self.path} failed: {self._error}") from self._error
+
+    def report(self) -> str:
+        """
+        Summarise the checkpointing overhead.
+
+        Returns:
+            str: Human-readable summary.
+        """
+        elapsed = self._elapsed if self._elapsed is not None else time.perf_counter() - self._t0
+        overhead = self.snapshot_sec + self.blocked_sec
+        resumed = f"resumed at generation {self.start}, " if self.start else ""
+        return (f"{resumed}{self.saves} checkpoints to {self.path} ({self.nbytes / 1e6:.2f} MB each): "
+                f"run blocked {overhead:.3f} s ({100 * overhead / max(elapsed, 1e-9):.2f}% of "
+                f"{elapsed:.2f} s; snapshots {self.snapshot_sec:.3f} s, waiting "
+                f"{self.blocked_sec:.3f} s); background writes {self.write_sec:.3f} s")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
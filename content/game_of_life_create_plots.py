@@ -35,6 +35,9 @@ marker_map = {
     'naive': 's',
     'numpy': 'o',
     'cupy': '^',
+    'bitpacked': 'D',
+    'numba': 'v',
+    'mpi': 'P',
 }
 
 # ─────────────────────────────────────────────────────────────────────────────
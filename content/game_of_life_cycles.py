@@ -0,0 +1,132 @@
+"""
+Cycle and Steady-State Detection for the Game of Life
+
+Most random boards die out, freeze into still lifes, or settle into
+oscillators within a few thousand generations, after which further steps
+add nothing. CycleDetector recognises this as the simulation runs:
+
+  1. Each generation is bit-packed and hashed (8-byte BLAKE2b digest).
+  2. The hash is looked up in a bounded table of the most recent
+     generations (default 128), holding each generation's packed bits.
+  3. A hash hit is confirmed by comparing the packed bits, so a hash
+     collision can never end a run early.
+
+A repeat of the generation p steps back means the board is periodic with
+period p from then on (p = 1 for still lifes and empty boards).
+
+The simulate functions accept a detector and stop as soon as it fires:
+
+    detector = CycleDetector()
+    history = simulate_life_numpy(N, T, record_history=True, detector=detector)
+    print(detector.report())
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import hashlib
+from collections import deque
+import numpy as np
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Default number of recent generations kept (longest detectable period)
+DEFAULT_MAX_PERIOD = 128
+
+
+class CycleDetector:
+    """
+    Detect extinction, still lifes and period-k oscillation of a board.
+
+    Attributes:
+        max_period (int): Number of recent generations kept, i.e. the
+            longest period that can be detected.
+        generation (int): Number of generations seen so far.
+        kind (str or None): "extinct", "still" or "periodic" once a repeat
+            has been found, else None.
+        period (int or None): Detected period in generations.
+        step (int or None): Generation at which the repeat was detected;
+            it equals generation step - period.
+    """
+
+    def __init__(self, max_period: int = DEFAULT_MAX_PERIOD):
+        """
+        Create an empty detector.
+
+        Args:
+            max_period (int): Longest period to detect (table size).
+        """
+        self.max_period = max_period
+        self.generation = 0
+        self.kind = None
+        self.period = None
+        self.step = None
+        self._table = {}
+        self._order = deque()
+
+    def update(self, grid: np.ndarray) -> bool:
+        """
+        Record the next generation of a dense board.
+
+        Args:
+            grid (np.ndarray): 2D array of 0s and 1s.
+
+        Returns:
+            bool: True if this generation repeats one in the table.
+        """
+        return self.update_packed(np.packbits(grid.astype(bool, copy=False)))
+
+    def update_packed(self, packed: np.ndarray) -> bool:
+        """
+        Record the next generation given in bit-packed form.
+
+        Any fixed packing works (np.packbits, or pack_grid words), as long as
+        every generation of a run uses the same one.
+
+        Args:
+            packed (np.ndarray): Packed bits of the generation.
+
+        Returns:
+            bool: True if this generation repeats one in the table.
+        """
+        packed = np.ascontiguousarray(packed)
+        key = hashlib.blake2b(packed, digest_size=8).digest()
+        seen = self._table.get(key)
+        if seen is not None and np.array_equal(seen[1], packed):
+            self.period = self.generation - seen[0]
+            self.step = self.generation
+            if not packed.any():
+                self.kind = "extinct"
+            else:
+                self.kind = "still" if self.period == 1 else "periodic"
+            self.generation += 1
+            return True
+
+        # On a hash collision the newer generation replaces the older one
+        self._table[key] = (self.generation, packed.copy())
+        self._order.append((key, self.generation))
+        if len(self._order) > self.max_period:
+            old_key, old_gen = self._order.popleft()
+            if self._table.get(old_key, (None,))[0] == old_gen:
+                del self._table[old_key]
+        self.generation += 1
+        return False
+
+    def report(self) -> str:
+        """
+        Describe the detection result.
+
+        Returns:
+            str: Human-readable summary.
+        """
+        if self.kind is None:
+            return (f"No cycle of period ≤ {self.max_period} found "
+                    f"in {self.generation} generations")
+        if self.kind == "extinct":
+            return f"Board died out by generation {self.step - 1}"
+        if self.kind == "still":
+            return f"Still life reached at generation {self.step - 1}"
+        return (f"Period-{self.period} cycle from generation {self.step - self.period}, "
+                f"detected at generation {self.step}")
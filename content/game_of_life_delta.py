@@ -0,0 +1,269 @@
+"""
+Delta-Compressed Game of Life History
+
+Successive generations differ in only a small fraction of cells, so storing
+a full copy of every generation is mostly redundant. DeltaHistory stores:
+  - a keyframe (the bit-packed board) every keyframe_interval generations;
+  - for every other generation, the XOR of its packed bits with the previous
+    generation, run-length encoded: the lengths of the runs of unchanged
+    bytes (as gaps between changed bytes, in the narrowest unsigned dtype
+    that holds them) plus the changed byte values. When more than about half
+    of the bytes change the plain XOR is stored instead.
+
+Reading generation t unpacks the nearest keyframe at or before t and applies
+at most keyframe_interval - 1 deltas; reading forward from the last frame
+decoded applies a single delta, so replaying the run in order costs one
+sparse update per generation.
+
+DeltaHistory behaves like a read-only list of 2D uint8 grids, and has the
+same append/append_packed methods as HistoryStore, so it can be passed as
+the store of the simulate functions and straight to animate_life.
+
+Entry points:
+- DeltaHistory: the codec.
+- run_delta_benchmark(): compression ratio and decode throughput versus
+  np.save of uint8 and of bit-packed frames, written to a CSV in ../output.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import csv
+import os
+import tempfile
+import time
+import numpy as np
+
+from content.game_of_life import pack_grid, life_step_bitpacked
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output directory for the benchmark CSV
+out_dir = "../output"
+
+# Default number of generations between keyframes
+DEFAULT_KEYFRAME_INTERVAL = 32
+
+# Frame kinds
+KEYFRAME, RLE_DELTA, DENSE_DELTA = 0, 1, 2
+
+# Gap dtypes, narrowest first
+GAP_DTYPES = (np.uint8, np.uint16, np.uint32, np.uint64)
+
+
+class DeltaHistory:
+    """
+    Keyframe + XOR-delta compressed sequence of Game of Life generations.
+
+    Attributes:
+        shape (tuple[int, int]): Board shape (N, M).
+        keyframe_interval (int): Generations between keyframes.
+    """
+
+    def __init__(self, shape: tuple, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Create an empty history.
+
+        Args:
+            shape (tuple[int, int]): Board shape (N, M).
+            keyframe_interval (int): Generations between keyframes.
+        """
+        self.shape = tuple(shape)
+        self.keyframe_interval = keyframe_interval
+        self._row_bytes = -(-self.shape[1] // 8)
+        self._frames = []
+        self._last = None
+        # Last decoded (generation, packed board), for cheap forward reads
+        self._cursor = None
+
+    def append(self, grid: np.ndarray):
+        """
+        Append one generation.
+
+        Args:
+            grid (np.ndarray): 2D array of 0s and 1s with the history's shape.
+
+        Raises:
+            ValueError: If grid does not have the history's shape.
+        """
+        if np.shape(grid) != self.shape:
+            raise ValueError(f"Expected a {self.shape} grid, got {np.shape(grid)}")
+        self._append(np.packbits(np.asarray(grid, dtype=bool), axis=-1, bitorder="little").ravel())
+
+    def append_packed(self, words: np.ndarray):
+        """
+        Append one generation given as pack_grid words.
+
+        Args:
+            words (np.ndarray): (N, ceil(M / 64)) '<u8' array from pack_grid
+                or life_step_bitpacked.
+
+        Raises:
+            ValueError: If words does not have shape (N, ceil(M / 64)).
+        """
+        expected = (self.shape[0], -(-self.shape[1] // 64))
+        if words.shape != expected:
+            raise ValueError(f"Expected {expected} packed words, got {words.shape}")
+        self._append(words.view(np.uint8)[:, :self._row_bytes].ravel())
+
+    def _append(self, packed: np.ndarray):
+        """Encode a flat packed board as a keyframe or a delta."""
+        if len(self._frames) % self.keyframe_interval == 0:
+            frame = (KEYFRAME, packed.copy(), None)
+        else:
+            xor = np.bitwise_xor(packed, self._last)
+            idx = np.flatnonzero(xor)
+            gaps = np.diff(idx, prepend=0)
+            top = int(gaps.max()) if gaps.size else 0
+            gap_dtype = next(dt for dt in GAP_DTYPES if top <= np.iinfo(dt).max)
+            # Run-length form costs a gap plus a value byte per changed byte
+            if idx.size * (np.dtype(gap_dtype).itemsize + 1) < xor.size:
+                frame = (RLE_DELTA, gaps.astype(gap_dtype), xor[idx])
+            else:
+                frame = (DENSE_DELTA, xor, None)
+        self._frames.append(frame)
+        self._last = frame[1] if frame[0] == KEYFRAME else packed.copy()
+
+    @property
+    def nbytes(self) -> int:
+        """int: Bytes used by the encoded frames."""
+        return sum(a.nbytes + (0 if b is None else b.nbytes) for _, a, b in self._frames)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _decode(self, t: int) -> np.ndarray:
+        """Return the flat packed board of generation t (not a copy)."""
+        key = t - t % self.keyframe_interval
+        if self._cursor is not None and key <= self._cursor[0] <= t:
+            start, state = self._cursor
+        else:
+            start, state = key, self._frames[key][1].copy()
+        for kind, a, b in self._frames[start + 1:t + 1]:
+            if kind == RLE_DELTA:
+                state[np.cumsum(a, dtype=np.int64)] ^= b
+            else:
+                np.bitwise_xor(state, a, out=state)
+        self._cursor = (t, state)
+        return state
+
+    def __getitem__(self, index):
+        """
+        Decode one generation (int index) or several (slice).
+
+        Returns:
+            np.ndarray: (N, M) uint8 grid, or (k, N, M) for a slice.
+        """
+        if isinstance(index, slice):
+            return np.stack([self[t] for t in range(*index.indices(len(self)))])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("DeltaHistory index out of range")
+        packed = self._decode(index).reshape(self.shape[0], self._row_bytes)
+        return np.unpackbits(packed, axis=-1, count=self.shape[1], bitorder="little")
+
+    def __iter__(self):
+        for t in range(len(self)):
+            yield self[t]
+
+
+def run_delta_benchmark():
+    """
+    Command-line entry for the delta-history benchmark.
+
+    For each grid size, records --timesteps generations of a random board
+    (stepped with the bit-packed engine) as DeltaHistory, as raw uint8
+    frames written with np.save and as bit-packed frames written with
+    np.save, then reports the encode and decode throughput of each and two
+    compression ratios. Bit-packing alone gives about 8× over uint8, so
+    ratio_vs_packed (against the bit-packed frames, the layout HistoryStore
+    writes) is the gain of the delta coding itself. Results go to a CSV in
+    ../output.
+    """
+    p = argparse.ArgumentParser("Game of Life delta-history benchmark")
+    p.add_argument("--sizes",     type=int, nargs="+", default=[1000, 10000],
+                   help="Grid dimensions (N×N) to benchmark")
+    p.add_argument("--timesteps", type=int, default=64, help="Generations recorded per size")
+    p.add_argument("--warmup",    type=int, default=50, help="Generations run before recording")
+    p.add_argument("--keyframe-interval", type=int, default=DEFAULT_KEYFRAME_INTERVAL,
+                   help="Generations between keyframes")
+    args = p.parse_args()
+
+    os.makedirs(out_dir, exist_ok=True)
+    csv_filename = os.path.join(out_dir, "gol_delta_benchmark.csv")
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "grid_size", "timesteps", "keyframe_interval", "format",
+            "bytes", "compression_ratio", "ratio_vs_packed",
+            "encode_sec", "decode_sec", "decode_gcells_per_sec"
+        ])
+
+        for size in args.sizes:
+            packed = pack_grid(np.random.random((size, size)) < 0.2)
+            for _ in range(args.warmup):
+                packed = life_step_bitpacked(packed, size)
+            frames = []
+            for _ in range(args.timesteps):
+                frames.append(packed)
+                packed = life_step_bitpacked(packed, size)
+            cells = args.timesteps * size * size
+
+            # Raw: one uint8 np.save per generation, as record_history keeps
+            with tempfile.TemporaryFile() as raw:
+                t0 = time.perf_counter()
+                for words in frames:
+                    np.save(raw, np.unpackbits(words.view(np.uint8), axis=-1, count=size,
+                                               bitorder="little"))
+                raw.flush()
+                raw_encode = time.perf_counter() - t0
+                raw_bytes = raw.tell()
+                raw.seek(0)
+                t0 = time.perf_counter()
+                for _ in frames:
+                    np.load(raw)
+                raw_decode = time.perf_counter() - t0
+
+            # Packed: one bit-packed np.save per generation (HistoryStore's
+            # layout), decoded back to uint8 grids like the other formats
+            row_bytes = -(-size // 8)
+            with tempfile.TemporaryFile() as bits:
+                t0 = time.perf_counter()
+                for words in frames:
+                    np.save(bits, words.view(np.uint8)[:, :row_bytes])
+                bits.flush()
+                bits_encode = time.perf_counter() - t0
+                bits_bytes = bits.tell()
+                bits.seek(0)
+                t0 = time.perf_counter()
+                for _ in frames:
+                    np.unpackbits(np.load(bits), axis=-1, count=size, bitorder="little")
+                bits_decode = time.perf_counter() - t0
+
+            history = DeltaHistory((size, size), args.keyframe_interval)
+            t0 = time.perf_counter()
+            for words in frames:
+                history.append_packed(words)
+            delta_encode = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for _ in history:
+                pass
+            delta_decode = time.perf_counter() - t0
+
+            for name, nbytes, enc, dec in (("np.save", raw_bytes, raw_encode, raw_decode),
+                                           ("packed", bits_bytes, bits_encode, bits_decode),
+                                           ("delta", history.nbytes, delta_encode, delta_decode)):
+                writer.writerow([
+                    size, args.timesteps, args.keyframe_interval, name,
+                    nbytes, f"{raw_bytes / nbytes:.2f}", f"{bits_bytes / nbytes:.2f}",
+                    f"{enc:.6f}", f"{dec:.6f}", f"{cells / dec / 1e9:.3f}"
+                ])
+                print(f"  {name:<7} | {size:6}×{size:<6} | {nbytes / 1e6:10.2f} MB | "
+                      f"ratio {raw_bytes / nbytes:7.2f} (vs packed {bits_bytes / nbytes:6.2f}) | "
+                      f"encode {enc:7.3f} s | decode {dec:7.3f} s ({cells / dec / 1e9:.2f} Gcells/s)")
+
+    print(f"Saved CSV: {csv_filename}")
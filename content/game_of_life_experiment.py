@@ -1,11 +1,13 @@
 """
 Benchmarking Game of Life Implementations Across Grid Sizes
 
-This script measures execution time for three versions of Conway’s Game
+This script measures execution time for five versions of Conway’s Game
 of Life:
   - NumPy (CPU vectorized)
   - CuPy (GPU-accelerated)
   - Naive Python (nested loops)
+  - Bit-packed NumPy (64 cells per uint64 word)
+  - Numba (JIT-compiled, parallel over CPU cores)
 
 For each combination of grid size and number of timesteps, it:
   1. Runs each implementation multiple times.
@@ -126,6 +128,8 @@ methods = {
     "NumPy (CPU)": "game_of_life_cpu",
     "CuPy (GPU)":  "game_of_life_gpu",
     "Naive (CPU)": "game_of_life_naive",
+    "Bitpacked (CPU)": "game_of_life_bitpacked",
+    "Numba (CPU)": "game_of_life_numba",
 }
 
 # Build an underscore-joined string of all entry-point names, sorted for consistency
@@ -0,0 +1,146 @@
+"""
+Ghost-Cell (Halo-Padded) Grids for Conway’s Game of Life
+
+This module provides HaloGrid, a container that stores a Game of Life board
+with a one-cell halo (ghost cells) around it. Neighbour access becomes
+zero-copy slicing of the padded array instead of np.roll, which copies the
+whole board for every shift. Only the halo is refreshed between steps,
+according to the selected boundary mode:
+- "torus":   wrap-around copy of the opposite edge (same as np.roll)
+- "dead":    cells outside the board are always dead (zeros)
+- "reflect": the edge cells are mirrored into the halo (np.pad 'symmetric')
+
+HaloGrid can be passed to life_step_numpy and life_step_naive in
+game_of_life.py and to life_step_int in game_of_life_mem_opt.py. A stack of
+boards of shape (B, N, M) gets one halo per board, so that
+life_step_halo_into steps the whole batch (see game_of_life_ensemble.py).
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import numpy as np
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Supported boundary modes for the halo refresh
+BOUNDARIES = ("torus", "dead", "reflect")
+
+
+class HaloGrid:
+    """
+    A 2D Game of Life board (or a stack of boards) stored with a one-cell halo.
+
+    Attributes:
+        padded (np.ndarray): (..., N + 2, M + 2) array holding board and halo.
+        interior (np.ndarray): (..., N, M) view of the board inside the halo.
+        boundary (str): One of BOUNDARIES.
+    """
+
+    def __init__(self, grid: np.ndarray, boundary: str = "torus", dtype=np.uint8):
+        """
+        Copy a board into a new halo-padded array and fill the halo.
+
+        Args:
+            grid (np.ndarray): 2D array of 0s and 1s, or a (B, N, M) stack
+                of boards.
+            boundary (str): Boundary mode, one of BOUNDARIES.
+            dtype (np.dtype): Storage dtype of the padded array.
+
+        Raises:
+            ValueError: If boundary is not a supported mode.
+        """
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Unknown boundary '{boundary}', expected one of {BOUNDARIES}")
+        *batch, N, M = grid.shape
+        self.boundary = boundary
+        self.padded = np.zeros((*batch, N + 2, M + 2), dtype=dtype)
+        self.interior = self.padded[..., 1:-1, 1:-1]
+        self.interior[...] = grid
+        self.refresh_halo()
+
+    @property
+    def shape(self):
+        """tuple[int, ...]: Shape (N, M) (or (B, N, M)) without the halo."""
+        return self.interior.shape
+
+    def refresh_halo(self):
+        """
+        Refill the ghost cells from the interior for the boundary mode.
+
+        Rows are filled first and columns second (over the full padded
+        height), so the corners are filled correctly in every mode. Costs
+        O(N + M) rather than a copy of the whole board.
+        """
+        p = self.padded
+        if self.boundary == "torus":
+            p[..., 0, 1:-1] = p[..., -2, 1:-1]
+            p[..., -1, 1:-1] = p[..., 1, 1:-1]
+            p[..., :, 0] = p[..., :, -2]
+            p[..., :, -1] = p[..., :, 1]
+        elif self.boundary == "reflect":
+            p[..., 0, 1:-1] = p[..., 1, 1:-1]
+            p[..., -1, 1:-1] = p[..., -2, 1:-1]
+            p[..., :, 0] = p[..., :, 1]
+            p[..., :, -1] = p[..., :, -2]
+        else:
+            p[..., 0, :] = 0
+            p[..., -1, :] = 0
+            p[..., :, 0] = 0
+            p[..., :, -1] = 0
+
+    def shifted(self, dx: int, dy: int) -> np.ndarray:
+        """
+        Zero-copy view of the board shifted by (dx, dy).
+
+        For the torus boundary this equals
+        np.roll(np.roll(interior, dx, axis=0), dy, axis=1).
+
+        Args:
+            dx (int): Row shift (-1, 0 or 1).
+            dy (int): Column shift (-1, 0 or 1).
+
+        Returns:
+            np.ndarray: (..., N, M) view into the padded array.
+        """
+        N, M = self.shape[-2:]
+        return self.padded[..., 1 - dx:1 - dx + N, 1 - dy:1 - dy + M]
+
+    def neighbour_count(self, out: np.ndarray = None, rows: np.ndarray = None) -> np.ndarray:
+        """
+        Count the 8 neighbours of every cell with a separable sum over slices.
+
+        Each padded row is summed with its left and right neighbours, those
+        row sums are summed with the rows above and below, and the centre is
+        subtracted. No rolled copies are made, and when out and rows are
+        supplied nothing is allocated.
+
+        Args:
+            out (np.ndarray, optional): (..., N, M) array receiving the counts.
+            rows (np.ndarray, optional): (..., N + 2, M) work array for row sums.
+
+        Returns:
+            np.ndarray: (..., N, M) array of neighbour counts (0–8).
+        """
+        p = self.padded
+        if out is None:
+            out = np.empty(self.shape, dtype=p.dtype)
+        if rows is None:
+            rows = np.empty(p.shape[:-1] + self.shape[-1:], dtype=p.dtype)
+        np.add(p[..., :-2], p[..., 1:-1], out=rows)
+        np.add(rows, p[..., 2:], out=rows)
+        np.add(rows[..., :-2, :], rows[..., 1:-1, :], out=out)
+        np.add(out, rows[..., 2:, :], out=out)
+        np.subtract(out, self.interior, out=out)
+        return out
+
+    def to_array(self) -> np.ndarray:
+        """
+        Return a copy of the board without the halo.
+
+        Returns:
+            np.ndarray: (..., N, M) array of 0s and 1s.
+        """
+        return self.interior.copy()
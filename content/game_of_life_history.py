@@ -0,0 +1,149 @@
+"""
+Disk-Backed Game of Life History
+
+Recording every generation in a Python list limits history to small boards:
+a 4000×4000 run keeps 16 MB of RAM per generation. HistoryStore instead
+streams generations into a preallocated memory-mapped .npy file, one bit
+per cell, so recording uses bounded RAM however many generations are kept,
+and any generation can be read back later for animation or analysis.
+
+Each row is packed with np.packbits(bitorder="little"), which is the same
+bit order as pack_grid, so the bit-packed backend can append its words
+without unpacking them. The board shape and number of recorded generations
+are kept in a small JSON file next to the data file.
+
+HistoryStore behaves like a read-only list of 2D uint8 grids (len, indexing,
+slicing, iteration), so it can be passed straight to animate_life:
+
+    store = HistoryStore("run.npy", shape=(N, N), capacity=T)
+    simulate_life_numpy(N, T, store=store)
+    animate_life(store, Path("run.gif"))
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import json
+from pathlib import Path
+import numpy as np
+
+
+class HistoryStore:
+    """
+    Append-only, memory-mapped store of Game of Life generations.
+
+    Attributes:
+        path (Path): Path of the .npy data file.
+        shape (tuple[int, int]): Board shape (N, M).
+        capacity (int): Maximum number of generations.
+    """
+
+    def __init__(self, path, shape: tuple = None, capacity: int = None):
+        """
+        Create a new store, or open an existing one for reading.
+
+        Args:
+            path (str or Path): Path of the .npy data file.
+            shape (tuple[int, int], optional): Board shape. If given, a new
+                store is created (overwriting any existing file); otherwise
+                the store at path is opened read-only.
+            capacity (int, optional): Maximum number of generations (needed
+                when creating).
+        """
+        self.path = Path(path)
+        self._meta_path = self.path.with_suffix(".json")
+        if shape is not None:
+            if capacity is None:
+                raise ValueError("capacity is required when creating a HistoryStore")
+            self.shape = tuple(shape)
+            self.capacity = capacity
+            self._length = 0
+            self._data = np.lib.format.open_memmap(
+                self.path, mode="w+", dtype=np.uint8,
+                shape=(capacity, self.shape[0], -(-self.shape[1] // 8)))
+            self._writable = True
+            self._write_meta()
+        else:
+            meta = json.loads(self._meta_path.read_text())
+            self.shape = tuple(meta["shape"])
+            self._length = meta["length"]
+            self._data = np.load(self.path, mmap_mode="r")
+            self.capacity = self._data.shape[0]
+            self._writable = False
+
+    def _write_meta(self):
+        """Write the board shape and current length to the JSON sidecar."""
+        self._meta_path.write_text(json.dumps({"shape": list(self.shape), "length": self._length}))
+
+    def append(self, grid: np.ndarray):
+        """
+        Append one generation.
+
+        Args:
+            grid (np.ndarray): 2D array of 0s and 1s with the store's shape.
+        """
+        self._check_append()
+        self._data[self._length] = np.packbits(np.asarray(grid, dtype=bool), axis=-1, bitorder="little")
+        self._length += 1
+
+    def append_packed(self, words: np.ndarray):
+        """
+        Append one generation given as pack_grid words.
+
+        Args:
+            words (np.ndarray): (N, ceil(M / 64)) '<u8' array from pack_grid
+                or life_step_bitpacked.
+        """
+        self._check_append()
+        row_bytes = self._data.shape[2]
+        self._data[self._length] = words.view(np.uint8)[:, :row_bytes]
+        self._length += 1
+
+    def _check_append(self):
+        """Raise if the store is read-only or full."""
+        if not self._writable:
+            raise ValueError(f"{self.path} is open read-only")
+        if self._length >= self.capacity:
+            raise IndexError(f"HistoryStore is full ({self.capacity} generations)")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        """
+        Read one generation (int index) or several (slice).
+
+        Returns:
+            np.ndarray: (N, M) uint8 grid, or (k, N, M) for a slice.
+        """
+        if isinstance(index, slice):
+            packed = self._data[:self._length][index]
+        else:
+            if index < 0:
+                index += self._length
+            if not 0 <= index < self._length:
+                raise IndexError("HistoryStore index out of range")
+            packed = self._data[index]
+        return np.unpackbits(packed, axis=-1, count=self.shape[1], bitorder="little")
+
+    def __iter__(self):
+        for t in range(self._length):
+            yield self[t]
+
+    def flush(self):
+        """Write pending data and the current length to disk."""
+        if self._writable:
+            self._data.flush()
+            self._write_meta()
+
+    def close(self):
+        """Flush and release the memory map."""
+        self.flush()
+        self._writable = False
+        self._data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -7,22 +7,41 @@ from pathlib import Path  # For convenient file path handling
 
 import numpy as np                           # Numerical operations on arrays
 import matplotlib.pyplot as plt              # Plotting figures and images
-import matplotlib.animation as animation     # Creating animated GIFs
 from matplotlib.colors import BoundaryNorm   # For discrete colormap normalization
 from tqdm import tqdm                        # Progress bar for loops
 
+from content.game_of_life import life_step_halo_into           # Allocation-free halo step
+from content.game_of_life_checkpoint import DEFAULT_EVERY, Checkpointer  # Checkpoint/restart
+from content.game_of_life_cycles import CycleDetector      # Early stop on repeats
+from content.game_of_life_gif import GifWriter             # Direct GIF encoder
+from content.game_of_life_halo import BOUNDARIES, HaloGrid  # Halo-padded boards
+from content.game_of_life_history import HistoryStore       # Disk-backed history
+from content.game_of_life_init import random_board          # Parallel seeded init
+from content.game_of_life_pipeline import DEFAULT_DEPTH, RenderPipeline
 
-def life_step_int(grid: np.ndarray, neighbours: np.ndarray) -> np.ndarray:
+
+def life_step_int(grid, neighbours: np.ndarray, out: HaloGrid = None, rows: np.ndarray = None):
     """
     Perform a single step (generation) update for Conway's Game of Life.
 
     Parameters:
-    - grid (np.ndarray): 2D uint8 array of shape (N, N) with values 0 (dead) or 1 (alive).
+    - grid (np.ndarray or HaloGrid): 2D uint8 array of shape (N, N) with values 0 (dead)
+      or 1 (alive), or a HaloGrid whose slices replace the np.roll copies.
     - neighbours (np.ndarray): 2D uint8 array of same shape used for counting neighbours.
+    - out (HaloGrid, optional): HaloGrid-only: preallocated grid receiving the next
+      generation with life_step_halo_into (allocated if omitted); swap it with grid
+      after each step.
+    - rows (np.ndarray, optional): HaloGrid-only: (N + 2, N) uint8 work array.
 
     Returns:
-    - np.ndarray: New 2D uint8 array representing next generation.
+    - np.ndarray or HaloGrid: Next generation, of the same kind as grid.
     """
+    if isinstance(grid, HaloGrid):
+        if out is None:
+            out = HaloGrid(grid.interior, grid.boundary)
+        if rows is None:
+            rows = np.empty((grid.shape[0] + 2, grid.shape[1]), dtype=np.uint8)
+        return life_step_halo_into(grid, out, neighbours, rows)
     neighbours.fill(0)
     for dx, dy in (
         (-1, -1), (-1, 0), (-1, 1),
@@ -33,6 +52,26 @@ def life_step_int(grid: np.ndarray, neighbours: np.ndarray) -> np.ndarray:
     return ((neighbours == 3) | ((grid == 1) & (neighbours == 2))).astype(np.uint8)
 
 
+def resumed_gif_path(output_file: Path, start: int) -> Path:
+    """
+    Path of the GIF written by a run that starts at generation start.
+
+    A resumed run only has the remaining generations, so it writes them to
+    <stem>_from<start>.gif next to output_file and keeps the GIF of the
+    interrupted run.
+
+    Parameters:
+    - output_file (Path): GIF path given for the run.
+    - start (int): Generation the run starts from (0 for a fresh run).
+
+    Returns:
+    - Path: output_file for a fresh run, else the _from<start> path.
+    """
+    if start == 0:
+        return output_file
+    return output_file.with_name(f"{output_file.stem}_from{start}{output_file.suffix}")
+
+
 def simulate_and_animate(
     N: int,
     timesteps: int,
@@ -40,49 +79,105 @@ def simulate_and_animate(
     output_file: Path,
     interval_ms: int = 200,
     max_display: int = 1080,
-    dpi: int = 180
+    boundary: str = "torus",
+    detector: CycleDetector = None,
+    store: HistoryStore = None,
+    queue_depth: int = DEFAULT_DEPTH,
+    seed: int = None,
+    checkpointer: Checkpointer = None
 ) -> np.ndarray:
     """
     Initialize the Game of Life grid randomly, run simulation, create a GIF,
     and count alive occurrences per cell over time.
+    The board is held in a HaloGrid with the given boundary mode
+    ("torus", "dead" or "reflect").
+    If a CycleDetector is given, the run stops (and no more frames are
+    written) at the first generation that repeats an earlier one.
+    If a HistoryStore is given, every generation is also recorded in it.
+    Frames are encoded directly with GifWriter, upscaled or block-reduced to
+    at most max_display pixels.
+    GIF writing, the alive counts and the history store run in background
+    threads fed through a RenderPipeline with queue_depth snapshots per
+    consumer; the time the simulation spent blocked on full queues is
+    printed at the end.
+    The initial board is drawn with random_board, reproducibly if a seed is
+    given. If a Checkpointer is given it draws (or, when resuming, restores)
+    the board and the alive counts, and the counts thread checkpoints both
+    periodically; a resumed run writes the remaining generations to the GIF
+    given by resumed_gif_path, leaving output_file as it was.
     Returns:
     - counts: 2D uint32 array of shape (N, N) with number of times each cell was alive
     """
-    rng = np.random.default_rng()
-    grid = np.empty((N, N), dtype=np.uint8)
-    threshold = int(p_alive * 1_000_000)
-    for i in range(N):
-        grid[i, :] = (rng.integers(0, 1_000_000, size=N, dtype=np.int32) < threshold).astype(np.uint8)
-    neighbours = np.zeros((N, N), dtype=np.uint8)
     counts = np.zeros((N, N), dtype=np.uint32)
-    step = 1 if max_display is None or max_display >= N else max(1, N // max_display)
-    width_in = max_display / dpi
-    fig = plt.figure(figsize=(width_in, width_in), frameon=False)
-    fig.patch.set_visible(False)
-    ax = fig.add_axes([0, 0, 1, 1], frameon=False)
-    ax.set_axis_off()
-    small = grid[::step, ::step]
-    im = ax.imshow(small, cmap='binary', vmin=0, vmax=1, interpolation='nearest')
-    writer = animation.PillowWriter(fps=1000 / interval_ms)
-    writer.setup(fig, str(output_file), dpi=dpi)
-    for _ in tqdm(range(timesteps), desc="Simulating & writing GIF"):
-        counts += grid
-        small = grid[::step, ::step]
-        im.set_data(small)
-        writer.grab_frame()
-        grid = life_step_int(grid, neighbours)
-    writer.finish()
-    plt.close(fig)
+    if checkpointer is None:
+        start, board = 0, random_board((N, N), p_alive, seed)
+    else:
+        start, board = checkpointer.initial_board((N, N), p_alive, seed, boundary=boundary)
+        if "counts" in checkpointer.accumulators:
+            counts[...] = checkpointer.accumulators["counts"]
+    grid = HaloGrid(board, boundary)
+    # Ping-pong partner and work buffers, allocated once
+    out = HaloGrid(grid.interior, boundary)
+    neighbours = np.zeros((N, N), dtype=np.uint8)
+    rows = np.empty((N + 2, N), dtype=np.uint8)
+    generation = start
+    def accumulate(frame):
+        nonlocal generation
+        if checkpointer is not None:
+            # Board of this generation with the counts of the ones before it
+            checkpointer.update(generation, frame, counts=counts)
+        np.add(counts, frame, out=counts)
+        generation += 1
+
+    # Frames go straight to the palette GIF encoder (no matplotlib figure)
+    consumers = {
+        "gif": GifWriter(resumed_gif_path(output_file, start), (N, N), interval=interval_ms,
+                         max_display=max_display),
+        "counts": accumulate,
+    }
+    if store is not None:
+        consumers["history"] = store.append
+
+    with RenderPipeline((N, N), consumers, depth=queue_depth) as pipeline:
+        for _ in tqdm(range(start, timesteps), desc="Simulating & writing GIF"):
+            if detector is not None and detector.update(grid.interior):
+                break
+            pipeline.put(grid.interior)
+            life_step_int(grid, neighbours, out, rows)
+            grid, out = out, grid
+    print(f"[Pipeline] {pipeline.report()}")
     return counts
 
 
-def plot_heatmap(counts: np.ndarray, output_file: Path = None):
+def alive_counts(history, chunk: int = 64) -> np.ndarray:
+    """
+    Count how many generations each cell was alive in a recorded history.
+
+    Parameters:
+    - history (HistoryStore or list[np.ndarray]): Recorded generations.
+    - chunk (int): Generations read at a time; bounds the RAM used.
+
+    Returns:
+    - counts: 2D uint32 array with the number of times each cell was alive
+    """
+    counts = np.zeros(np.shape(history[0]), dtype=np.uint32)
+    for start in range(0, len(history), chunk):
+        counts += np.sum(history[start:start + chunk], axis=0, dtype=np.uint32)
+    return counts
+
+
+def plot_heatmap(counts, output_file: Path = None):
     """
     Generate BOTH a continuous and a 10-level discrete heatmap of cell alive counts.
+    counts may also be a HistoryStore (or list of grids), whose alive counts
+    are computed with alive_counts.
     Saves to:
       <stem>_continuous<suffix> and <stem>_discrete<suffix>
     or displays interactively if output_file is None.
     """
+    if not isinstance(counts, np.ndarray):
+        counts = alive_counts(counts)
+
     # Continuous heatmap
     fig1 = plt.figure(figsize=(6, 6))
     im1 = plt.imshow(counts, cmap='hot', interpolation='nearest')
@@ -124,17 +219,46 @@ def main():
     parser.add_argument("--size", type=int, default=100, help="Grid dimension (N×N)")
     parser.add_argument("--timesteps", type=int, default=50, help="Number of generations to simulate")
     parser.add_argument("--p-alive", type=float, default=0.2, help="Initial alive probability (0–1)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (reproducible board)")
     parser.add_argument("--output", type=Path, default=Path("game_of_life_hd.gif"), help="Output GIF filename")
     parser.add_argument("--heatmap", type=Path, default=Path("alive_heatmap.png"), help="Output heatmap filename (PNG)")
     parser.add_argument("--interval", type=int, default=200, help="Frame duration in ms")
     parser.add_argument("--max-display", type=int, default=1080, help="Max side length for display (pixels)")
-    parser.add_argument("--dpi", type=int, default=180, help="Resolution (dots per inch) for outputs")
+    parser.add_argument("--boundary", choices=BOUNDARIES, default="torus", help="Boundary mode")
+    parser.add_argument("--stop-on-cycle", action="store_true", help="Stop once the board repeats")
+    parser.add_argument("--history-file", type=Path, default=None,
+                        help="Also record every generation to this memory-mapped .npy file")
+    parser.add_argument("--queue-depth", type=int, default=DEFAULT_DEPTH,
+                        help="Snapshots buffered per background consumer")
+    parser.add_argument("--checkpoint", type=Path, default=None,
+                        help="Periodically checkpoint the board and alive counts to this .npz file")
+    parser.add_argument("--checkpoint-every", type=int, default=DEFAULT_EVERY,
+                        help="Generations between checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume from --checkpoint if it exists, writing the GIF to <output stem>_from<generation>")
+    parser.add_argument("--from-history", type=Path, default=None,
+                        help="Plot the heatmap of an existing history file instead of simulating")
     args = parser.parse_args()
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume requires --checkpoint")
+    if args.resume and args.history_file:
+        parser.error("--history-file cannot be used with --resume (it would overwrite the recorded history)")
+
+    if args.from_history:
+        plot_heatmap(HistoryStore(args.from_history), args.heatmap)
+        return
 
     print(f"[All-int Matplotlib HD + Heatmap] size={args.size}, timesteps={args.timesteps}, p_alive={args.p_alive}")
     start_wall = time.perf_counter()
     rstart = resource.getrusage(resource.RUSAGE_SELF)
 
+    detector = CycleDetector() if args.stop_on_cycle else None
+    store = None
+    if args.history_file:
+        store = HistoryStore(args.history_file, (args.size, args.size), args.timesteps)
+    checkpointer = None
+    if args.checkpoint:
+        checkpointer = Checkpointer(args.checkpoint, args.checkpoint_every, args.resume)
     counts = simulate_and_animate(
         N=args.size,
         timesteps=args.timesteps,
@@ -142,8 +266,23 @@ def main():
         output_file=args.output,
         interval_ms=args.interval,
         max_display=args.max_display,
-        dpi=args.dpi
+        boundary=args.boundary,
+        detector=detector,
+        store=store,
+        queue_depth=args.queue_depth,
+        seed=args.seed,
+        checkpointer=checkpointer
     )
+    if checkpointer is not None:
+        checkpointer.close()
+        print(checkpointer.report())
+    if detector is not None:
+        print(detector.report())
+    if store is not None:
+        store.close()
+        print(f"History saved to {args.history_file}")
+    start = checkpointer.start if checkpointer is not None else 0
+    output = resumed_gif_path(args.output, start)
 
     plot_heatmap(counts, args.heatmap)
 
@@ -154,7 +293,11 @@ def main():
     cpu_system = rend.ru_stime - rstart.ru_stime
     peak_rss = rend.ru_maxrss / (1024 ** 2)
 
-    print(f"Saved HD GIF to {args.output}")
+    if args.timesteps > start:
+        print(f"Saved HD GIF to {output}")
+    else:
+        # --timesteps 0, or resumed from a checkpoint at the last generation
+        print(f"No generations stepped; GIF not written to {output}")
     print(f"Generated heatmaps to {args.heatmap.stem}_continuous and {args.heatmap.stem}_discrete")
     print("=== Resource usage ===")
     print(f"Wall-clock time : {elapsed:.2f} s")
@@ -0,0 +1,383 @@
+"""
+MPI Distributed Game of Life
+
+This module runs the Game of Life across MPI ranks (and therefore across
+nodes) with mpi4py. The toroidal board is split with a periodic 2D Cartesian
+decomposition; each rank owns one block stored with a one-cell halo.
+
+Every generation each rank:
+  1. Posts non-blocking sends/receives of its 4 edges and 4 corners to the
+     8 neighbouring ranks.
+  2. Updates the interior of its block (cells that do not touch the halo)
+     while the messages are in flight.
+  3. Waits for the halos and updates the one-cell ring along its edges.
+
+History (for GIF output) is assembled on rank 0 with a Gatherv of the
+blocks. Scaling benchmarks append rows to a CSV with the same schema as
+game_of_life_experiment.py, so game_of_life_create_plots.py can read them.
+
+Run with, e.g.:
+    mpirun -n 4 poetry run game_of_life_mpi --size 1000 --timesteps 100
+
+Entry points:
+- simulate_life_mpi(): same contract as simulate_life_numpy (collective).
+- run_life_mpi(): CLI entry point, including --scaling strong|weak.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import csv
+import os
+import subprocess
+from pathlib import Path
+import numpy as np
+from mpi4py import MPI
+
+from content.game_of_life import animate_life
+from content.game_of_life_init import random_board
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output directory for the scaling benchmark CSVs
+out_dir = "../output"
+
+# Halo directions as (row offset, column offset); the message tag is the
+# index of the direction in which the *receiving* rank sees the halo
+DIRECTIONS = (
+    (-1, 0), (1, 0), (0, -1), (0, 1),
+    (-1, -1), (-1, 1), (1, -1), (1, 1),
+)
+
+
+def get_gpu_name():
+    """
+    Query the system GPU name via nvidia-smi.
+
+    Returns:
+        The first GPU’s name, or 'Unknown_GPU' if the command fails.
+    """
+    try:
+        out = subprocess.check_output(
+            ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
+            stderr=subprocess.DEVNULL
+        ).decode().strip().splitlines()
+        return out[0]
+    except Exception:
+        return "Unknown_GPU"
+
+
+def get_cpu_name():
+    """
+    Query the CPU model name via lscpu (Linux).
+
+    Returns:
+        The CPU model string, or 'Unknown_CPU' if detection fails.
+    """
+    try:
+        out = subprocess.check_output(["lscpu"], stderr=subprocess.DEVNULL).decode().splitlines()
+        for line in out:
+            if line.startswith("Model name:"):
+                return line.split(":", 1)[1].strip()
+    except Exception:
+        pass
+    return "Unknown_CPU"
+
+
+class LifeBlock:
+    """
+    One rank's block of a 2D Cartesian-decomposed toroidal board.
+
+    Attributes:
+        cart (MPI.Cartcomm): Periodic 2D Cartesian communicator.
+        row_bounds, col_bounds (np.ndarray): Global block boundaries along
+            each axis (length dims + 1).
+        rows, cols (tuple[int, int]): This rank's global row/column range.
+    """
+
+    def __init__(self, N: int, M: int, comm=None):
+        """
+        Create the Cartesian communicator and the halo-padded local buffers.
+
+        Args:
+            N, M (int): Global board shape.
+            comm (MPI.Comm, optional): Communicator (default: COMM_WORLD).
+        """
+        comm = MPI.COMM_WORLD if comm is None else comm
+        dims = MPI.Compute_dims(comm.Get_size(), 2)
+        if dims[0] > N or dims[1] > M:
+            raise ValueError(f"Board {N}×{M} is too small for a {dims[0]}×{dims[1]} rank grid")
+        self.cart = comm.Create_cart(dims, periods=[True, True], reorder=True)
+        self.shape = (N, M)
+        self.row_bounds = np.linspace(0, N, dims[0] + 1).astype(int)
+        self.col_bounds = np.linspace(0, M, dims[1] + 1).astype(int)
+        ci, cj = self.cart.Get_coords(self.cart.Get_rank())
+        self.rows = (self.row_bounds[ci], self.row_bounds[ci + 1])
+        self.cols = (self.col_bounds[cj], self.col_bounds[cj + 1])
+        h, w = self.rows[1] - self.rows[0], self.cols[1] - self.cols[0]
+
+        self._src = np.zeros((h + 2, w + 2), dtype=np.uint8)
+        self._dst = np.zeros_like(self._src)
+        self._neighbours = [
+            self.cart.Get_cart_rank([ci + di, cj + dj]) for di, dj in DIRECTIONS
+        ]
+        # Contiguous buffers for the column and corner halos
+        self._send_cols = np.empty((2, h), dtype=np.uint8)
+        self._recv_cols = np.empty((2, h), dtype=np.uint8)
+        self._send_corners = np.empty(4, dtype=np.uint8)
+        self._recv_corners = np.empty(4, dtype=np.uint8)
+
+    @property
+    def interior(self) -> np.ndarray:
+        """np.ndarray: (h, w) view of this rank's cells."""
+        return self._src[1:-1, 1:-1]
+
+    def scatter(self, grid: np.ndarray = None, root: int = 0):
+        """
+        Distribute a global grid held on root to every rank's block.
+
+        Args:
+            grid (np.ndarray, optional): Global board (only needed on root).
+            root (int): Rank holding the grid.
+        """
+        blocks = None
+        if self.cart.Get_rank() == root:
+            blocks = []
+            for rank in range(self.cart.Get_size()):
+                ci, cj = self.cart.Get_coords(rank)
+                blocks.append(np.ascontiguousarray(
+                    grid[self.row_bounds[ci]:self.row_bounds[ci + 1],
+                         self.col_bounds[cj]:self.col_bounds[cj + 1]], dtype=np.uint8).ravel())
+            counts = [b.size for b in blocks]
+            blocks = [np.concatenate(blocks), (counts, None), MPI.UNSIGNED_CHAR]
+        local = np.empty(self.interior.size, dtype=np.uint8)
+        self.cart.Scatterv(blocks, local, root=root)
+        self.interior[...] = local.reshape(self.interior.shape)
+
+    def gather(self, root: int = 0):
+        """
+        Assemble the global board on root with a Gatherv of all blocks.
+
+        Args:
+            root (int): Rank receiving the board.
+
+        Returns:
+            np.ndarray or None: Global (N, M) uint8 board on root, else None.
+        """
+        local = np.ascontiguousarray(self.interior).ravel()
+        is_root = self.cart.Get_rank() == root
+        sizes = self.cart.gather(local.size, root=root)
+        recv = None
+        if is_root:
+            flat = np.empty(sum(sizes), dtype=np.uint8)
+            recv = [flat, (sizes, None), MPI.UNSIGNED_CHAR]
+        self.cart.Gatherv(local, recv, root=root)
+        if not is_root:
+            return None
+        grid = np.empty(self.shape, dtype=np.uint8)
+        offset = 0
+        for rank, size in enumerate(sizes):
+            ci, cj = self.cart.Get_coords(rank)
+            r0, r1 = self.row_bounds[ci], self.row_bounds[ci + 1]
+            c0, c1 = self.col_bounds[cj], self.col_bounds[cj + 1]
+            grid[r0:r1, c0:c1] = flat[offset:offset + size].reshape(r1 - r0, c1 - c0)
+            offset += size
+        return grid
+
+    def _post_halo_exchange(self):
+        """Start non-blocking edge/corner exchange with the 8 neighbours."""
+        src = self._src
+        self._send_cols[0] = src[1:-1, 1]
+        self._send_cols[1] = src[1:-1, -2]
+        self._send_corners[:] = (src[1, 1], src[1, -2], src[-2, 1], src[-2, -2])
+
+        # What is sent in direction d arrives as the opposite halo, so it is
+        # tagged with the index of the opposite direction
+        sends = (src[1, 1:-1], src[-2, 1:-1], self._send_cols[0], self._send_cols[1],
+                 self._send_corners[0:1], self._send_corners[1:2],
+                 self._send_corners[2:3], self._send_corners[3:4])
+        recvs = (src[0, 1:-1], src[-1, 1:-1], self._recv_cols[0], self._recv_cols[1],
+                 self._recv_corners[0:1], self._recv_corners[1:2],
+                 self._recv_corners[2:3], self._recv_corners[3:4])
+        opposite = (1, 0, 3, 2, 7, 6, 5, 4)
+        requests = []
+        for d, (buf, nbr) in enumerate(zip(recvs, self._neighbours)):
+            requests.append(self.cart.Irecv(buf, source=nbr, tag=d))
+        for d, (buf, nbr) in enumerate(zip(sends, self._neighbours)):
+            requests.append(self.cart.Isend(buf, dest=nbr, tag=opposite[d]))
+        return requests
+
+    def _finish_halo_exchange(self, requests):
+        """Wait for the exchange and unpack the column and corner halos."""
+        MPI.Request.Waitall(requests)
+        src = self._src
+        src[1:-1, 0] = self._recv_cols[0]
+        src[1:-1, -1] = self._recv_cols[1]
+        src[0, 0], src[0, -1], src[-1, 0], src[-1, -1] = self._recv_corners
+
+    def _update(self, r0: int, r1: int, c0: int, c1: int):
+        """Apply the rules to padded rows [r0, r1) and columns [c0, c1)."""
+        if r0 >= r1 or c0 >= c1:
+            return
+        window = self._src[r0 - 1:r1 + 1, c0 - 1:c1 + 1]
+        centre = window[1:-1, 1:-1]
+        rows = window[:, :-2] + window[:, 1:-1] + window[:, 2:]
+        neighbours = rows[:-2] + rows[1:-1] + rows[2:] - centre
+        self._dst[r0:r1, c0:c1] = (neighbours == 3) | ((centre == 1) & (neighbours == 2))
+
+    def step(self):
+        """
+        Advance this block by one generation (collective over cart).
+
+        The interior is updated while the halo messages are in flight; the
+        edge ring is updated once they have arrived.
+        """
+        h, w = self.interior.shape
+        requests = self._post_halo_exchange()
+        self._update(2, h, 2, w)
+        self._finish_halo_exchange(requests)
+        self._update(1, 2, 1, w + 1)
+        self._update(max(h, 2), h + 1, 1, w + 1)
+        self._update(2, h, 1, 2)
+        self._update(2, h, max(w, 2), w + 1)
+        self._src, self._dst = self._dst, self._src
+
+
+def simulate_life_mpi(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                      comm=None, seed: int = None):
+    """
+    Run a Game of Life simulation across MPI ranks.
+
+    Collective: every rank must call it. Rank 0 draws the initial board like
+    simulate_life_numpy and scatters it; history is gathered on rank 0.
+
+    Args:
+        N (int): Grid dimension (N × N).
+        timesteps (int): Number of generations to simulate.
+        p_alive (float): Probability that a cell starts alive.
+        record_history (bool): If True, gather each generation on rank 0.
+        comm (MPI.Comm, optional): Communicator (default: COMM_WORLD).
+        seed (int, optional): Seed for random_board on rank 0 (fresh
+            entropy if None).
+
+    Returns:
+        list[np.ndarray] or None: History on rank 0 if record_history,
+        otherwise None.
+    """
+    block = LifeBlock(N, N, comm)
+    grid = None
+    if block.cart.Get_rank() == 0:
+        grid = random_board((N, N), p_alive, seed)
+    block.scatter(grid)
+    history = [] if record_history else None
+    for _ in range(timesteps):
+        if record_history:
+            snapshot = block.gather()
+            if snapshot is not None:
+                history.append(snapshot)
+        block.step()
+    return history if block.cart.Get_rank() == 0 else None
+
+
+def _time_run(N: int, timesteps: int, repeats: int, comm, seed: int = None):
+    """
+    Time the stepping loop (excluding set-up) across all ranks.
+
+    With a seed every repeat steps the same board.
+
+    Returns:
+        list[float]: Per-repeat wall-clock seconds (slowest rank).
+    """
+    times = []
+    for _ in range(repeats):
+        block = LifeBlock(N, N, comm)
+        grid = None
+        if block.cart.Get_rank() == 0:
+            grid = random_board((N, N), 0.2, seed)
+        block.scatter(grid)
+        block.cart.Barrier()
+        t0 = MPI.Wtime()
+        for _ in range(timesteps):
+            block.step()
+        elapsed = block.cart.allreduce(MPI.Wtime() - t0, op=MPI.MAX)
+        times.append(elapsed)
+        block.cart.Free()
+    return times
+
+
+def run_life_mpi():
+    """
+    Command‐line entry for the MPI Game of Life.
+
+    Same CLI interface as run_life_numpy plus --scaling and --repeats.
+    With --scaling strong the --size board is timed as is; with --scaling
+    weak each rank keeps a --size × --size block, so the global board grows
+    with the rank count. Either mode appends a row to
+    ../output/gol_timings_<gpu>_<cpu>_mpi_<mode>_ts<timesteps>.csv.
+    """
+    p = argparse.ArgumentParser("Game of Life (MPI)")
+    p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
+    p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
+    p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
+    p.add_argument("--scaling",   choices=["strong", "weak"], default=None,
+                   help="Run a scaling benchmark instead of a single simulation")
+    p.add_argument("--repeats",   type=int, default=3,   help="Benchmark repeats")
+    p.add_argument("--seed",      type=int, default=None, help="Random seed (reproducible board)")
+    args = p.parse_args()
+
+    comm = MPI.COMM_WORLD
+    rank, nprocs = comm.Get_rank(), comm.Get_size()
+    if rank == 0:
+        print(f"[MPI] Args received: {args} on {nprocs} ranks")
+
+    if args.scaling:
+        N = args.size if args.scaling == "strong" else int(round(args.size * np.sqrt(nprocs)))
+        times = _time_run(N, args.timesteps, args.repeats, comm, args.seed)
+        if rank == 0:
+            gpu_name = get_gpu_name().replace(" ", "_")
+            cpu_name = get_cpu_name().replace(" ", "_")
+            os.makedirs(out_dir, exist_ok=True)
+            csv_filename = os.path.join(
+                out_dir, f"gol_timings_{gpu_name}_{cpu_name}_mpi_{args.scaling}_ts{args.timesteps}.csv"
+            )
+            new_file = not os.path.exists(csv_filename)
+            with open(csv_filename, "a", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow([
+                        "gpu", "cpu", "method",
+                        "grid_size", "timesteps",
+                        "mean_time_sec", "std_dev_sec"
+                    ])
+                writer.writerow([
+                    gpu_name, cpu_name,
+                    f"MPI ({nprocs} ranks)",
+                    N, args.timesteps,
+                    f"{np.mean(times):.6f}",
+                    f"{np.std(times):.6f}"
+                ])
+            print(f"[MPI] {args.scaling} scaling, {nprocs} ranks, {N}×{N}: "
+                  f"{np.mean(times):.4f} ± {np.std(times):.4f} s")
+            print(f"Saved CSV: {csv_filename}")
+        return
+
+    record = args.save_gif and args.size <= 100
+    history = simulate_life_mpi(args.size, args.timesteps, record_history=record, comm=comm,
+                                seed=args.seed)
+
+    if rank != 0:
+        return
+    if args.save_gif:
+        if record and len(history) == 0:
+            print("[MPI] No generations stepped; GIF creation skipped.")
+        elif record:
+            output = Path("game_of_life_mpi.gif")
+            animate_life(history, output)
+            print(f"Saved MPI GIF to {output}")
+        else:
+            print("[MPI] Problem size > 100: cannot save history or create GIF.")
+    else:
+        print("[MPI] GIF creation skipped; history not saved.")
@@ -0,0 +1,121 @@
+"""
+Numba-JIT Parallel Game of Life Backend
+
+This module implements the Game of Life update as a Numba @njit kernel that
+runs in parallel over rows with prange. The neighbour count and the rule are
+fused into one pass over the grid, so no temporaries are created, and the
+result is written into a preallocated output grid.
+
+The kernel is compiled with cache=True, so the machine code is stored on
+disk (next to this file in __pycache__, or under NUMBA_CACHE_DIR) and later
+runs skip the compilation. The number of threads follows
+NUMBA_NUM_THREADS (default: all cores).
+
+Entry points:
+- simulate_life_numba(): same contract as simulate_life_numpy.
+- run_life_numba(): CLI entry point (game_of_life_numba).
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+from pathlib import Path
+import numpy as np
+from numba import njit, prange
+
+from content.game_of_life import animate_life
+from content.game_of_life_init import random_board
+
+
+@njit(parallel=True, cache=True)
+def life_step_numba(grid: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Compute the next generation into a preallocated grid with Numba.
+
+    Applies the same toroidal rules as life_step_numpy. Rows are distributed
+    over threads with prange; each cell's 8 neighbours are summed and the
+    rule applied in the same loop.
+
+    Args:
+        grid (np.ndarray): 2D uint8 array of 0s and 1s (current state).
+        out (np.ndarray): 2D uint8 array receiving the next generation.
+            Must not share memory with grid.
+
+    Returns:
+        np.ndarray: The out array.
+    """
+    N, M = grid.shape
+    for i in prange(N):
+        up = i - 1 if i > 0 else N - 1
+        down = i + 1 if i < N - 1 else 0
+        for j in range(M):
+            left = j - 1 if j > 0 else M - 1
+            right = j + 1 if j < M - 1 else 0
+            cnt = (grid[up, left] + grid[up, j] + grid[up, right] +
+                   grid[i, left] + grid[i, right] +
+                   grid[down, left] + grid[down, j] + grid[down, right])
+            if cnt == 3 or (cnt == 2 and grid[i, j] == 1):
+                out[i, j] = 1
+            else:
+                out[i, j] = 0
+    return out
+
+
+def simulate_life_numba(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                        seed: int = None):
+    """
+    Run a Game of Life simulation with the Numba parallel backend.
+
+    Initializes a random NxN uint8 grid like simulate_life_numpy and
+    ping-pongs between two preallocated grids.
+
+    Args:
+        N (int): Grid dimension (N × N).
+        timesteps (int): Number of generations to simulate.
+        p_alive (float): Probability that a cell starts alive.
+        record_history (bool): If True, collect each generation in a list.
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+
+    Returns:
+        list[np.ndarray] or None: History of grids if record_history else None.
+    """
+    grid = random_board((N, N), p_alive, seed)
+    out = np.empty_like(grid)
+    history = [] if record_history else None
+    for _ in range(timesteps):
+        if record_history:
+            history.append(grid.copy())
+        life_step_numba(grid, out)
+        grid, out = out, grid
+    return history
+
+
+def run_life_numba():
+    """
+    Command‐line entry for the Numba parallel Game of Life.
+
+    Same CLI interface as run_life_numpy, uses the Numba kernel.
+    """
+    p = argparse.ArgumentParser("Game of Life (Numba)")
+    p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
+    p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
+    p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
+    p.add_argument("--seed",      type=int, default=None, help="Random seed (reproducible board)")
+    args = p.parse_args()
+
+    print(f"[Numba] Args received: {args}")
+    record = args.save_gif and args.size <= 100
+    history = simulate_life_numba(args.size, args.timesteps, record_history=record, seed=args.seed)
+
+    if args.save_gif:
+        if record and len(history) == 0:
+            print("[Numba] No generations stepped; GIF creation skipped.")
+        elif record:
+            output = Path("game_of_life_numba.gif")
+            animate_life(history, output)
+            print(f"Saved Numba GIF to {output}")
+        else:
+            print("[Numba] Problem size > 100: cannot save history or create GIF.")
+    else:
+        print("[Numba] GIF creation skipped; history not saved.")
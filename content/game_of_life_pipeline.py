@@ -0,0 +1,157 @@
+"""
+Background Rendering Pipeline for the Game of Life
+
+Writing a GIF frame, accumulating the heatmap counts or saving a checkpoint
+all take time that the simulation loop otherwise spends waiting. This module
+decouples them with a producer/consumer pipeline:
+
+  - The simulation (producer) calls RenderPipeline.put(grid) once per
+    generation. The grid is bit-packed (np.packbits, 1 bit per cell) into a
+    read-only snapshot, so the producer can keep stepping its own buffers.
+  - Each consumer runs in its own thread with its own bounded queue of
+    snapshots, unpacks them and does its work (NumPy and Pillow release the
+    GIL for the heavy parts, so the threads overlap with the simulation).
+  - When a consumer falls behind its queue fills up and put() blocks. That
+    back-pressure bounds memory to about depth snapshots per consumer, and
+    the time the producer spends blocked is reported.
+
+A consumer is any object with an append(grid) method (GifWriter,
+HistoryStore, DeltaHistory) or a plain callable taking a 2D uint8 grid; its
+close() method, if any, is called once the last snapshot has been consumed.
+Checkpoints are written by a callable consumer that passes each generation
+to a game_of_life_checkpoint.Checkpointer (see simulate_and_animate in
+game_of_life_mem_opt.py).
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import queue
+import threading
+import time
+import numpy as np
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Default number of snapshots buffered per consumer
+DEFAULT_DEPTH = 8
+
+# Queue sentinel marking the end of the stream
+_STOP = None
+
+
+class RenderPipeline:
+    """
+    Fan generations out to background consumer threads through bounded queues.
+
+    Attributes:
+        shape (tuple[int, int]): Board shape (N, M).
+        depth (int): Maximum snapshots buffered per consumer.
+        frames (int): Number of snapshots put so far.
+        blocked_sec (float): Total time put() spent waiting for full queues.
+    """
+
+    def __init__(self, shape: tuple, consumers: dict, depth: int = DEFAULT_DEPTH):
+        """
+        Start one thread per consumer.
+
+        Args:
+            shape (tuple[int, int]): Board shape (N, M).
+            consumers (dict[str, object]): Named consumers (objects with
+                append, or callables); each receives every generation as a
+                2D uint8 grid, in order.
+            depth (int): Maximum snapshots buffered per consumer.
+        """
+        self.shape = tuple(shape)
+        self.depth = depth
+        self.frames = 0
+        self.blocked_sec = 0.0
+        self.busy_sec = {name: 0.0 for name in consumers}
+        self._errors = []
+        self._queues = {name: queue.Queue(maxsize=depth) for name in consumers}
+        self._threads = [
+            threading.Thread(target=self._run, args=(name, consumer, self._queues[name]),
+                             name=f"render-{name}", daemon=True)
+            for name, consumer in consumers.items()
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _run(self, name: str, consumer, q: queue.Queue):
+        """Consumer thread: unpack and consume snapshots until the sentinel."""
+        consume = getattr(consumer, "append", consumer)
+        failed = False
+        while True:
+            packed = q.get()
+            if packed is _STOP:
+                break
+            if failed:
+                # Keep draining so the producer never blocks on a dead consumer
+                continue
+            try:
+                t0 = time.perf_counter()
+                consume(np.unpackbits(packed, axis=-1, count=self.shape[1]))
+                self.busy_sec[name] += time.perf_counter() - t0
+            except Exception as exc:
+                self._errors.append((name, exc))
+                failed = True
+        if not failed and hasattr(consumer, "close"):
+            try:
+                consumer.close()
+            except Exception as exc:
+                self._errors.append((name, exc))
+
+    def put(self, grid: np.ndarray):
+        """
+        Hand one generation to every consumer.
+
+        Blocks while any consumer's queue is full.
+
+        Args:
+            grid (np.ndarray): 2D array of 0s and 1s (not retained).
+        """
+        packed = np.packbits(np.asarray(grid, dtype=bool), axis=-1)
+        packed.setflags(write=False)
+        for q in self._queues.values():
+            try:
+                q.put_nowait(packed)
+            except queue.Full:
+                t0 = time.perf_counter()
+                q.put(packed)
+                self.blocked_sec += time.perf_counter() - t0
+        self.frames += 1
+
+    def close(self):
+        """
+        Wait for every consumer to finish and close it.
+
+        Raises:
+            RuntimeError: If any consumer raised; the first error is chained.
+        """
+        for q in self._queues.values():
+            q.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        if self._errors:
+            name, exc = self._errors[0]
+            raise RuntimeError(f"Render consumer '{name}' failed: {exc}") from exc
+
+    def report(self) -> str:
+        """
+        Summarise back-pressure and consumer busy time.
+
+        Returns:
+            str: Human-readable summary.
+        """
+        busy = ", ".join(f"{name} {sec:.2f} s" for name, sec in self.busy_sec.items())
+        return (f"{self.frames} frames, queue depth {self.depth}: simulation blocked "
+                f"{self.blocked_sec:.2f} s on back-pressure; consumer busy time: {busy}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
@@ -236,7 +236,9 @@ def run_life_numpy():
 
     history = simulate_life_numpy(args.size, args.timesteps, record_history=args.save_gif)
 
-    if args.save_gif and args.size <= 100:
+    if args.save_gif and args.size <= 100 and not history:
+        print("No generations stepped; GIF creation skipped.")
+    elif args.save_gif and args.size <= 100:
         out = Path("game_of_life_cpu.gif")
         animate_life(history, out)
         print(f"Saved CPU GIF to {out}")
@@ -276,7 +278,9 @@ def run_life_cupy():
 
     history = simulate_life_cupy(args.size, args.timesteps, record_history=args.save_gif)
 
-    if args.save_gif and args.size <= 100:
+    if args.save_gif and args.size <= 100 and not history:
+        print("No generations stepped; GIF creation skipped.")
+    elif args.save_gif and args.size <= 100:
         out = Path("game_of_life_gpu.gif")
         animate_life(history, out)
         print(f"Saved GPU GIF to {out}")
@@ -312,7 +316,9 @@ def run_life_naive():
 
     history = simulate_life_naive(args.size, args.timesteps, record_history=args.save_gif)
 
-    if args.save_gif and args.size <= 100:
+    if args.save_gif and args.size <= 100 and not history:
+        print("No generations stepped; GIF creation skipped.")
+    elif args.save_gif and args.size <= 100:
         out = Path("game_of_life_naive.gif")
         animate_life(history, out)
         print(f"Saved Naive GIF to {out}")
@@ -0,0 +1,122 @@
+"""
+Streaming Reducers for Game of Life Runs
+
+Reducers summarise a run one generation at a time, so they can consume the
+iter_life_* generators at simulation speed with memory that does not grow
+with the board history:
+
+  - Population: live-cell count of every generation.
+  - AliveHeatmap: number of generations each cell was alive.
+  - BoundingBox: smallest rectangle containing every live cell seen, plus
+    the box of the last generation.
+
+Each reducer has update(generation, grid) and a result attribute; they
+work with NumPy and CuPy grids (heatmap counts stay on the device; only
+scalars and row/column flags are copied to the host). reduce_stream()
+drives one stream through several reducers in a single pass:
+
+    pop, heat = reduce_stream(iter_life_numpy(1000, 5000, every=10),
+                              Population(), AliveHeatmap())
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import numpy as np
+
+
+class Population:
+    """
+    Live-cell count per generation.
+
+    Attributes:
+        result (tuple[np.ndarray, np.ndarray]): Generation numbers and live
+            counts (int64).
+    """
+
+    def __init__(self):
+        self._generations = []
+        self._counts = []
+
+    def update(self, generation: int, grid):
+        """Record the live-cell count of one generation."""
+        self._generations.append(generation)
+        self._counts.append(int(grid.sum()))
+
+    @property
+    def result(self) -> tuple:
+        return (np.asarray(self._generations, dtype=np.int64),
+                np.asarray(self._counts, dtype=np.int64))
+
+
+class AliveHeatmap:
+    """
+    Number of generations each cell was alive.
+
+    Attributes:
+        result (np.ndarray or None): 2D uint32 counts (on the grid's device),
+            or None before the first generation.
+    """
+
+    def __init__(self):
+        self.result = None
+
+    def update(self, generation: int, grid):
+        """Add one generation to the counts."""
+        if self.result is None:
+            self.result = grid.astype(np.uint32)
+        else:
+            self.result += grid
+
+
+class BoundingBox:
+    """
+    Bounding box of the live cells.
+
+    Boxes are (row_start, row_stop, col_start, col_stop), half-open, or None
+    when no cell is alive.
+
+    Attributes:
+        result (tuple or None): Box containing every live cell seen.
+        last (tuple or None): Box of the last generation.
+    """
+
+    def __init__(self):
+        self.result = None
+        self.last = None
+
+    def update(self, generation: int, grid):
+        """Update the boxes with one generation."""
+        row_any, col_any = grid.any(axis=1), grid.any(axis=0)
+        if hasattr(row_any, "get"):
+            # CuPy: bring only the 1D flags to the host
+            row_any, col_any = row_any.get(), col_any.get()
+        rows = np.flatnonzero(row_any)
+        if rows.size == 0:
+            self.last = None
+            return
+        cols = np.flatnonzero(col_any)
+        self.last = (int(rows[0]), int(rows[-1]) + 1, int(cols[0]), int(cols[-1]) + 1)
+        if self.result is None:
+            self.result = self.last
+        else:
+            r0, r1, c0, c1 = self.result
+            self.result = (min(r0, self.last[0]), max(r1, self.last[1]),
+                           min(c0, self.last[2]), max(c1, self.last[3]))
+
+
+def reduce_stream(stream, *reducers) -> list:
+    """
+    Feed every (generation, grid) pair of a stream to the reducers.
+
+    Args:
+        stream (Iterable[tuple[int, array]]): E.g. iter_life_numpy(...).
+        *reducers: Objects with update(generation, grid) and result.
+
+    Returns:
+        list: The result of each reducer, in order.
+    """
+    for generation, grid in stream:
+        for reducer in reducers:
+            reducer.update(generation, grid)
+    return [reducer.result for reducer in reducers]
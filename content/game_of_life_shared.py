@@ -0,0 +1,299 @@
+"""
+Shared-Memory Multi-Process Game of Life
+
+This module splits the board into horizontal strips that are stepped by
+separate worker processes, so all the cores of one node can be used on a
+grid that fits in its RAM.
+
+Both ping-pong boards live in a single multiprocessing.shared_memory block
+of shape (2, N, N + 2) uint8, with one halo column on each side. Every
+generation each worker:
+  1. Reads the one-row halos (the last row of the strip above and the first
+     row of the strip below, wrapping around) directly from shared memory.
+  2. Computes its strip of the next generation with the same separable
+     stencil and rules as life_step_numpy, into preallocated local buffers.
+  3. Refreshes its own halo columns and waits on a barrier, after which the
+     new generation is visible to every worker.
+No grid data is ever pickled; only the shared-memory name and the strip
+bounds are sent to the workers.
+
+Workers are started from a forkserver (spawn where it is unavailable)
+rather than by forking the caller: a process that has already started
+threads, such as Numba's parallel thread pool, can deadlock when forked.
+The start-up cost is paid before the timed loop.
+
+Entry points:
+- life_run_shared(): advance a toroidal grid with N workers.
+- simulate_life_shared(): same contract as simulate_life_numpy.
+- run_life_shared(): CLI entry point (--workers).
+- run_scaling_benchmark(): strong-scaling benchmark from 1 to N workers.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import csv
+import os
+import multiprocessing
+import time
+from multiprocessing.synchronize import Barrier
+from threading import BrokenBarrierError
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+import numpy as np
+
+from content.game_of_life import animate_life
+from content.game_of_life_init import random_board
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output directory for the scaling benchmark
+out_dir = "../output"
+
+# Start method for the workers: never fork a possibly multi-threaded parent
+_mp = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+
+def _strip_step(src: np.ndarray, dst: np.ndarray, r0: int, r1: int,
+                rows: np.ndarray, neighbours: np.ndarray):
+    """
+    Compute rows [r0, r1) of the next generation from a column-padded board.
+
+    Args:
+        src (np.ndarray): (N, M + 2) current board with halo columns.
+        dst (np.ndarray): (N, M + 2) board receiving the next generation.
+        r0, r1 (int): Strip row bounds.
+        rows (np.ndarray): (r1 - r0 + 2, M) uint8 work array for row sums.
+        neighbours (np.ndarray): (r1 - r0, M) uint8 work array.
+    """
+    N = src.shape[0]
+    h = r1 - r0
+    above, below = (r0 - 1) % N, r1 % N
+
+    # Horizontal 3-cell sums of the halo row above, the strip, and the halo
+    # row below
+    for out_rows, src_rows in ((rows[:1], src[above:above + 1]),
+                               (rows[1:h + 1], src[r0:r1]),
+                               (rows[h + 1:], src[below:below + 1])):
+        np.add(src_rows[:, :-2], src_rows[:, 1:-1], out=out_rows)
+        np.add(out_rows, src_rows[:, 2:], out=out_rows)
+
+    centre = src[r0:r1, 1:-1]
+    np.add(rows[:-2], rows[1:-1], out=neighbours)
+    np.add(neighbours, rows[2:], out=neighbours)
+    np.subtract(neighbours, centre, out=neighbours)
+
+    born = dst[r0:r1, 1:-1].view(np.bool_)
+    survive = rows[1:-1].view(np.bool_)
+    np.equal(neighbours, 3, out=born)
+    np.equal(neighbours, 2, out=survive)
+    np.logical_and(survive, centre.view(np.bool_), out=survive)
+    np.logical_or(born, survive, out=born)
+
+    # Toroidal halo columns for this strip
+    dst[r0:r1, 0] = dst[r0:r1, -2]
+    dst[r0:r1, -1] = dst[r0:r1, 1]
+
+
+def _worker(shm_name: str, N: int, M: int, r0: int, r1: int, timesteps: int,
+            start: Barrier, barrier: Barrier):
+    """
+    Worker process: step one strip for every generation.
+
+    Args:
+        shm_name (str): Name of the shared-memory block holding the boards.
+        N, M (int): Board shape (without halo columns).
+        r0, r1 (int): Strip row bounds owned by this worker.
+        timesteps (int): Number of generations to compute.
+        start (Barrier): Barrier shared with the parent marking the start.
+        barrier (Barrier): Per-generation barrier.
+    """
+    shm = SharedMemory(name=shm_name)
+    try:
+        boards = np.ndarray((2, N, M + 2), dtype=np.uint8, buffer=shm.buf)
+        rows = np.empty((r1 - r0 + 2, M), dtype=np.uint8)
+        neighbours = np.empty((r1 - r0, M), dtype=np.uint8)
+        start.wait()
+        for t in range(timesteps):
+            _strip_step(boards[t % 2], boards[(t + 1) % 2], r0, r1, rows, neighbours)
+            barrier.wait()
+        del boards
+    except BrokenBarrierError:
+        pass
+    except Exception:
+        barrier.abort()
+        raise
+    finally:
+        shm.close()
+
+
+def _run_strips(grid: np.ndarray, timesteps: int, workers: int, record_history: bool = False):
+    """
+    Advance a toroidal grid with strip-decomposed worker processes.
+
+    Args:
+        grid (np.ndarray): 2D array of 0s and 1s.
+        timesteps (int): Number of generations.
+        workers (int): Number of worker processes (capped at the row count).
+        record_history (bool): If True, copy out every generation.
+
+    Returns:
+        tuple[np.ndarray, list or None, float]: Final grid, history (or None)
+        and the wall-clock seconds spent stepping (excluding start-up).
+    """
+    N, M = grid.shape
+    workers = max(1, min(workers, N))
+    bounds = np.linspace(0, N, workers + 1).astype(int)
+
+    shm = SharedMemory(create=True, size=2 * N * (M + 2))
+    try:
+        boards = np.ndarray((2, N, M + 2), dtype=np.uint8, buffer=shm.buf)
+        boards[0, :, 1:-1] = grid
+        boards[0, :, 0] = boards[0, :, -2]
+        boards[0, :, -1] = boards[0, :, 1]
+
+        # The parent joins the per-generation barrier only to snapshot history
+        start = _mp.Barrier(workers + 1)
+        barrier = _mp.Barrier(workers + (1 if record_history else 0))
+        procs = [
+            _mp.Process(target=_worker,
+                    args=(shm.name, N, M, bounds[k], bounds[k + 1], timesteps, start, barrier))
+            for k in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+
+        history = [] if record_history else None
+        start.wait()
+        t0 = time.perf_counter()
+        for t in range(timesteps if record_history else 0):
+            history.append(boards[t % 2, :, 1:-1].copy())
+            barrier.wait()
+        for proc in procs:
+            proc.join()
+        elapsed = time.perf_counter() - t0
+
+        failed = [proc.exitcode for proc in procs if proc.exitcode != 0]
+        if failed:
+            raise RuntimeError(f"{len(failed)} worker process(es) failed: exit codes {failed}")
+        final = boards[timesteps % 2, :, 1:-1].copy()
+        del boards
+    finally:
+        shm.close()
+        shm.unlink()
+    return final, history, elapsed
+
+
+def life_run_shared(grid: np.ndarray, timesteps: int, workers: int = None) -> np.ndarray:
+    """
+    Advance a toroidal grid by timesteps generations using worker processes.
+
+    Gives the same result as applying life_step_numpy timesteps times.
+
+    Args:
+        grid (np.ndarray): 2D array of 0s and 1s.
+        timesteps (int): Number of generations.
+        workers (int, optional): Worker processes (default: os.cpu_count()).
+
+    Returns:
+        np.ndarray: 2D uint8 array of the final generation.
+    """
+    final, _, _ = _run_strips(grid, timesteps, workers or os.cpu_count())
+    return final
+
+
+def simulate_life_shared(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                         workers: int = None, seed: int = None):
+    """
+    Run a Game of Life simulation with the shared-memory strip backend.
+
+    Args:
+        N (int): Grid dimension (N × N).
+        timesteps (int): Number of generations to simulate.
+        p_alive (float): Probability that a cell starts alive.
+        record_history (bool): If True, collect each generation in a list.
+        workers (int, optional): Worker processes (default: os.cpu_count()).
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+
+    Returns:
+        list[np.ndarray] or None: History of grids if record_history else None.
+    """
+    grid = random_board((N, N), p_alive, seed)
+    _, history, _ = _run_strips(grid, timesteps, workers or os.cpu_count(), record_history)
+    return history
+
+
+def run_life_shared():
+    """
+    Command‐line entry for the shared-memory multi-process Game of Life.
+
+    Same CLI interface as run_life_numpy plus --workers.
+    """
+    p = argparse.ArgumentParser("Game of Life (Shared memory)")
+    p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
+    p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
+    p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
+    p.add_argument("--workers",   type=int, default=os.cpu_count(), help="Number of worker processes")
+    p.add_argument("--seed",      type=int, default=None, help="Random seed (reproducible board)")
+    args = p.parse_args()
+
+    print(f"[Shared] Args received: {args}")
+    record = args.save_gif and args.size <= 100
+    history = simulate_life_shared(args.size, args.timesteps, record_history=record, workers=args.workers,
+                                   seed=args.seed)
+
+    if args.save_gif:
+        if record and len(history) == 0:
+            print("[Shared] No generations stepped; GIF creation skipped.")
+        elif record:
+            output = Path("game_of_life_shared.gif")
+            animate_life(history, output)
+            print(f"Saved Shared GIF to {output}")
+        else:
+            print("[Shared] Problem size > 100: cannot save history or create GIF.")
+    else:
+        print("[Shared] GIF creation skipped; history not saved.")
+
+
+def run_scaling_benchmark():
+    """
+    Command-line entry for the strong-scaling benchmark.
+
+    Steps the same random board with 1, 2, 4, ... up to --max-workers
+    processes, and writes mean/std time, speedup and parallel efficiency
+    per worker count to a CSV in ../output.
+    """
+    p = argparse.ArgumentParser("Game of Life shared-memory strong scaling")
+    p.add_argument("--size",        type=int, default=4000, help="Grid dimension (N×N)")
+    p.add_argument("--timesteps",   type=int, default=100,  help="Number of generations")
+    p.add_argument("--max-workers", type=int, default=os.cpu_count(), help="Largest worker count")
+    p.add_argument("--repeats",     type=int, default=3,    help="Runs per worker count")
+    p.add_argument("--seed",        type=int, default=None, help="Random seed (reproducible board)")
+    args = p.parse_args()
+
+    counts = sorted({min(1 << k, args.max_workers) for k in range(args.max_workers.bit_length() + 1)})
+    grid = random_board((args.size, args.size), 0.2, args.seed)
+
+    os.makedirs(out_dir, exist_ok=True)
+    csv_filename = os.path.join(out_dir, f"gol_shared_scaling_N{args.size}_ts{args.timesteps}.csv")
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["workers", "grid_size", "timesteps",
+                         "mean_time_sec", "std_dev_sec", "speedup", "efficiency"])
+        baseline = None
+        for workers in counts:
+            times = [_run_strips(grid, args.timesteps, workers)[2] for _ in range(args.repeats)]
+            mean_t, std_t = np.mean(times), np.std(times)
+            baseline = mean_t if baseline is None else baseline
+            speedup = baseline / mean_t
+            writer.writerow([workers, args.size, args.timesteps,
+                             f"{mean_t:.6f}", f"{std_t:.6f}",
+                             f"{speedup:.3f}", f"{speedup / workers:.3f}"])
+            print(f"  {workers:3d} workers | {mean_t:.4f} ± {std_t:.4f} s | "
+                  f"speedup {speedup:.2f} | efficiency {speedup / workers:.2f}")
+
+    print(f"Saved CSV: {csv_filename}")
@@ -0,0 +1,189 @@
+"""
+Sparse Live-Cell Game of Life Backend
+
+This module implements a Game of Life backend whose cost scales with the
+number of live cells rather than the area of the board. Only the live cells
+are stored, as a sorted array of flat indices (i * M + j). Each step:
+  1. Shifts every live cell by the 8 neighbour offsets (toroidal wrap).
+  2. Counts how often each candidate cell was hit with np.unique.
+  3. Keeps candidates with 3 hits, or 2 hits if already alive.
+
+When the live-cell density rises above a threshold the board is converted
+to dense form and stepped with life_step_numpy_into; it is converted back
+once the density falls below half the threshold.
+
+Entry points:
+- simulate_life_sparse(): same contract as simulate_life_numpy.
+- run_life_sparse(): CLI entry point.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+from pathlib import Path
+import numpy as np
+
+from content.game_of_life import animate_life, life_step_numpy_into
+from content.game_of_life_init import random_board
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Live-cell fraction above which the dense engine is used
+DEFAULT_DENSITY_THRESHOLD = 0.05
+
+# Row/column offsets of the 8 neighbours
+OFFSETS = np.array([
+    (-1, -1), (-1, 0), (-1, 1),
+    ( 0, -1),          ( 0, 1),
+    ( 1, -1), ( 1, 0), ( 1, 1),
+])
+
+
+def dense_to_sparse(grid: np.ndarray) -> np.ndarray:
+    """
+    Convert a dense grid to sorted flat indices of its live cells.
+
+    Args:
+        grid (np.ndarray): 2D array of 0s and 1s.
+
+    Returns:
+        np.ndarray: Sorted 1D int64 array of flat indices (i * M + j).
+    """
+    return np.flatnonzero(grid).astype(np.int64)
+
+
+def sparse_to_dense(cells: np.ndarray, shape: tuple, out: np.ndarray = None) -> np.ndarray:
+    """
+    Convert flat live-cell indices back to a dense grid.
+
+    Args:
+        cells (np.ndarray): 1D array of flat indices of live cells.
+        shape (tuple[int, int]): Grid shape (N, M).
+        out (np.ndarray, optional): uint8 array of that shape to fill.
+
+    Returns:
+        np.ndarray: 2D uint8 array of 0s and 1s.
+    """
+    if out is None:
+        out = np.zeros(shape, dtype=np.uint8)
+    else:
+        out.fill(0)
+    out.reshape(-1)[cells] = 1
+    return out
+
+
+def life_step_sparse(cells: np.ndarray, shape: tuple) -> np.ndarray:
+    """
+    Compute the next generation from the sorted live-cell indices.
+
+    Applies the same toroidal rules as life_step_numpy in O(L log L) time
+    for L live cells.
+
+    Args:
+        cells (np.ndarray): Sorted 1D int64 array of live flat indices.
+        shape (tuple[int, int]): Grid shape (N, M).
+
+    Returns:
+        np.ndarray: Sorted flat indices of the next generation's live cells.
+    """
+    N, M = shape
+    rows, cols = np.divmod(cells, M)
+    neighbour_rows = (rows[None, :] + OFFSETS[:, :1]) % N
+    neighbour_cols = (cols[None, :] + OFFSETS[:, 1:]) % M
+    candidates, counts = np.unique(neighbour_rows * M + neighbour_cols, return_counts=True)
+
+    # Survivors need the candidate to be alive now: look it up in the
+    # sorted live-cell array
+    pos = np.searchsorted(cells, candidates)
+    alive = pos < cells.size
+    alive[alive] = cells[pos[alive]] == candidates[alive]
+    return candidates[(counts == 3) | (alive & (counts == 2))]
+
+
+def simulate_life_sparse(N: int, timesteps: int, p_alive: float = 0.2, record_history: bool = False,
+                         density_threshold: float = DEFAULT_DENSITY_THRESHOLD, seed: int = None):
+    """
+    Run a Game of Life simulation with the sparse live-cell backend.
+
+    Initializes a random NxN grid like simulate_life_numpy. The board is
+    stepped sparsely while its density is at most density_threshold and
+    densely (life_step_numpy_into) otherwise, converting between the two
+    forms as the density crosses the threshold.
+
+    Args:
+        N (int): Grid dimension (N × N).
+        timesteps (int): Number of generations to simulate.
+        p_alive (float): Probability that a cell starts alive.
+        record_history (bool): If True, collect each generation in a list.
+        density_threshold (float): Live fraction above which to run dense.
+        seed (int, optional): Seed for random_board (fresh entropy if None).
+
+    Returns:
+        list[np.ndarray] or None: History of grids if record_history else None.
+    """
+    shape = (N, N)
+    area = N * N
+    grid = random_board(shape, p_alive, seed)
+    cells = None
+    out = neighbours = scratch = None
+    history = [] if record_history else None
+    for _ in range(timesteps):
+        if cells is None:
+            # Dense mode
+            if grid.sum() <= density_threshold / 2 * area:
+                cells = dense_to_sparse(grid)
+        elif cells.size > density_threshold * area:
+            grid = sparse_to_dense(cells, shape, grid)
+            cells = None
+
+        if record_history:
+            history.append(grid.copy() if cells is None else sparse_to_dense(cells, shape))
+
+        if cells is None:
+            if out is None:
+                out = np.empty_like(grid)
+                neighbours = np.empty_like(grid)
+                scratch = np.empty((2,) + shape, dtype=np.uint8)
+            life_step_numpy_into(grid, out, neighbours, scratch)
+            grid, out = out, grid
+        else:
+            cells = life_step_sparse(cells, shape)
+    return history
+
+
+def run_life_sparse():
+    """
+    Command‐line entry for the sparse live-cell Game of Life.
+
+    Same CLI interface as run_life_numpy plus --p-alive and
+    --density-threshold.
+    """
+    p = argparse.ArgumentParser("Game of Life (Sparse)")
+    p.add_argument("--size",      type=int, default=100, help="Grid dimension (N×N)")
+    p.add_argument("--timesteps", type=int, default=50,  help="Number of generations")
+    p.add_argument("--save-gif",  action="store_true",   help="Save GIF animation")
+    p.add_argument("--p-alive",   type=float, default=0.2, help="Initial alive probability (0–1)")
+    p.add_argument("--density-threshold", type=float, default=DEFAULT_DENSITY_THRESHOLD,
+                   help="Live fraction above which the dense engine is used")
+    p.add_argument("--seed",      type=int, default=None, help="Random seed (reproducible board)")
+    args = p.parse_args()
+
+    print(f"[Sparse] Args received: {args}")
+    record = args.save_gif and args.size <= 100
+    history = simulate_life_sparse(args.size, args.timesteps, args.p_alive, record_history=record,
+                                   density_threshold=args.density_threshold, seed=args.seed)
+
+    if args.save_gif:
+        if record and len(history) == 0:
+            print("[Sparse] No generations stepped; GIF creation skipped.")
+        elif record:
+            output = Path("game_of_life_sparse.gif")
+            animate_life(history, output)
+            print(f"Saved Sparse GIF to {output}")
+        else:
+            print("[Sparse] Problem size > 100: cannot save history or create GIF.")
+    else:
+        print("[Sparse] GIF creation skipped; history not saved.")
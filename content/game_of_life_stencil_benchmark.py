@@ -0,0 +1,166 @@
+"""
+Benchmarking the Game of Life Neighbour-Count Stencils
+
+This script compares two ways of counting the 8 toroidal neighbours of every
+cell, for either NumPy or CuPy arrays:
+  - Roll-based: the direct 8-term sum used by life_step_numpy/life_step_gpu
+    (12 rolls and 7 full-array additions, each allocating a temporary).
+  - Separable: neighbour_count from game_of_life.py (row sums, then column
+    sums, then subtract the centre; 4 rolls and 5 additions/subtractions into
+    preallocated buffers).
+
+For each grid size it:
+  1. Times both stencils over several repeats.
+  2. Reports the modelled memory traffic per step (full-array reads/writes)
+     and, for NumPy, the peak temporary allocation measured with tracemalloc.
+  3. Writes the results to a CSV in ../output.
+"""
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Library imports
+# ─────────────────────────────────────────────────────────────────────────────
+import argparse
+import csv
+import os
+import time
+import tracemalloc
+
+import numpy as np
+import cupy as cp
+
+from content.game_of_life import neighbour_count
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Constants
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Ensure output directory exists
+out_dir = "../output"
+os.makedirs(out_dir, exist_ok=True)
+
+# Full-array passes (one read or one write of N×N elements) per step.
+# A roll reads and writes once; a binary add/subtract reads twice, writes once.
+ARRAY_PASSES = {
+    "roll": 12 * 2 + 7 * 3,
+    "separable": 4 * 2 + 5 * 3,
+}
+
+
+def roll_neighbour_count(grid, xp=np):
+    """
+    Count neighbours with the direct 8-term roll sum used by life_step_numpy.
+
+    Args:
+        grid (np.ndarray or cp.ndarray): 2D array of 0s and 1s.
+        xp (module): Array module owning grid (numpy or cupy).
+
+    Returns:
+        np.ndarray or cp.ndarray: 2D array of neighbour counts.
+    """
+    return (
+        xp.roll(xp.roll(grid, 1, axis=0), 1, axis=1) +
+        xp.roll(xp.roll(grid, 1, axis=0), -1, axis=1) +
+        xp.roll(xp.roll(grid, -1, axis=0), 1, axis=1) +
+        xp.roll(xp.roll(grid, -1, axis=0), -1, axis=1) +
+        xp.roll(grid, 1, axis=0) +
+        xp.roll(grid, -1, axis=0) +
+        xp.roll(grid, 1, axis=1) +
+        xp.roll(grid, -1, axis=1)
+    )
+
+
+def time_stencil(stencil, repeats, xp):
+    """
+    Time repeated calls of a stencil, synchronising the GPU if needed.
+
+    Args:
+        stencil (callable): Zero-argument function performing one count.
+        repeats (int): Number of timed calls.
+        xp (module): Array module in use (numpy or cupy).
+
+    Returns:
+        list[float]: Wall-clock seconds for each call.
+    """
+    stencil()  # warm-up (kernel compilation, page faults)
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        stencil()
+        if xp is cp:
+            cp.cuda.Stream.null.synchronize()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def peak_allocation(stencil):
+    """
+    Measure the peak host memory allocated by one call of a stencil.
+
+    Args:
+        stencil (callable): Zero-argument function performing one count.
+
+    Returns:
+        int: Peak traced allocation in bytes.
+    """
+    tracemalloc.start()
+    stencil()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def run_stencil_benchmark():
+    """
+    Command-line entry for the stencil benchmark.
+
+    Parses --sizes, --repeats and --backend, times both stencils for each
+    size, prints a summary and writes a CSV to ../output.
+    """
+    p = argparse.ArgumentParser("Game of Life stencil benchmark")
+    p.add_argument("--sizes",   type=int, nargs="+", default=[500, 1000, 2000, 4000],
+                   help="Grid dimensions (N×N) to benchmark")
+    p.add_argument("--repeats", type=int, default=10, help="Timed calls per stencil")
+    p.add_argument("--backend", choices=["numpy", "cupy"], default="numpy",
+                   help="Array module to benchmark")
+    args = p.parse_args()
+
+    xp = np if args.backend == "numpy" else cp
+    csv_filename = os.path.join(out_dir, f"gol_stencil_benchmark_{args.backend}.csv")
+
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "backend", "stencil", "grid_size",
+            "modelled_bytes_per_step", "peak_alloc_bytes",
+            "mean_time_sec", "std_dev_sec", "effective_gb_per_sec"
+        ])
+
+        for size in args.sizes:
+            grid = (xp.random.random((size, size)) < 0.2).astype(xp.uint8)
+            out = xp.empty_like(grid)
+            scratch = xp.empty((2, size, size), dtype=xp.uint8)
+            stencils = {
+                "roll": lambda: roll_neighbour_count(grid, xp),
+                "separable": lambda: neighbour_count(grid, xp, out, scratch),
+            }
+
+            for name, stencil in stencils.items():
+                times = time_stencil(stencil, args.repeats, xp)
+                traffic = ARRAY_PASSES[name] * grid.nbytes
+                peak = peak_allocation(stencil) if xp is np else 0
+                mean_t, std_t = np.mean(times), np.std(times)
+                writer.writerow([
+                    args.backend, name, size,
+                    traffic, peak,
+                    f"{mean_t:.6f}", f"{std_t:.6f}",
+                    f"{traffic / mean_t / 1e9:.3f}"
+                ])
+                print(f"  {name:<9} | {size:6}×{size:<6} | "
+                      f"{traffic / 1e6:9.1f} MB/step | peak alloc {peak / 1e6:8.1f} MB | "
+                      f"{mean_t * 1e3:8.3f} ± {std_t * 1e3:.3f} ms")
+
+    print(f"Saved CSV: {csv_filename}")
+
+
+if __name__ == "__main__":
+    run_stencil_benchmark()
@@ -6,11 +6,23 @@ This module implements a simple 3D temperature diffusion model using three backe
 - CuPy (GPU)
 - Pure Python nested lists
 
+All three keep only the current and next 3D (depth, lat, lon) fields,
+swap them every step and append each step to the output NetCDF file as it
+goes, so memory stays constant in the number of timesteps.
+
 Functions:
 - load_data: Load ocean temperature data from a NetCDF file.
+- NetCDFWriter: Append fields to a NetCDF file along an unlimited time axis.
 - save_to_netcdf: Save computed temperature fields back to NetCDF.
+- diffusion_step: One masked diffusion step on NumPy or CuPy arrays.
+- DiffusionOperator: The same step with the static land mask precomputed.
+- iter_diffusion: Stream the fields of a diffusion run (two buffers).
+- masked_laplacian: The masked 3D Laplacian over the interior ocean cells.
+- ImplicitDiffusion: Backward Euler / Crank-Nicolson steps solved with PCG.
+- iter_diffusion_implicit: Stream the fields of an implicit run.
 - temperature_diffusion_numpy: Run diffusion with NumPy arrays.
 - temperature_diffusion_cupy: Run diffusion on GPU via CuPy.
+- iter_diffusion_purepython: Same stream with nested Python lists.
 - temperature_diffusion_purepython: Naive pure-Python implementation.
 - run_diffusion_*: Entry points for CLI execution.
 """
@@ -24,12 +36,13 @@ import xarray as xr
 from pathlib import Path
 import argparse
 import time
-import xarray as xr
+import netCDF4
 import numpy as np
 import cupy as cp
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator, cg
 from tqdm import tqdm 
 import math
-import copy
 
 # -------------------------------------------------------------------
 # Constants
@@ -49,6 +62,26 @@ OUTPUT_FILE_NUMPY = "predicted_temperatures_numpy.nc"
 OUTPUT_FILE_CUPY = "predicted_temperatures_cupy.nc"
 OUTPUT_FILE_PUREPYTHON = "predicted_temperatures_purepython.nc"
 
+# Interior of a (depth, lat, lon) field, and its six face-neighbour slices
+_C = slice(1, -1)
+INTERIOR = (_C, _C, _C)
+NEIGHBOURS = (
+    (slice(None, -2), _C, _C), (slice(2, None), _C, _C),  # Above, below
+    (_C, slice(None, -2), _C), (_C, slice(2, None), _C),  # South, north
+    (_C, _C, slice(None, -2)), (_C, _C, slice(2, None)),  # West, east
+)
+
+# Implicit weight theta of each time-stepping scheme (0 is forward Euler)
+SCHEMES = {"explicit": 0.0, "implicit": 1.0, "crank-nicolson": 0.5}
+
+# Fused CuPy kernel for DiffusionOperator.step (compiled on first use)
+_OPERATOR_KERNEL = cp.ElementwiseKernel(
+    "T c, T a, T b, T s, T n, T w, T e, T cw, T nw",
+    "T out",
+    "out = cw * c + nw * (a + b + s + n + w + e)",
+    "diffusion_operator",
+)
+
 # -------------------------------------------------------------------
 # Data I/O functions
 # -------------------------------------------------------------------
@@ -67,148 +100,524 @@ def load_data():
     return xr.open_dataset(file_path)
 
 
-def save_to_netcdf(data, new_temperature, output_file_path, num_timesteps):
+class NetCDFWriter:
     """
-    Save a modified temperature array to a NetCDF file.
+    Append 3D temperature fields to a NetCDF file one timestep at a time.
 
-    Adjusts the temperature array to match the specified number of timesteps
-    and constructs a new xarray Dataset with the original spatial coordinates.
+    The file has an unlimited time dimension plus the depth, latitude and
+    longitude coordinates of the input dataset. Each append writes one
+    (depth, lat, lon) slice straight to disk, so the full 4D array never
+    exists in memory.
+
+    Usage:
+        with NetCDFWriter(data, "out.nc") as writer:
+            for field in fields:
+                writer.append(field)
+    """
+
+    def __init__(self, data, output_file_path):
+        """
+        Create the output file.
+
+        Args:
+            data (xr.Dataset): Original dataset containing depth, latitude,
+                longitude and thetao (for coordinates, dtype and attributes).
+            output_file_path (Path or str): Path to write the NetCDF file.
+        """
+        self.steps = 0
+        self._ds = netCDF4.Dataset(output_file_path, "w")
+        self._ds.createDimension("time", None)
+        self._time = self._ds.createVariable("time", "i8", ("time",))
+        for name in ("depth", "latitude", "longitude"):
+            values = data[name].values
+            self._ds.createDimension(name, values.size)
+            var = self._ds.createVariable(name, values.dtype, (name,))
+            var.setncatts({k: v for k, v in data[name].attrs.items() if k != "_FillValue"})
+            var[:] = values
+        shape = tuple(data[name].size for name in ("depth", "latitude", "longitude"))
+        self._thetao = self._ds.createVariable(
+            "thetao", data["thetao"].dtype, ("time", "depth", "latitude", "longitude"),
+            fill_value=np.nan, chunksizes=(1,) + shape
+        )
+        self._thetao.setncatts({k: v for k, v in data["thetao"].attrs.items() if k != "_FillValue"})
+
+    def append(self, field):
+        """
+        Write one timestep.
+
+        Args:
+            field (np.ndarray or cp.ndarray): (depth, lat, lon) temperatures;
+                CuPy arrays are copied to the host.
+        """
+        if hasattr(field, "get"):
+            field = field.get()
+        self._thetao[self.steps] = field
+        # Sequential time coordinate (1, 2, ..., num_timesteps)
+        self._time[self.steps] = self.steps + 1
+        self.steps += 1
+
+    def close(self):
+        """Close the file."""
+        self._ds.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def save_to_netcdf(data, new_temperature, output_file_path, num_timesteps):
+    """
+    Save temperature fields to a NetCDF file, one timestep at a time.
 
     Args:
         data (xr.Dataset): Original dataset containing depth, latitude, longitude.
-        new_temperature (np.ndarray): Array of shape (time, depth, lat, lon)
-            containing the updated temperatures.
+        new_temperature (Iterable[np.ndarray]): (depth, lat, lon) fields, one
+            per timestep, e.g. a (time, depth, lat, lon) array or the
+            iter_diffusion generator. Each field is written before the next
+            is requested.
         output_file_path (Path or str): Path to write the new NetCDF file.
-        num_timesteps (int): Number of timesteps to include in the output.
-    """
-    # Adjust new_temperature to have only num_timesteps or fewer
-    new_temperature = new_temperature[:num_timesteps]  # Only include the desired number of timesteps
-
-    # Generate a new time coordinate as a sequence of numbers (1, 2, ..., num_timesteps)
-    time_coord = range(1, num_timesteps + 1)
-
-    # Create a new dataset with original depth, latitude, and longitude coordinates
-    output_data = xr.Dataset(
-        {'thetao': (('time', 'depth', 'latitude', 'longitude'), new_temperature)},
-        coords={
-            'time': time_coord,  # Sequential time coordinate
-            'depth': data['depth'].values,  # Use original depth coordinates
-            'latitude': data['latitude'].values,  # Use original latitude coordinates
-            'longitude': data['longitude'].values  # Use original longitude coordinates
-        },
-    )
-    output_data.to_netcdf(output_file_path, engine='netcdf4')
+        num_timesteps (int): Maximum number of timesteps to write.
+    """
+    with NetCDFWriter(data, output_file_path) as writer:
+        for _, field in zip(range(num_timesteps), new_temperature):
+            writer.append(field)
 
 # -------------------------------------------------------------------
 # Diffusion model implementations
 # -------------------------------------------------------------------
 
-# Temperature diffusion function using NumPy with masking for boundaries
-def temperature_diffusion_numpy(data, num_timesteps, diffusion_coeff=0.1):
+def diffusion_step(temperature, out, mask, diffusion_coeff, xp=np):
+    """
+    Apply one masked diffusion step to the interior of a 3D field.
+
+    Each interior ocean cell moves towards the mean of its ocean face
+    neighbours: T + k * (sum(T_n) - n * T) / n over the n valid neighbours
+    (no flux into land). Land cells and the outer faces are left as they are
+    in out, so out only needs to be initialised once.
+
+    Args:
+        temperature (np.ndarray or cp.ndarray): (depth, lat, lon) field.
+        out (np.ndarray or cp.ndarray): Output field, same shape.
+        mask (np.ndarray or cp.ndarray): True for ocean cells.
+        diffusion_coeff (float): Diffusion coefficient.
+        xp (module): Array module owning the arrays (numpy or cupy).
+
+    Returns:
+        np.ndarray or cp.ndarray: out.
+    """
+    centre = temperature[INTERIOR]
+    neighbor_sum = xp.zeros_like(centre)
+    neighbor_count = xp.zeros_like(centre)
+    for nb in NEIGHBOURS:
+        neighbor_sum += xp.where(mask[nb], temperature[nb], 0)
+        neighbor_count += mask[nb]
+    out[INTERIOR] = xp.where(
+        mask[INTERIOR],
+        centre + diffusion_coeff * (neighbor_sum - neighbor_count * centre) / xp.maximum(neighbor_count, 1),
+        centre
+    )
+    return out
+
+
+class DiffusionOperator:
+    """
+    The masked diffusion step with the static land mask precomputed.
+
+    For an interior ocean cell with n ocean neighbours diffusion_step
+    computes T + k * (sum(T_n) - n * T) / n = (1 - k) * T + (k / n) * sum(T_n).
+    The land mask never changes, so the setup computes once:
+      - neighbour_weight = k / n (the masked neighbour-count reciprocal);
+      - centre_weight = 1 - k (1 where n == 0, so isolated cells stay put);
+    with both set so that land and boundary cells keep their value. Fields
+    are stored with land filled with 0 (fill()), which makes the sum over
+    all six neighbours equal the sum over ocean neighbours. Each step is
+    then only adds and multiplies against the cached weights, with no mask
+    tests or np.where passes; on CuPy it is a single fused kernel.
+
+    Attributes:
+        mask (array): True for ocean cells.
+        centre_weight (array): Interior weight of the cell itself.
+        neighbour_weight (array): Interior weight of each ocean neighbour.
+    """
+
+    def __init__(self, mask, diffusion_coeff, xp=np, dtype=np.float32):
+        """
+        Precompute the operator from the land/ocean mask.
+
+        Args:
+            mask (array): (depth, lat, lon) bool, True for ocean cells, e.g.
+                ~np.isnan(thetao).
+            diffusion_coeff (float): Diffusion coefficient.
+            xp (module): Array module to hold the operator (numpy or cupy).
+            dtype: Floating dtype of the fields.
+        """
+        self.xp = xp
+        self.mask = xp.asarray(mask, dtype=bool)
+        count = sum(self.mask[nb].astype(np.int8) for nb in NEIGHBOURS)
+        active = self.mask[INTERIOR] & (count > 0)
+        self.neighbour_weight = xp.where(active, diffusion_coeff / xp.maximum(count, 1), 0).astype(dtype)
+        self.centre_weight = xp.where(active, 1 - diffusion_coeff, 1).astype(dtype)
+        # Multiplying by this restores NaN over land (0 * NaN = NaN)
+        self._land_nan = xp.where(self.mask, 1, np.nan).astype(dtype)
+        self._scratch = None
+
+    def fill(self, temperature):
+        """
+        Return a copy of a field with land (NaN) set to 0, ready for step().
+
+        Args:
+            temperature (array): (depth, lat, lon) field with NaN over land.
+
+        Returns:
+            array: Filled copy on the operator's device.
+        """
+        return self.xp.where(self.mask, self.xp.asarray(temperature), 0).astype(self._land_nan.dtype)
+
+    def with_land(self, field, out=None):
+        """
+        Return a filled field with NaN restored over land.
+
+        Args:
+            field (array): Field in the filled form used by step().
+            out (array, optional): Output buffer.
+
+        Returns:
+            array: Field with NaN over land.
+        """
+        return self.xp.multiply(field, self._land_nan, out=out)
+
+    def step(self, temperature, out):
+        """
+        Apply one diffusion step from temperature into out (both filled).
+
+        Boundary and land cells of out are not written, so out only needs to
+        be initialised once (e.g. as a copy of the filled initial field).
+
+        Args:
+            temperature (array): Filled (depth, lat, lon) field.
+            out (array): Output field, same shape.
+
+        Returns:
+            array: out.
+        """
+        xp = self.xp
+        if xp is not np:
+            _OPERATOR_KERNEL(temperature[INTERIOR], *(temperature[nb] for nb in NEIGHBOURS),
+                             self.centre_weight, self.neighbour_weight, out[INTERIOR])
+            return out
+        if self._scratch is None:
+            self._scratch = np.empty_like(self.neighbour_weight)
+        acc = self._scratch
+        np.add(temperature[NEIGHBOURS[0]], temperature[NEIGHBOURS[1]], out=acc)
+        for nb in NEIGHBOURS[2:]:
+            acc += temperature[nb]
+        acc *= self.neighbour_weight
+        core = out[INTERIOR]
+        np.multiply(temperature[INTERIOR], self.centre_weight, out=core)
+        core += acc
+        return out
+
+
+def iter_diffusion(temperature, num_timesteps, diffusion_coeff, xp=np, durations=None, operator=None):
+    """
+    Yield the field after each diffusion step, keeping only two buffers.
+
+    Steps with a DiffusionOperator built once from the field's NaN (land)
+    mask. The yielded array is an output buffer with NaN restored over land:
+    write it out (or copy it) before requesting the next step, which
+    overwrites it.
+
+    Args:
+        temperature (array): Initial (depth, lat, lon) field (not modified).
+        num_timesteps (int): Number of steps.
+        diffusion_coeff (float): Diffusion coefficient.
+        xp (module): Array module to run on (numpy or cupy).
+        durations (list, optional): If given, the compute time of each step
+            (excluding whatever the consumer does) is appended to it.
+        operator (DiffusionOperator, optional): Prebuilt operator for this
+            field's mask (e.g. to time its setup separately); built from the
+            arguments if None.
+
+    Yields:
+        np.ndarray or cp.ndarray: The field after 1, 2, ..., num_timesteps steps.
+    """
+    temperature = xp.asarray(temperature)
+    if operator is None:
+        # Mask: True for ocean points, False for NaN regions (land)
+        operator = DiffusionOperator(~xp.isnan(temperature), diffusion_coeff, xp, temperature.dtype)
+    current = operator.fill(temperature)
+    nxt = current.copy()
+    output = xp.empty_like(current)
+    for _ in range(num_timesteps):
+        start_time = time.time()
+        operator.step(current, nxt)
+        if xp is not np:
+            xp.cuda.Stream.null.synchronize()  # Wait for the GPU computation to complete
+        if durations is not None:
+            durations.append(time.time() - start_time)
+        current, nxt = nxt, current
+        yield operator.with_land(current, output)
+
+
+def masked_laplacian(temperature):
+    """
+    Build the masked 3D Laplacian of the diffusion model.
+
+    The unknowns are the interior ocean cells with at least one ocean
+    neighbour, numbered in C order. Ocean cells on the outer faces are
+    fixed: the explicit step never changes them. For the unknowns the model
+    is D dT/dt = k * (F - L T), with L = D - A the graph Laplacian between
+    unknowns (D the ocean-neighbour counts, A the adjacency) and F the sum
+    of each unknown's fixed neighbours; the steady state solves L T = F.
+
+    Args:
+        temperature (np.ndarray): (depth, lat, lon) field, NaN over land.
+
+    Returns:
+        tuple[np.ndarray, sp.csr_matrix, np.ndarray]: Grid mask of the
+        unknowns, the (n, n) Laplacian L and the (n,) fixed-neighbour sums F.
+    """
+    temperature = np.asarray(temperature)
+    mask = ~np.isnan(temperature)
+    count = sum(mask[nb].astype(np.int8) for nb in NEIGHBOURS)
+    inner = mask[INTERIOR] & (count > 0)
+    active = np.zeros(mask.shape, dtype=bool)
+    active[INTERIOR] = inner
+
+    # Number the unknowns (interior ocean cells with ocean neighbours)
+    n = int(inner.sum())
+    index = np.full(mask.shape, -1, dtype=np.int64)
+    index[active] = np.arange(n)
+    centre = index[INTERIOR]
+    values = np.where(mask, temperature, 0).astype(np.float64)
+
+    degree = np.zeros(n)
+    degree[centre[inner]] = count[inner]
+    fixed = np.zeros(n)
+    rows, cols = [], []
+    for nb in NEIGHBOURS:
+        link = inner & mask[nb]
+        to_active = link & active[nb]
+        rows.append(centre[to_active])
+        cols.append(index[nb][to_active])
+        # Each cell has one neighbour per direction, so no repeated indices
+        to_fixed = link & ~active[nb]
+        fixed[centre[to_fixed]] += values[nb][to_fixed]
+    rows, cols = np.concatenate(rows), np.concatenate(cols)
+    adjacency = sp.csr_matrix((np.ones(rows.size), (rows, cols)), shape=(n, n))
+    return active, (sp.diags(degree) - adjacency).tocsr(), fixed
+
+
+class ImplicitDiffusion:
+    """
+    Implicit time integrator for the masked diffusion model.
+
+    The explicit step T + k * (sum(T_n) - n * T) / n is forward Euler with a
+    unit timestep for D dT/dt = k * (A T - D T), where A is the ocean
+    adjacency and D the ocean-neighbour counts (the masked 3D Laplacian).
+    The theta method with timestep dt solves, for the interior ocean cells,
+
+        (D + theta * k * dt * L) T' = (D - (1 - theta) * k * dt * L) T + k * dt * F
+
+    where L = D - A is the symmetric positive definite graph Laplacian and F
+    the sum of each cell's fixed neighbours (ocean cells on the outer faces,
+    which keep their value as in the explicit model). theta = 1 is backward
+    Euler and theta = 0.5 Crank-Nicolson; both are stable for any dt, so
+    the same simulated time needs dt times fewer steps.
+
+    Each step is a Jacobi-preconditioned conjugate-gradient solve, warm
+    started from the previous field.
+
+    Attributes:
+        iterations (list[int]): CG iterations of each step.
+        residuals (list[float]): Relative residual ||b - M T'|| / ||b|| of
+            each step.
+    """
+
+    def __init__(self, temperature, diffusion_coeff, dt=10.0, theta=1.0, rtol=1e-6, maxiter=1000):
+        """
+        Build the system matrices from the initial field.
+
+        Args:
+            temperature (np.ndarray): Initial (depth, lat, lon) field, NaN
+                over land.
+            diffusion_coeff (float): Diffusion coefficient (per unit of dt).
+            dt (float): Timestep, in units of one explicit step.
+            theta (float): Implicit weight (1 backward Euler, 0.5 Crank-Nicolson).
+            rtol (float): Relative residual at which each CG solve stops.
+            maxiter (int): Maximum CG iterations per step.
+        """
+        temperature = np.asarray(temperature)
+        active, laplacian, fixed = masked_laplacian(temperature)
+        self.cells = np.flatnonzero(active)
+        n = self.cells.size
+        degree = laplacian.diagonal()
+
+        c = diffusion_coeff * dt
+        self.lhs = (sp.diags(degree) + theta * c * laplacian).tocsr()
+        self.rhs = (sp.diags(degree) - (1 - theta) * c * laplacian).tocsr()
+        self.source = c * fixed
+        inverse_diagonal = 1 / self.lhs.diagonal()
+        self.preconditioner = LinearOperator((n, n), matvec=lambda r: inverse_diagonal * r.ravel(),
+                                             dtype=np.float64)
+        self.rtol = rtol
+        self.maxiter = maxiter
+        self.state = temperature.reshape(-1)[self.cells].astype(np.float64)
+        # Land stays NaN and the fixed cells keep their value
+        self._output = temperature.copy()
+        self.iterations = []
+        self.residuals = []
+
+    def step(self):
+        """
+        Advance one timestep.
+
+        Returns:
+            tuple[int, float]: CG iterations and relative residual.
+
+        Raises:
+            RuntimeError: If CG does not converge within maxiter iterations.
+        """
+        b = self.rhs @ self.state + self.source
+        iterations = 0
+
+        def count(_):
+            nonlocal iterations
+            iterations += 1
+
+        x, info = cg(self.lhs, b, x0=self.state, rtol=self.rtol, maxiter=self.maxiter,
+                     M=self.preconditioner, callback=count)
+        if info > 0:
+            raise RuntimeError(f"CG did not converge in {self.maxiter} iterations")
+        residual = float(np.linalg.norm(b - self.lhs @ x) / max(np.linalg.norm(b), np.finfo(float).tiny))
+        self.state = x
+        self.iterations.append(iterations)
+        self.residuals.append(residual)
+        return iterations, residual
+
+    def field(self):
+        """
+        Return the current field on the (depth, lat, lon) grid.
+
+        The array is a single buffer overwritten by each call.
+
+        Returns:
+            np.ndarray: Field in the initial dtype, NaN over land.
+        """
+        self._output.reshape(-1)[self.cells] = self.state
+        return self._output
+
+
+def iter_diffusion_implicit(temperature, num_timesteps, diffusion_coeff, dt=10.0, theta=1.0,
+                            durations=None, solver=None):
+    """
+    Yield the field after each implicit diffusion step.
+
+    Args:
+        temperature (np.ndarray): Initial (depth, lat, lon) field (not modified).
+        num_timesteps (int): Number of steps of size dt.
+        diffusion_coeff (float): Diffusion coefficient.
+        dt (float): Timestep, in units of one explicit step.
+        theta (float): Implicit weight (1 backward Euler, 0.5 Crank-Nicolson).
+        durations (list, optional): If given, the compute time of each step
+            is appended to it.
+        solver (ImplicitDiffusion, optional): Prebuilt solver (e.g. to read
+            its iterations and residuals); built from the arguments if None.
+
+    Yields:
+        np.ndarray: The field after 1, 2, ..., num_timesteps steps.
+    """
+    if solver is None:
+        solver = ImplicitDiffusion(temperature, diffusion_coeff, dt, theta)
+    for _ in range(num_timesteps):
+        start_time = time.time()
+        solver.step()
+        if durations is not None:
+            durations.append(time.time() - start_time)
+        yield solver.field()
+
+
+def temperature_diffusion_numpy(data, num_timesteps, diffusion_coeff=0.1, scheme="explicit", dt=1.0):
     """
     Simulate temperature diffusion over time using NumPy arrays.
 
     A simple 3D diffusion stencil is applied across the ocean grid,
-    with NaN regions (land) masked out.
+    with NaN regions (land) masked out. The explicit scheme is forward Euler
+    (stable only for diffusion_coeff * dt <= 1); "implicit" (backward Euler)
+    and "crank-nicolson" solve each step with ImplicitDiffusion, so large dt
+    reach the same simulated time (num_timesteps * dt) in fewer steps.
 
     Args:
         data (xr.Dataset): Input dataset containing the 'thetao' variable.
         num_timesteps (int): Number of timesteps to simulate.
         diffusion_coeff (float, optional): Diffusion coefficient. Defaults to 0.1.
+        scheme (str, optional): "explicit", "implicit" or "crank-nicolson".
+        dt (float, optional): Timestep, in units of the original explicit step.
+
+    Raises:
+        ValueError: If the explicit scheme would be unstable.
 
     Side effects:
-        - Saves the resulting temperature field to a NetCDF file (OUTPUT_FILE_NUMPY).
-        - Prints timing statistics to stdout.
+        - Streams each timestep to a NetCDF file (OUTPUT_FILE_NUMPY).
+        - Prints timing statistics (and CG iterations and residuals per
+          step for the implicit schemes) to stdout.
     """
-    temperature = np.asarray(data['thetao'].values)  # Convert to a NumPy array
-    temperature = temperature[0:1, :, :, :]
-    temperature = np.tile(temperature, (num_timesteps, 1, 1, 1))
-    
-    mask = ~np.isnan(temperature)  # Mask: True for ocean points, False for NaN regions (land)
-    new_temperature = np.copy(temperature)
+    theta = SCHEMES[scheme]
+    if theta == 0 and diffusion_coeff * dt > 1:
+        raise ValueError(f"Explicit scheme is unstable for diffusion_coeff * dt = {diffusion_coeff * dt:g} > 1; "
+                         "use an implicit scheme")
+    temperature = np.asarray(data['thetao'].isel(time=0).values)  # Initial (depth, lat, lon) field
     timestep_durations = []
 
-    # Extract the first timestamp and create a new time coordinate for the predicted timesteps
-    original_time = data['time'].values
-    time_coord = np.array([original_time[0] + np.timedelta64(i, 'D') for i in range(num_timesteps)])
-
-    # Run the diffusion model
-    for t in tqdm(range(num_timesteps), desc="NumPy Diffusion Progress"):
-        start_time = time.time()
-
-        # Apply diffusion calculation with mask-based boundary handling
-        temp_copy = temperature[1:-1, 1:-1, 1:-1]  # Core section without boundaries
-        neighbor_sum = np.zeros_like(temp_copy)
-        neighbor_count = np.zeros_like(temp_copy)
-
-        # Sum available neighbors and count them only for valid ocean points
-        if mask[:-2, 1:-1, 1:-1].any():  # Front
-            neighbor_sum += np.where(mask[:-2, 1:-1, 1:-1], temperature[:-2, 1:-1, 1:-1], 0)
-            neighbor_count += mask[:-2, 1:-1, 1:-1]
-
-        if mask[2:, 1:-1, 1:-1].any():  # Back
-            neighbor_sum += np.where(mask[2:, 1:-1, 1:-1], temperature[2:, 1:-1, 1:-1], 0)
-            neighbor_count += mask[2:, 1:-1, 1:-1]
-
-        if mask[1:-1, :-2, 1:-1].any():  # Left
-            neighbor_sum += np.where(mask[1:-1, :-2, 1:-1], temperature[1:-1, :-2, 1:-1], 0)
-            neighbor_count += mask[1:-1, :-2, 1:-1]
-
-        if mask[1:-1, 2:, 1:-1].any():  # Right
-            neighbor_sum += np.where(mask[1:-1, 2:, 1:-1], temperature[1:-1, 2:, 1:-1], 0)
-            neighbor_count += mask[1:-1, 2:, 1:-1]
-
-        if mask[1:-1, 1:-1, :-2].any():  # Bottom
-            neighbor_sum += np.where(mask[1:-1, 1:-1, :-2], temperature[1:-1, 1:-1, :-2], 0)
-            neighbor_count += mask[1:-1, 1:-1, :-2]
-
-        if mask[1:-1, 1:-1, 2:].any():  # Top
-            neighbor_sum += np.where(mask[1:-1, 1:-1, 2:], temperature[1:-1, 1:-1, 2:], 0)
-            neighbor_count += mask[1:-1, 1:-1, 2:]
-
-        # Apply diffusion to valid points only, avoiding NaN regions
-        new_temperature[1:-1, 1:-1, 1:-1] = np.where(
-            mask[1:-1, 1:-1, 1:-1],
-            temp_copy + diffusion_coeff * (neighbor_sum - 6 * temp_copy) / np.maximum(neighbor_count, 1),
-            temperature[1:-1, 1:-1, 1:-1]
-        )
-
-        timestep_durations.append(time.time() - start_time)
-        temperature = new_temperature
-        
-    # Convert to final temperature and save
-    final_temperature = new_temperature
-    
-    # Save to NetCDF (assuming you have a `save_to_netcdf` function defined)
-    save_to_netcdf(data, final_temperature, DATA_DIR / OUTPUT_FILE_NUMPY, num_timesteps)
-
+    # Run the diffusion model, writing each step as soon as it is computed
+    solver = None
+    if theta == 0:
+        fields = iter_diffusion(temperature, num_timesteps, diffusion_coeff * dt, np, timestep_durations)
+    else:
+        solver = ImplicitDiffusion(temperature, diffusion_coeff, dt, theta)
+        fields = iter_diffusion_implicit(temperature, num_timesteps, diffusion_coeff, dt, theta,
+                                         timestep_durations, solver)
+    save_to_netcdf(data, tqdm(fields, total=num_timesteps, desc="NumPy Diffusion Progress"),
+                   DATA_DIR / OUTPUT_FILE_NUMPY, num_timesteps)
+
+    if solver is not None:
+        print(f"{'Step':>6} {'CG iterations':>14} {'Residual':>10}")
+        for step, (iterations, residual) in enumerate(zip(solver.iterations, solver.residuals), 1):
+            print(f"{step:>6} {iterations:>14} {residual:>10.2e}")
     avg_time_per_timestep = sum(timestep_durations) / num_timesteps
-    print(f"NumPy model completed in {sum(timestep_durations):.4f} seconds. "
+    print(f"NumPy model ({scheme}, dt={dt:g}) completed in {sum(timestep_durations):.4f} seconds. "
           f"Average time per timestep: {avg_time_per_timestep:.4f} seconds.")
 
 
-    
 def run_diffusion_numpy():
     """
     Entry point for running the NumPy diffusion model via command line.
 
-    Parses --num_timesteps and invokes temperature_diffusion_numpy().
+    Parses --num_timesteps, --scheme and --dt and invokes
+    temperature_diffusion_numpy().
     """
     parser = argparse.ArgumentParser(description="Run 3D Diffusion Model with Numpy")
     parser.add_argument("--num_timesteps", type=int, default=300, help="Number of Timesteps to run for")
+    parser.add_argument("--scheme", choices=SCHEMES, default="explicit",
+                        help="Time stepping: explicit, implicit (backward Euler) or crank-nicolson")
+    parser.add_argument("--dt", type=float, default=1.0,
+                        help="Timestep in units of the explicit step (e.g. 10-100 with --scheme implicit)")
 
     args = parser.parse_args()
 
     # Pass parsed arguments to visualisation_slice
-    temperature_diffusion_numpy(data=load_data(), num_timesteps=args.num_timesteps)
+    temperature_diffusion_numpy(data=load_data(), num_timesteps=args.num_timesteps,
+                                scheme=args.scheme, dt=args.dt)
 
 # # Temperature diffusion function using CuPy with masking for boundaries
 def temperature_diffusion_cupy(data, num_timesteps, diffusion_coeff=0.5):
     """
     Simulate temperature diffusion over time using CuPy (GPU acceleration).
 
-    Similar stencil as the NumPy version, but runs on the GPU.
-    Data is converted back to NumPy before saving.
+    Same stencil as the NumPy version, but runs on the GPU. Each step is
+    copied back to the host as it is written.
 
     Args:
         data (xr.Dataset): Input dataset containing 'thetao'.
@@ -216,72 +625,16 @@ def temperature_diffusion_cupy(data, num_timesteps, diffusion_coeff=0.5):
         diffusion_coeff (float, optional): Diffusion coefficient. Defaults to 0.5.
 
     Side effects:
-        - Saves the resulting field to a NetCDF file (OUTPUT_FILE_CUPY).
+        - Streams each timestep to a NetCDF file (OUTPUT_FILE_CUPY).
         - Prints timing statistics.
     """
-    temperature = cp.asarray(data['thetao'].values)  # Convert to a CuPy array
-    temperature = temperature[0:1, :, :, :]
-    temperature = np.tile(temperature, (num_timesteps, 1, 1, 1))
-
-    mask = ~cp.isnan(temperature)  # Mask: True for ocean points, False for NaN regions (land)
-    new_temperature = cp.copy(temperature)
+    temperature = cp.asarray(data['thetao'].isel(time=0).values)  # Initial (depth, lat, lon) field
     timestep_durations = []
 
-    # Extract the first timestamp and create a new time coordinate for the predicted timesteps
-    original_time = data['time'].values
-    time_coord = np.array([original_time[0] + np.timedelta64(i, 'D') for i in range(num_timesteps)])
-
-    # Run the diffusion model
-    for t in tqdm(range(num_timesteps), desc="CuPy Diffusion Progress"):
-        start_time = time.time()
-
-        # Apply diffusion calculation with mask-based boundary handling
-        temp_copy = temperature[1:-1, 1:-1, 1:-1]  # Core section without boundaries
-        neighbor_sum = cp.zeros_like(temp_copy)
-        neighbor_count = cp.zeros_like(temp_copy)
-
-        # Sum available neighbors and count them only for valid ocean points
-        if mask[:-2, 1:-1, 1:-1].any():  # Front
-            neighbor_sum += cp.where(mask[:-2, 1:-1, 1:-1], temperature[:-2, 1:-1, 1:-1], 0)
-            neighbor_count += mask[:-2, 1:-1, 1:-1]
-
-        if mask[2:, 1:-1, 1:-1].any():  # Back
-            neighbor_sum += cp.where(mask[2:, 1:-1, 1:-1], temperature[2:, 1:-1, 1:-1], 0)
-            neighbor_count += mask[2:, 1:-1, 1:-1]
-
-        if mask[1:-1, :-2, 1:-1].any():  # Left
-            neighbor_sum += cp.where(mask[1:-1, :-2, 1:-1], temperature[1:-1, :-2, 1:-1], 0)
-            neighbor_count += mask[1:-1, :-2, 1:-1]
-
-        if mask[1:-1, 2:, 1:-1].any():  # Right
-            neighbor_sum += cp.where(mask[1:-1, 2:, 1:-1], temperature[1:-1, 2:, 1:-1], 0)
-            neighbor_count += mask[1:-1, 2:, 1:-1]
-
-        if mask[1:-1, 1:-1, :-2].any():  # Bottom
-            neighbor_sum += cp.where(mask[1:-1, 1:-1, :-2], temperature[1:-1, 1:-1, :-2], 0)
-            neighbor_count += mask[1:-1, 1:-1, :-2]
-
-        if mask[1:-1, 1:-1, 2:].any():  # Top
-            neighbor_sum += cp.where(mask[1:-1, 1:-1, 2:], temperature[1:-1, 1:-1, 2:], 0)
-            neighbor_count += mask[1:-1, 1:-1, 2:]
-
-        # Apply diffusion to valid points only, avoiding NaN regions
-        new_temperature[1:-1, 1:-1, 1:-1] = cp.where(
-            mask[1:-1, 1:-1, 1:-1],
-            temp_copy + diffusion_coeff * (neighbor_sum - 6 * temp_copy) / cp.maximum(neighbor_count, 1),
-            temperature[1:-1, 1:-1, 1:-1]
-        )
-
-        cp.cuda.Stream.null.synchronize()  # Wait for the GPU computation to complete
-        timestep_durations.append(time.time() - start_time)
-        temperature = new_temperature
-
-        
-    # Convert back to NumPy and save
-    final_temperature = cp.asnumpy(new_temperature)
-
-
-    save_to_netcdf(data, final_temperature, DATA_DIR / OUTPUT_FILE_CUPY, num_timesteps)
+    # Run the diffusion model, writing each step as soon as it is computed
+    fields = iter_diffusion(temperature, num_timesteps, diffusion_coeff, cp, timestep_durations)
+    save_to_netcdf(data, tqdm(fields, total=num_timesteps, desc="CuPy Diffusion Progress"),
+                   DATA_DIR / OUTPUT_FILE_CUPY, num_timesteps)
 
     avg_time_per_timestep = sum(timestep_durations) / num_timesteps
     print(f"CuPy model completed in {sum(timestep_durations):.4f} seconds. "
@@ -303,67 +656,45 @@ def run_diffusion_cupy():
     temperature_diffusion_cupy(data=load_data(), num_timesteps=args.num_timesteps)
 
 
-def temperature_diffusion_purepython(data, num_timesteps, diffusion_coeff=0.1):
+def iter_diffusion_purepython(initial, num_timesteps, diffusion_coeff, durations=None):
     """
-    Simulate temperature diffusion using pure Python nested loops and lists.
+    Yield the field after each diffusion step, using nested Python lists.
 
-    This implementation is the simplest (and slowest), building Python lists
-    and manually iterating over every grid cell.
+    Keeps only the current and next (depth, lat, lon) fields as lists and
+    swaps them every step.
 
     Args:
-        data (xr.Dataset): Dataset containing 'thetao'.
-        num_timesteps (int): Number of timesteps to simulate.
-        diffusion_coeff (float, optional): Diffusion coefficient. Defaults to 0.1.
-
-    Side effects:
-        - Saves the resulting field to a NetCDF file (OUTPUT_FILE_PUREPYTHON).
-        - Prints timing statistics.
+        initial (np.ndarray): Initial (depth, lat, lon) field.
+        num_timesteps (int): Number of steps.
+        diffusion_coeff (float): Diffusion coefficient.
+        durations (list, optional): If given, the compute time of each step
+            is appended to it.
+
+    Yields:
+        np.ndarray: The field after 1, 2, ..., num_timesteps steps.
     """
-    # Pull raw array and get dims
-    raw = data['thetao'].values              # shape (time, depth, lat, lon)
-    depth, lat, lon = raw.shape[1], raw.shape[2], raw.shape[3]
+    depth, lat, lon = initial.shape
 
-    # Initial snapshot at t=0, as Python lists
-    initial = raw[0]                         # shape (depth, lat, lon)
-    temperature = []
-    for _ in range(num_timesteps):
-        # deep copy initial for each timestep
-        plane = []
-        for d in range(depth):
-            plane.append([ [ float(initial[d][i][j]) for j in range(lon) ]
-                           for i in range(lat) ])
-        temperature.append(plane)
-
-    # Summary stats (very slow!)
-    flat = []
-    for t in range(num_timesteps):
-        for d in range(depth):
-            for i in range(lat):
-                for j in range(lon):
-                    v = temperature[t][d][i][j]
-                    if not math.isnan(v):
-                        flat.append(v)
-    flat_sorted = sorted(flat)
+    # Initial snapshot as Python lists, plus the buffer for the next step
+    temperature = [[[float(initial[d][i][j]) for j in range(lon)]
+                    for i in range(lat)]
+                   for d in range(depth)]
+    new_temperature = [[row[:] for row in plane] for plane in temperature]
 
     # Precompute mask of valid ocean points
-    mask = [[[ [ not math.isnan(temperature[t][d][i][j])
-                 for j in range(lon) ]
-               for i in range(lat) ]
-             for d in range(depth) ]
-           for t in range(num_timesteps)]
-
-    # Prepare output buffer
-    new_temperature = copy.deepcopy(temperature)
-    timestep_durations = []
+    mask = [[[not math.isnan(temperature[d][i][j])
+              for j in range(lon)]
+             for i in range(lat)]
+            for d in range(depth)]
 
     # Diffusion loop
-    for t in range(num_timesteps):
+    for _ in range(num_timesteps):
         start = time.time()
         for d in range(1, depth-1):
             for i in range(1, lat-1):
                 for j in range(1, lon-1):
-                    if mask[t][d][i][j]:
-                        center = temperature[t][d][i][j]
+                    if mask[d][i][j]:
+                        center = temperature[d][i][j]
                         total = 0.0
                         count = 0
                         # 6 neighbors
@@ -372,24 +703,44 @@ def temperature_diffusion_purepython(data, num_timesteps, diffusion_coeff=0.1):
                             (d,i-1,j), (d,i+1,j),
                             (d,i,j-1), (d,i,j+1)
                         ):
-                            if mask[t][dd][ii][jj]:
-                                total += temperature[t][dd][ii][jj]
+                            if mask[dd][ii][jj]:
+                                total += temperature[dd][ii][jj]
                                 count += 1
                         # apply diffusion
                         if count > 0:
                             delta = diffusion_coeff * (total - count*center) / count
                         else:
                             delta = 0.0
-                        new_temperature[t][d][i][j] = center + delta
-        timestep_durations.append(time.time() - start)
-        # copy new → temperature for next step
-        temperature[t] = copy.deepcopy(new_temperature[t])
+                        new_temperature[d][i][j] = center + delta
+        if durations is not None:
+            durations.append(time.time() - start)
+        # swap: new → temperature for next step
+        temperature, new_temperature = new_temperature, temperature
+        yield np.array(temperature, dtype=initial.dtype)
+
+
+def temperature_diffusion_purepython(data, num_timesteps, diffusion_coeff=0.1):
+    """
+    Simulate temperature diffusion using pure Python nested loops and lists.
+
+    This implementation is the simplest (and slowest), building Python lists
+    and manually iterating over every grid cell.
+
+    Args:
+        data (xr.Dataset): Dataset containing 'thetao'.
+        num_timesteps (int): Number of timesteps to simulate.
+        diffusion_coeff (float, optional): Diffusion coefficient. Defaults to 0.1.
 
-    # Convert to NumPy array for saving
-    final = np.array(new_temperature)
+    Side effects:
+        - Streams each timestep to a NetCDF file (OUTPUT_FILE_PUREPYTHON).
+        - Prints timing statistics.
+    """
+    initial = data['thetao'].isel(time=0).values  # shape (depth, lat, lon)
+    timestep_durations = []
 
-    # Save result
-    save_to_netcdf(data, final, DATA_DIR / OUTPUT_FILE_PUREPYTHON, num_timesteps)
+    # Run and save each step as it is computed
+    fields = iter_diffusion_purepython(initial, num_timesteps, diffusion_coeff, timestep_durations)
+    save_to_netcdf(data, fields, DATA_DIR / OUTPUT_FILE_PUREPYTHON, num_timesteps)
 
     total = sum(timestep_durations)
     avg = total / num_timesteps
@@ -0,0 +1,369 @@
+"""
+Multigrid Steady-State Solver for the Ocean Temperature Field
+
+Many diffusion runs only exist to reach the equilibrium field. At steady
+state the model reduces to the linear system L T = F (see
+masked_laplacian): L is the masked 3D graph Laplacian over the interior
+ocean cells and F holds the fixed values of the outer-face ocean cells.
+This module solves it directly with geometric multigrid:
+
+  - Coarsening: each level halves depth, lat and lon (dimensions of size
+    2 or less are kept). A coarse cell is an unknown if any of its 2x2x2
+    children is, so coastlines and the sea bed follow the mask.
+  - Prolongation starts by copying each coarse value to its unknown
+    children only, and is then smoothed by one damped Jacobi sweep of the
+    fine operator (smoothed aggregation). L only couples ocean unknowns,
+    so the smoothing never spreads across land. Restriction is P^T.
+  - Coarse operators are Galerkin products P^T L P, so they respect the
+    mask without rediscretising it; the coarsest level is solved directly.
+  - Smoothing is damped Jacobi before and after each coarse correction.
+
+One V-cycle preconditions each conjugate-gradient iteration. The residual
+reduction per iteration depends on how ragged the mask is rather than on
+the grid size. Measured to a relative residual of about 1e-10:
+  - smooth coastlines (synthetic_field, 0-60% land, 12x40x44 up to
+    50x200x200): about 10x per iteration, 10-11 iterations;
+  - scattered land cells (30% random land): about 4-5x per iteration,
+    14-16 iterations on 12x40x44 and 20x100x100; with 50% random land,
+    2-3.5x.
+
+Connected ocean regions that touch no fixed cell (enclosed basins) have no
+unique steady state; they relax to the neighbour-count weighted mean of
+their initial temperatures, which the explicit model conserves, and are set
+to it directly.
+
+Entry points:
+- MultigridSolver: V-cycle hierarchy and preconditioned CG solve.
+- steady_state(): equilibrium field of a (depth, lat, lon) temperature field.
+- time_stepping_to_tolerance(): explicit steps until the same residual.
+- temperature_diffusion_steady(): solve, save and compare.
+- run_diffusion_steady(): CLI entry point.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import math
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+from content.temperature_diffusion import (DATA_DIR, iter_diffusion, load_data,
+                                           masked_laplacian, save_to_netcdf)
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output filename for the steady-state field
+OUTPUT_FILE_STEADY = "predicted_temperatures_steady.nc"
+
+# Unknowns at or below which a level is solved directly
+COARSEST_SIZE = 2000
+
+# Damped Jacobi weight and sweeps before/after each coarse correction
+JACOBI_WEIGHT = 2 / 3
+SMOOTHING_SWEEPS = 2
+
+
+def coarsen(active: np.ndarray) -> tuple:
+    """
+    Coarsen a grid of unknowns by 2 in every dimension longer than 2.
+
+    Args:
+        active (np.ndarray): (depth, lat, lon) bool, True for the unknowns
+            (numbered in C order).
+
+    Returns:
+        tuple[np.ndarray, sp.csr_matrix]: Coarse grid of unknowns and the
+        (n_fine, n_coarse) piecewise-constant (tentative) prolongation.
+    """
+    factors = [2 if size > 2 else 1 for size in active.shape]
+    coarse_shape = tuple(-(-size // f) for size, f in zip(active.shape, factors))
+    parents = tuple(axis // f for axis, f in zip(np.nonzero(active), factors))
+    coarse = np.zeros(coarse_shape, dtype=bool)
+    coarse[parents] = True
+    index = np.full(coarse_shape, -1, dtype=np.int64)
+    index[coarse] = np.arange(int(coarse.sum()))
+    n_fine = parents[0].size
+    prolongation = sp.csr_matrix((np.ones(n_fine), (np.arange(n_fine), index[parents])),
+                                 shape=(n_fine, int(coarse.sum())))
+    return coarse, prolongation
+
+
+class MultigridSolver:
+    """
+    Geometric multigrid for a masked Laplacian system L x = b.
+
+    Usage:
+        solver = MultigridSolver(laplacian, active)
+        x = solver.solve(b, tol=1e-8)
+        print(solver.report())
+
+    Attributes:
+        matrices (list[sp.csr_matrix]): Operator of each level, finest first.
+        prolongations (list[sp.csr_matrix]): Level i + 1 to level i transfers.
+        shapes (list[tuple]): Grid shape of each level.
+        residuals (list[float]): Relative residual after each iteration of
+            the last solve (the first entry is the initial residual).
+        setup_sec (float): Time spent building the hierarchy.
+        solve_sec (float): Time spent in the last solve.
+    """
+
+    def __init__(self, laplacian, active: np.ndarray):
+        """
+        Build the level hierarchy.
+
+        Args:
+            laplacian (sp.csr_matrix): Symmetric positive definite (n, n)
+                operator on the finest level.
+            active (np.ndarray): Grid mask of its n unknowns (C order).
+        """
+        t0 = time.perf_counter()
+        self.matrices = [sp.csr_matrix(laplacian)]
+        self.prolongations = []
+        self.shapes = [active.shape]
+        while self.matrices[-1].shape[0] > COARSEST_SIZE and max(active.shape) > 2:
+            active, prolongation = coarsen(active)
+            # Smooth the piecewise-constant transfer: P = (I - w D^-1 L) P0
+            fine = self.matrices[-1]
+            prolongation = (prolongation
+                            - JACOBI_WEIGHT * (sp.diags(1 / fine.diagonal()) @ fine @ prolongation)).tocsr()
+            self.prolongations.append(prolongation)
+            self.matrices.append((prolongation.T @ self.matrices[-1] @ prolongation).tocsr())
+            self.shapes.append(active.shape)
+        self._inverse_diagonals = [1 / m.diagonal() for m in self.matrices]
+        self._coarse = splu(self.matrices[-1].tocsc())
+        self.residuals = []
+        self.setup_sec = time.perf_counter() - t0
+        self.solve_sec = 0.0
+
+    def vcycle(self, b: np.ndarray, level: int = 0) -> np.ndarray:
+        """
+        Approximate L^-1 b with one V-cycle from the given level (x0 = 0).
+
+        Args:
+            b (np.ndarray): Right-hand side on that level.
+            level (int): Level index (0 is the finest).
+
+        Returns:
+            np.ndarray: Approximate solution.
+        """
+        if level == len(self.matrices) - 1:
+            return self._coarse.solve(b)
+        a, d = self.matrices[level], self._inverse_diagonals[level]
+        x = JACOBI_WEIGHT * d * b
+        for _ in range(SMOOTHING_SWEEPS - 1):
+            x += JACOBI_WEIGHT * d * (b - a @ x)
+        p = self.prolongations[level]
+        x += p @ self.vcycle(p.T @ (b - a @ x), level + 1)
+        for _ in range(SMOOTHING_SWEEPS):
+            x += JACOBI_WEIGHT * d * (b - a @ x)
+        return x
+
+    def solve(self, b: np.ndarray, x0: np.ndarray = None, tol: float = 1e-8,
+              max_iterations: int = 100) -> np.ndarray:
+        """
+        Solve L x = b by conjugate gradients preconditioned with one V-cycle.
+
+        Args:
+            b (np.ndarray): Right-hand side.
+            x0 (np.ndarray, optional): Initial guess (zero if None).
+            tol (float): Relative residual ||b - L x|| / ||b|| to stop at.
+            max_iterations (int): Maximum number of iterations (V-cycles).
+
+        Returns:
+            np.ndarray: Solution; the residual history is in self.residuals.
+        """
+        t0 = time.perf_counter()
+        a = self.matrices[0]
+        x = np.zeros_like(b) if x0 is None else x0.astype(np.float64)
+        r = b - a @ x
+        norm_b = max(np.linalg.norm(b), np.finfo(float).tiny)
+        self.residuals = [np.linalg.norm(r) / norm_b]
+        z = self.vcycle(r)
+        p = z.copy()
+        rz = r @ z
+        for _ in range(max_iterations):
+            if self.residuals[-1] <= tol:
+                break
+            ap = a @ p
+            alpha = rz / (p @ ap)
+            x += alpha * p
+            r -= alpha * ap
+            self.residuals.append(np.linalg.norm(r) / norm_b)
+            z = self.vcycle(r)
+            rz, rz_old = r @ z, rz
+            p = z + (rz / rz_old) * p
+        self.solve_sec = time.perf_counter() - t0
+        return x
+
+    def report(self) -> str:
+        """
+        Summarise the hierarchy and the convergence of the last solve.
+
+        Returns:
+            str: Human-readable summary.
+        """
+        levels = " -> ".join(f"{'x'.join(map(str, s))} ({m.shape[0]:,})"
+                             for s, m in zip(self.shapes, self.matrices))
+        history = self.residuals
+        factor = (history[-1] / history[0]) ** (1 / max(len(history) - 1, 1)) if history[0] > 0 else 0.0
+        lines = [f"Levels (unknowns): {levels}",
+                 f"{'Iteration':>9} {'Residual':>10}"]
+        lines += [f"{i:>9} {res:>10.2e}" for i, res in enumerate(history)]
+        lines.append(f"{len(history) - 1} V-cycle iterations, mean reduction {factor:.3f} per "
+                     f"iteration; setup {self.setup_sec:.3f} s, solve {self.solve_sec:.3f} s")
+        return "\n".join(lines)
+
+
+def steady_state(temperature, tol: float = 1e-8, max_iterations: int = 100) -> tuple:
+    """
+    Compute the equilibrium of the diffusion model directly.
+
+    The result does not depend on the diffusion coefficient: the fixed
+    outer-face ocean cells and land are kept from the initial field.
+
+    Args:
+        temperature (np.ndarray): Initial (depth, lat, lon) field, NaN over land.
+        tol (float): Relative residual to solve to.
+        max_iterations (int): Maximum V-cycle iterations.
+
+    Returns:
+        tuple[np.ndarray, MultigridSolver]: Steady-state field (input dtype,
+        NaN over land) and the solver (for its report).
+    """
+    temperature = np.asarray(temperature)
+    active, laplacian, fixed = masked_laplacian(temperature)
+    cells = np.flatnonzero(active)
+    initial = temperature.reshape(-1)[cells].astype(np.float64)
+
+    # Enclosed basins (no fixed neighbour) keep their weighted mean
+    _, labels = connected_components(laplacian, directed=False)
+    anchored = np.bincount(labels, weights=laplacian @ np.ones(cells.size)) > 1e-12
+    solution = np.empty(cells.size)
+    floating = ~anchored[labels]
+    if floating.any():
+        degree = laplacian.diagonal()
+        weights = np.bincount(labels, weights=degree * initial) / np.maximum(
+            np.bincount(labels, weights=degree), np.finfo(float).tiny)
+        solution[floating] = weights[labels[floating]]
+
+    # Multigrid on the anchored unknowns
+    keep = ~floating
+    sub_active = np.zeros_like(active)
+    sub_active.flat[cells[keep]] = True
+    solver = MultigridSolver(laplacian[keep][:, keep], sub_active)
+    solution[keep] = solver.solve(fixed[keep], initial[keep], tol, max_iterations)
+
+    field = temperature.copy()
+    field.reshape(-1)[cells] = solution
+    return field, solver
+
+
+def time_stepping_to_tolerance(temperature, diffusion_coeff: float = 0.1, tol: float = 1e-8,
+                               max_steps: int = 20000, check_every: int = 100) -> dict:
+    """
+    Run explicit diffusion steps until the steady-state residual reaches tol.
+
+    Steps in float64 (the same precision as the multigrid solve) and checks
+    ||F - L T|| / ||F|| every check_every steps. If max_steps is reached
+    first, the number of steps needed is extrapolated from the decay of the
+    last two residuals.
+
+    Args:
+        temperature (np.ndarray): Initial (depth, lat, lon) field.
+        diffusion_coeff (float): Diffusion coefficient of the explicit step.
+        tol (float): Relative residual to reach.
+        max_steps (int): Maximum number of steps.
+        check_every (int): Steps between residual checks.
+
+    Returns:
+        dict: steps, residual, seconds (time stepping only), converged and
+        estimated_steps.
+    """
+    temperature = np.asarray(temperature, dtype=np.float64)
+    active, laplacian, fixed = masked_laplacian(temperature)
+    cells = np.flatnonzero(active)
+    norm_f = max(np.linalg.norm(fixed), np.finfo(float).tiny)
+    durations = []
+    history = []
+    steps = 0
+    for steps, field in enumerate(iter_diffusion(temperature, max_steps, diffusion_coeff,
+                                                 np, durations), 1):
+        if steps % check_every == 0 or steps == max_steps:
+            state = field.reshape(-1)[cells]
+            history.append((steps, np.linalg.norm(fixed - laplacian @ state) / norm_f))
+            if history[-1][1] <= tol:
+                break
+    residual = history[-1][1] if history else math.nan
+    estimate = steps
+    if residual > tol and len(history) > 1 and 0 < residual < history[-2][1]:
+        (s0, r0), (s1, r1) = history[-2], history[-1]
+        estimate = int(s1 + (s1 - s0) * math.log(tol / r1) / math.log(r1 / r0))
+    return {"steps": steps, "residual": residual, "seconds": sum(durations),
+            "converged": residual <= tol, "estimated_steps": estimate}
+
+
+def temperature_diffusion_steady(data, tol=1e-8, compare=False, diffusion_coeff=0.1, max_steps=20000):
+    """
+    Compute the steady-state temperature field with multigrid and save it.
+
+    Args:
+        data (xr.Dataset): Input dataset containing the 'thetao' variable.
+        tol (float, optional): Relative residual to solve to.
+        compare (bool, optional): Also time explicit stepping to the same
+            residual.
+        diffusion_coeff (float, optional): Diffusion coefficient of the
+            explicit comparison. Defaults to 0.1.
+        max_steps (int, optional): Step limit of the explicit comparison.
+
+    Side effects:
+        - Writes the steady state as a single timestep (OUTPUT_FILE_STEADY).
+        - Prints the convergence report and timings to stdout.
+    """
+    temperature = np.asarray(data['thetao'].isel(time=0).values)  # Initial (depth, lat, lon) field
+
+    start_time = time.time()
+    field, solver = steady_state(temperature, tol)
+    total = time.time() - start_time
+    save_to_netcdf(data, [field], DATA_DIR / OUTPUT_FILE_STEADY, 1)
+
+    print(solver.report())
+    print(f"Multigrid steady state completed in {total:.4f} seconds "
+          f"(residual {solver.residuals[-1]:.2e}).")
+
+    if compare:
+        run = time_stepping_to_tolerance(temperature, diffusion_coeff, tol, max_steps)
+        if run["converged"]:
+            print(f"Explicit time stepping reached residual {run['residual']:.2e} in "
+                  f"{run['steps']} steps and {run['seconds']:.4f} seconds "
+                  f"({run['seconds'] / total:.1f}x the multigrid time).")
+        else:
+            per_step = run["seconds"] / max(run["steps"], 1)
+            print(f"Explicit time stepping reached residual {run['residual']:.2e} after "
+                  f"{run['steps']} steps ({run['seconds']:.4f} seconds); about "
+                  f"{run['estimated_steps']} steps (~{run['estimated_steps'] * per_step:.1f} seconds, "
+                  f"{run['estimated_steps'] * per_step / total:.0f}x the multigrid time) "
+                  f"would be needed for {tol:.0e}.")
+
+
+def run_diffusion_steady():
+    """
+    Entry point for the multigrid steady-state solver via command line.
+
+    Parses --tol, --compare and --max_steps and invokes
+    temperature_diffusion_steady().
+    """
+    parser = argparse.ArgumentParser(description="Solve for the steady-state temperature field with multigrid")
+    parser.add_argument("--tol", type=float, default=1e-8, help="Relative residual to solve to")
+    parser.add_argument("--compare", action="store_true",
+                        help="Also time explicit time stepping to the same residual")
+    parser.add_argument("--max_steps", type=int, default=20000, help="Step limit for --compare")
+    args = parser.parse_args()
+    temperature_diffusion_steady(data=load_data(), tol=args.tol, compare=args.compare,
+                                 max_steps=args.max_steps)
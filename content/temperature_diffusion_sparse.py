@@ -0,0 +1,287 @@
+"""
+Ocean-Only Sparse Diffusion Backend
+
+Much of the North Atlantic subset is land or below the sea bed (NaN), yet
+the dense stencil passes touch every cell. This backend numbers only the
+ocean cells and builds the masked 6-neighbour diffusion step once as a
+scipy.sparse CSR matrix A, with one row per ocean cell:
+  - interior ocean cells with n ocean neighbours: 1 - k on the diagonal
+    and k / n for each ocean neighbour (the same step as DiffusionOperator);
+  - ocean cells on the outer faces, or with no ocean neighbours: 1 on the
+    diagonal, so they keep their value.
+
+The state is a compact 1D vector of ocean temperatures, each step is a
+sparse matrix-vector product (v <- A @ v), and the vector is scattered back
+to the (depth, lat, lon) grid (NaN over land) only when a field is output.
+
+Entry points:
+- SparseDiffusionOperator: the CSR operator plus gather/scatter.
+- iter_diffusion_sparse(): same stream as iter_diffusion.
+- temperature_diffusion_sparse(): same contract as temperature_diffusion_numpy.
+- run_diffusion_sparse(): CLI entry point.
+- run_sparse_benchmark(): memory and time versus the dense NumPy path as
+  the land fraction varies.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import csv
+import os
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from tqdm import tqdm
+
+from content.temperature_diffusion import (DATA_DIR, INTERIOR, NEIGHBOURS, DiffusionOperator,
+                                           load_data, save_to_netcdf)
+from content.temperature_diffusion_synthetic import synthetic_field, time_steps
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output filename for the sparse implementation
+OUTPUT_FILE_SPARSE = "predicted_temperatures_sparse.nc"
+
+# Output directory for the benchmark CSV
+out_dir = "../output"
+
+
+class SparseDiffusionOperator:
+    """
+    The masked diffusion step as a CSR matrix over the ocean cells only.
+
+    Attributes:
+        shape (tuple[int, int, int]): (depth, lat, lon) grid shape.
+        cells (np.ndarray): Flat grid index of each ocean cell, in state order.
+        matrix (sp.csr_matrix): (n_ocean, n_ocean) step operator.
+    """
+
+    def __init__(self, mask: np.ndarray, diffusion_coeff: float, dtype=np.float32):
+        """
+        Number the ocean cells and build the operator.
+
+        Args:
+            mask (np.ndarray): (depth, lat, lon) bool, True for ocean cells.
+            diffusion_coeff (float): Diffusion coefficient.
+            dtype: Floating dtype of the state vector.
+        """
+        mask = np.asarray(mask, dtype=bool)
+        self.shape = mask.shape
+        self.cells = np.flatnonzero(mask)
+        n = self.cells.size
+
+        # State index of every ocean cell (-1 over land)
+        index = np.full(self.shape, -1, dtype=np.int64)
+        index.flat[self.cells] = np.arange(n)
+
+        count = sum(mask[nb].astype(np.int8) for nb in NEIGHBOURS)
+        active = mask[INTERIOR] & (count > 0)
+        centre = index[INTERIOR]
+
+        # Diagonal: 1 - k for active interior cells, 1 for the rest
+        diagonal = np.ones(n, dtype=dtype)
+        diagonal[centre[active]] = 1 - diffusion_coeff
+        rows, cols, values = [np.arange(n)], [np.arange(n)], [diagonal]
+        for nb in NEIGHBOURS:
+            link = active & mask[nb]
+            rows.append(centre[link])
+            cols.append(index[nb][link])
+            values.append((diffusion_coeff / count[link]).astype(dtype))
+        self.matrix = sp.csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n, n), dtype=dtype
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the operator (CSR arrays and the cell numbering)."""
+        m = self.matrix
+        return m.data.nbytes + m.indices.nbytes + m.indptr.nbytes + self.cells.nbytes
+
+    def gather(self, field: np.ndarray) -> np.ndarray:
+        """
+        Return the ocean cells of a (depth, lat, lon) field as a state vector.
+
+        Args:
+            field (np.ndarray): Field on the full grid.
+
+        Returns:
+            np.ndarray: 1D vector of the ocean values.
+        """
+        return np.ravel(field)[self.cells].astype(self.matrix.dtype)
+
+    def scatter(self, vector: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """
+        Write a state vector back to the (depth, lat, lon) grid.
+
+        Args:
+            vector (np.ndarray): 1D state vector.
+            out (np.ndarray, optional): C-contiguous output field; only its
+                ocean cells are written, so land must already be NaN. A new
+                NaN-filled field is allocated if None.
+
+        Returns:
+            np.ndarray: Field with NaN over land.
+        """
+        if out is None:
+            out = np.full(self.shape, np.nan, dtype=vector.dtype)
+        out.reshape(-1)[self.cells] = vector
+        return out
+
+    def step(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Apply one diffusion step.
+
+        Args:
+            vector (np.ndarray): 1D state vector.
+
+        Returns:
+            np.ndarray: New state vector.
+        """
+        return self.matrix @ vector
+
+
+def iter_diffusion_sparse(temperature, num_timesteps, diffusion_coeff, durations=None, operator=None):
+    """
+    Yield the field after each diffusion step, stepping the ocean-only vector.
+
+    The yielded array is a single output buffer (land NaN) that is
+    overwritten by the next step: write it out before requesting another.
+
+    Args:
+        temperature (np.ndarray): Initial (depth, lat, lon) field (not modified).
+        num_timesteps (int): Number of steps.
+        diffusion_coeff (float): Diffusion coefficient.
+        durations (list, optional): If given, the compute time of each step
+            (excluding the scatter and the consumer) is appended to it.
+        operator (SparseDiffusionOperator, optional): Prebuilt operator for
+            this field's mask; built from the arguments if None.
+
+    Yields:
+        np.ndarray: The field after 1, 2, ..., num_timesteps steps.
+    """
+    temperature = np.asarray(temperature)
+    if operator is None:
+        operator = SparseDiffusionOperator(~np.isnan(temperature), diffusion_coeff, temperature.dtype)
+    vector = operator.gather(temperature)
+    output = np.full(temperature.shape, np.nan, dtype=temperature.dtype)
+    for _ in range(num_timesteps):
+        start_time = time.time()
+        vector = operator.step(vector)
+        if durations is not None:
+            durations.append(time.time() - start_time)
+        yield operator.scatter(vector, output)
+
+
+def temperature_diffusion_sparse(data, num_timesteps, diffusion_coeff=0.1):
+    """
+    Simulate temperature diffusion over time with the ocean-only CSR operator.
+
+    Args:
+        data (xr.Dataset): Input dataset containing the 'thetao' variable.
+        num_timesteps (int): Number of timesteps to simulate.
+        diffusion_coeff (float, optional): Diffusion coefficient. Defaults to 0.1.
+
+    Side effects:
+        - Streams each timestep to a NetCDF file (OUTPUT_FILE_SPARSE).
+        - Prints timing statistics to stdout.
+    """
+    temperature = np.asarray(data['thetao'].isel(time=0).values)  # Initial (depth, lat, lon) field
+    timestep_durations = []
+
+    fields = iter_diffusion_sparse(temperature, num_timesteps, diffusion_coeff, timestep_durations)
+    save_to_netcdf(data, tqdm(fields, total=num_timesteps, desc="Sparse Diffusion Progress"),
+                   DATA_DIR / OUTPUT_FILE_SPARSE, num_timesteps)
+
+    avg_time_per_timestep = sum(timestep_durations) / num_timesteps
+    print(f"Sparse model completed in {sum(timestep_durations):.4f} seconds. "
+          f"Average time per timestep: {avg_time_per_timestep:.4f} seconds.")
+
+
+def run_diffusion_sparse():
+    """
+    Entry point for running the sparse diffusion model via command line.
+
+    Parses --num_timesteps and invokes temperature_diffusion_sparse().
+    """
+    parser = argparse.ArgumentParser(description="Run 3D Diffusion Model with a sparse ocean-only operator")
+    parser.add_argument("--num_timesteps", type=int, default=300, help="Number of Timesteps to run for")
+    args = parser.parse_args()
+    temperature_diffusion_sparse(data=load_data(), num_timesteps=args.num_timesteps)
+
+
+def run_sparse_benchmark():
+    """
+    Command-line entry for the sparse versus dense benchmark.
+
+    For synthetic fields of each land fraction, compares the dense NumPy
+    path (DiffusionOperator) and the sparse path on:
+      - memory: operator plus the two state buffers;
+      - per-step time, and for the sparse path the cost of one scatter;
+      - the largest difference after one step.
+    Results are printed and written to a CSV in ../output.
+    """
+    p = argparse.ArgumentParser("Sparse vs dense diffusion benchmark")
+    p.add_argument("--shape",   type=int, nargs=3, default=[50, 400, 400],
+                   help="Synthetic field shape (depth lat lon)")
+    p.add_argument("--land-fractions", type=float, nargs="+", default=[0.0, 0.2, 0.4, 0.6, 0.8, 0.9],
+                   help="Land fractions to sweep")
+    p.add_argument("--steps",   type=int, default=10, help="Steps per timed block")
+    p.add_argument("--repeats", type=int, default=3,  help="Timed blocks per implementation")
+    p.add_argument("--diffusion-coeff", type=float, default=0.1, help="Diffusion coefficient")
+    args = p.parse_args()
+    print(f"[Sparse] Args received: {vars(args)}")
+
+    shape = tuple(args.shape)
+    k = args.diffusion_coeff
+    os.makedirs(out_dir, exist_ok=True)
+    csv_filename = os.path.join(out_dir, "diffusion_sparse_benchmark.csv")
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "shape", "land_fraction", "ocean_cells", "dense_mb", "sparse_mb",
+            "dense_step_sec", "sparse_step_sec", "scatter_sec", "speedup", "max_abs_diff"
+        ])
+        for land in args.land_fractions:
+            field = synthetic_field(shape, land)
+            mask = ~np.isnan(field)
+
+            # Dense: operator arrays plus two filled field buffers
+            dense = DiffusionOperator(mask, k, np, field.dtype)
+            current = dense.fill(field)
+            nxt = current.copy()
+            dense_time = np.mean(time_steps(lambda: dense.step(current, nxt), args.steps, args.repeats, np))
+            dense.step(current, nxt)
+            dense_bytes = (dense.mask.nbytes + dense.centre_weight.nbytes + dense.neighbour_weight.nbytes
+                           + dense._land_nan.nbytes + dense._scratch.nbytes + current.nbytes + nxt.nbytes)
+
+            # Sparse: CSR operator plus two state vectors
+            sparse = SparseDiffusionOperator(mask, k, field.dtype)
+            vector = sparse.gather(field)
+            sparse_time = np.mean(time_steps(lambda: sparse.step(vector), args.steps, args.repeats, np))
+            stepped = sparse.step(vector)
+            sparse_bytes = sparse.nbytes + vector.nbytes + stepped.nbytes
+            output = np.full(shape, np.nan, dtype=field.dtype)
+            scatter_time = np.mean(time_steps(lambda: sparse.scatter(stepped, output), 1, args.repeats, np))
+
+            diff = float(np.nanmax(np.abs(sparse.scatter(stepped, output) - dense.with_land(nxt))))
+            writer.writerow([
+                "x".join(map(str, shape)), land, vector.size,
+                f"{dense_bytes / 1e6:.2f}", f"{sparse_bytes / 1e6:.2f}",
+                f"{dense_time:.6e}", f"{sparse_time:.6e}", f"{scatter_time:.6e}",
+                f"{dense_time / sparse_time:.2f}", f"{diff:.3e}"
+            ])
+            print(f"  land {land:4.0%} | ocean cells {vector.size:>10,} | "
+                  f"memory dense {dense_bytes / 1e6:8.1f} MB, sparse {sparse_bytes / 1e6:8.1f} MB | "
+                  f"step dense {dense_time * 1e3:8.2f} ms, sparse {sparse_time * 1e3:8.2f} ms "
+                  f"(scatter {scatter_time * 1e3:.2f} ms) | max diff {diff:.1e}")
+
+    print(f"Saved CSV: {csv_filename}")
+
+
+if __name__ == "__main__":
+    run_diffusion_sparse()
@@ -0,0 +1,118 @@
+"""
+Benchmarking the Precomputed Diffusion Operator
+
+Compares the per-step cost of two implementations of the same masked
+diffusion step from temperature_diffusion.py:
+  - Before: diffusion_step, which rebuilds the land/ocean masking every
+    step (six np.where passes, the neighbour-count sum and the division).
+  - After: DiffusionOperator.step, which only does adds and multiplies
+    against the neighbour weights and centre weights precomputed from the
+    mask (a single fused kernel on CuPy).
+
+The field is the first time slice of the model data, or a synthetic field
+with a given land fraction (--synthetic). For each backend it:
+  1. Times the operator setup once.
+  2. Times --steps steps of each implementation over several repeats.
+  3. Checks that both give the same field.
+  4. Writes the results to a CSV in ../output.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import argparse
+import csv
+import os
+import time
+
+import numpy as np
+import cupy as cp
+
+from content.temperature_diffusion import (DATA_DIR, DATA_FILE, DiffusionOperator,
+                                           diffusion_step, load_data)
+from content.temperature_diffusion_synthetic import synthetic_field, time_steps
+
+# -------------------------------------------------------------------
+# Constants
+# -------------------------------------------------------------------
+
+# Output directory for the benchmark CSV
+out_dir = "../output"
+
+
+def run_stencil_benchmark():
+    """
+    Command-line entry for the diffusion operator benchmark.
+
+    Times diffusion_step against DiffusionOperator.step on NumPy (and CuPy
+    with --gpu) and writes per-step times, the speedup, the operator setup
+    time and the largest difference between the two results to a CSV in
+    ../output.
+    """
+    p = argparse.ArgumentParser("Diffusion stencil before/after benchmark")
+    p.add_argument("--steps",     type=int, default=20, help="Steps per timed block")
+    p.add_argument("--repeats",   type=int, default=3,  help="Timed blocks per implementation")
+    p.add_argument("--synthetic", action="store_true",  help="Use a synthetic field instead of the model data")
+    p.add_argument("--shape",     type=int, nargs=3, default=[50, 400, 400],
+                   help="Synthetic field shape (depth lat lon)")
+    p.add_argument("--land-fraction", type=float, default=0.3, help="Synthetic land fraction")
+    p.add_argument("--diffusion-coeff", type=float, default=0.1, help="Diffusion coefficient")
+    p.add_argument("--gpu",       action="store_true",  help="Also benchmark the CuPy path")
+    args = p.parse_args()
+
+    if args.synthetic or not (DATA_DIR / DATA_FILE).exists():
+        print(f"[Stencil] Using a synthetic {tuple(args.shape)} field "
+              f"({args.land_fraction:.0%} land)")
+        field = synthetic_field(tuple(args.shape), args.land_fraction)
+    else:
+        field = np.asarray(load_data()["thetao"].isel(time=0).values)
+    ocean = float((~np.isnan(field)).mean())
+    shape = "x".join(map(str, field.shape))
+    k = args.diffusion_coeff
+
+    os.makedirs(out_dir, exist_ok=True)
+    csv_filename = os.path.join(out_dir, "diffusion_stencil_benchmark.csv")
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([
+            "backend", "shape", "ocean_fraction", "steps",
+            "before_step_sec", "after_step_sec", "speedup", "setup_sec", "max_abs_diff"
+        ])
+
+        for xp in ([np, cp] if args.gpu else [np]):
+            name = xp.__name__
+            temperature = xp.asarray(field)
+            mask = ~xp.isnan(temperature)
+
+            # Before: masking rebuilt every step
+            before_in, before_out = temperature.copy(), temperature.copy()
+            before = time_steps(lambda: diffusion_step(before_in, before_out, mask, k, xp),
+                                args.steps, args.repeats, xp)
+
+            # After: operator precomputed once
+            t0 = time.perf_counter()
+            operator = DiffusionOperator(mask, k, xp, temperature.dtype)
+            if xp is cp:
+                cp.cuda.Stream.null.synchronize()
+            setup = time.perf_counter() - t0
+            filled = operator.fill(temperature)
+            after_out = filled.copy()
+            after = time_steps(lambda: operator.step(filled, after_out), args.steps, args.repeats, xp)
+
+            # Same single step from the same field
+            diff = float(xp.nanmax(xp.abs(operator.with_land(after_out) - before_out)))
+            writer.writerow([
+                name, shape, f"{ocean:.4f}", args.steps,
+                f"{np.mean(before):.6e}", f"{np.mean(after):.6e}",
+                f"{np.mean(before) / np.mean(after):.2f}", f"{setup:.6f}", f"{diff:.3e}"
+            ])
+            print(f"  {name:<5} | {shape} | before {np.mean(before) * 1e3:9.3f} ms/step | "
+                  f"after {np.mean(after) * 1e3:9.3f} ms/step | "
+                  f"speedup {np.mean(before) / np.mean(after):5.2f}x | setup {setup:.3f} s | "
+                  f"max diff {diff:.1e}")
+
+    print(f"Saved CSV: {csv_filename}")
+
+
+if __name__ == "__main__":
+    run_stencil_benchmark()
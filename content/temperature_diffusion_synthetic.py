@@ -0,0 +1,77 @@
+"""
+Synthetic Fields and Step Timing for the Diffusion Benchmarks
+
+Helpers shared by the diffusion backends and their benchmarks, so that
+library modules do not import them from a benchmark script:
+- synthetic_field(): a (depth, lat, lon) field with a contiguous,
+  depth-dependent land mask of a chosen land fraction, for runs without the
+  model data.
+- time_steps(): per-step times of repeated blocks of diffusion steps, on
+  NumPy or CuPy arrays.
+
+This module needs only NumPy; CuPy is used only through the array module
+that the caller passes in.
+"""
+
+# -------------------------------------------------------------------
+# Library imports
+# -------------------------------------------------------------------
+import time
+
+import numpy as np
+
+
+def synthetic_field(shape: tuple, land_fraction: float = 0.3, seed: int = 0) -> np.ndarray:
+    """
+    Build a float32 temperature field with a smooth, depth-dependent land mask.
+
+    Land is where a smooth random "sea floor" height, plus depth, is
+    highest, so deeper levels have more land and coastlines are contiguous.
+
+    Args:
+        shape (tuple[int, int, int]): (depth, lat, lon).
+        land_fraction (float): Fraction of cells that are land (NaN).
+        seed (int): Random seed.
+
+    Returns:
+        np.ndarray: (depth, lat, lon) float32 field, NaN over land.
+    """
+    rng = np.random.default_rng(seed)
+    depth, lat, lon = shape
+    d = np.linspace(0, 1, depth)[:, None, None]
+    y = np.linspace(0, 2 * np.pi, lat)[None, :, None]
+    x = np.linspace(0, 2 * np.pi, lon)[None, None, :]
+    height = sum(np.sin(k * y + rng.uniform(0, 2 * np.pi)) * np.cos(k * x + rng.uniform(0, 2 * np.pi)) / k
+                 for k in range(1, 5))
+    score = height + 2 * d
+    temperature = (15 - 10 * d + rng.random(shape)).astype(np.float32)
+    if land_fraction > 0:
+        temperature[score >= np.quantile(score, 1 - land_fraction)] = np.nan
+    return temperature
+
+
+def time_steps(step, steps: int, repeats: int, xp=np) -> list:
+    """
+    Time repeated blocks of diffusion steps, synchronising the GPU if needed.
+
+    Args:
+        step (callable): Zero-argument function performing one step.
+        steps (int): Steps per timed block.
+        repeats (int): Number of timed blocks.
+        xp (module): Array module in use (numpy or cupy).
+
+    Returns:
+        list[float]: Seconds per step for each block.
+    """
+    # CuPy launches kernels asynchronously: wait for them before reading the clock
+    sync = xp.cuda.Stream.null.synchronize if xp is not np else (lambda: None)
+    step()  # Warm-up (kernel compilation, allocations)
+    times = []
+    for _ in range(repeats):
+        sync()
+        t0 = time.perf_counter()
+        for _ in range(steps):
+            step()
+        sync()
+        times.append((time.perf_counter() - t0) / steps)
+    return times
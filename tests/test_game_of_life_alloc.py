@@ -0,0 +1,105 @@
+"""
+Allocation tests for the NumPy Game of Life loop.
+
+simulate_life_numpy allocates two HaloGrids and the work buffers once and
+then steps with life_step_halo_into, ping-ponging between the grids. These
+tests run it under tracemalloc (NumPy reports its array allocations there)
+and check, after every generation, that the board equals a life_step_numpy
+reference and that the step neither kept any memory nor allocated a
+board-sized temporary.
+
+NumPy's ufunc iterator allocates small fixed-size buffers (a few 8192
+element buffers, about 17 kB) when it loops over strided 2D views, and
+frees them when the call returns. They do not depend on the board size, so
+the boards here are large enough for one N x N uint8 temporary to be
+several times TRANSIENT_BYTES.
+"""
+
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from content.game_of_life import life_step_numpy, simulate_life_numpy
+from content.game_of_life_halo import HaloGrid
+from content.game_of_life_init import random_board
+
+# Memory a step may still hold when it returns (Python ints and frames)
+HELD_BYTES = 1024
+
+# Transient memory a step may use: NumPy's iterator buffers, well below a
+# board (N * N bytes)
+TRANSIENT_BYTES = 64 * 1024
+
+
+class StepProbe:
+    """
+    Stand-in Checkpointer that inspects simulate_life_numpy after every step.
+
+    simulate_life_numpy draws its board through initial_board and passes the
+    board after each generation to update(). update() records the traced
+    memory the step held and the peak it reached on top of the memory at the
+    previous update, compares the board with the reference, and only then
+    takes the new baseline, so its own allocations are not counted. The
+    first generation is not measured, since the grids and work buffers are
+    allocated between initial_board and the first update().
+    """
+
+    def __init__(self, boundary: str):
+        self.boundary = boundary
+        self.reference = None
+        self.held = []
+        self.transient = []
+        self.mismatches = []
+        self._baseline = None
+
+    def initial_board(self, shape, p_alive, seed, boundary="torus"):
+        assert boundary == self.boundary
+        board = random_board(shape, p_alive, seed)
+        self.reference = board.copy()
+        return 0, board
+
+    def update(self, generation, grid):
+        current, peak = tracemalloc.get_traced_memory()
+        if self._baseline is not None:
+            self.held.append(current - self._baseline)
+            self.transient.append(peak - self._baseline)
+        if self.boundary == "torus":
+            self.reference = life_step_numpy(self.reference)
+        else:
+            self.reference = life_step_numpy(HaloGrid(self.reference, self.boundary)).to_array()
+        if not np.array_equal(grid, self.reference):
+            self.mismatches.append(generation)
+        tracemalloc.reset_peak()
+        self._baseline = tracemalloc.get_traced_memory()[0]
+
+
+@pytest.mark.parametrize("boundary", ["torus", "dead", "reflect"])
+def test_simulate_life_numpy_steps_without_allocating(boundary):
+    """Every step matches life_step_numpy, keeps no memory and makes no board-sized temporary."""
+    N, timesteps = 512, 40
+    probe = StepProbe(boundary)
+    tracemalloc.start()
+    try:
+        simulate_life_numpy(N, timesteps, boundary=boundary, seed=1, checkpointer=probe)
+    finally:
+        tracemalloc.stop()
+
+    assert len(probe.held) == timesteps - 1
+    assert probe.mismatches == []
+    assert max(map(abs, probe.held)) < HELD_BYTES, probe.held
+    assert max(probe.transient) < TRANSIENT_BYTES < N * N, probe.transient
+
+
+def test_simulate_life_numpy_peak_independent_of_timesteps():
+    """The whole run's peak memory is reached during setup and does not grow with timesteps."""
+    N = 512
+    peaks = []
+    for timesteps in (5, 200):
+        tracemalloc.start()
+        try:
+            simulate_life_numpy(N, timesteps, seed=2)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    assert abs(peaks[1] - peaks[0]) < HELD_BYTES, peaks
@@ -0,0 +1,121 @@
+"""
+Round-trip tests for DeltaHistory.
+
+Generations are appended (as grids or as pack_grid words) and read back in
+random order, so reads restart from a keyframe, continue forward from the
+cursor, or jump backwards across keyframes. Slices, negative indices and
+iteration must all give the appended boards exactly. The histories mix run-
+length deltas with small and large gaps (uint8 and wider gap dtypes), dense
+deltas and unchanged generations, on widths that are not multiples of 8 or
+64.
+"""
+
+import numpy as np
+import pytest
+
+from content.game_of_life import life_step_bitpacked, life_step_numpy, pack_grid
+from content.game_of_life_delta import DENSE_DELTA, KEYFRAME, RLE_DELTA, DeltaHistory
+from content.game_of_life_init import random_board
+
+
+def evolve(board, steps):
+    """Generations 0..steps - 1 starting from board."""
+    history = [board]
+    for _ in range(steps - 1):
+        history.append(life_step_numpy(history[-1]))
+    return history
+
+
+def mixed_history():
+    """A 45×70 run whose deltas are run-length, dense and empty, in that order."""
+    history = evolve(random_board((45, 70), 0.3, 6), 40)
+    rng = np.random.default_rng(0)
+    # Unrelated random boards: most bytes change
+    history += [(rng.random((45, 70)) < 0.5).astype(np.uint8) for _ in range(5)]
+    # Still frames: empty deltas
+    history += [history[-1]] * 3
+    return history
+
+
+def glider_history(shape=(300, 301), steps=30):
+    """A glider on a large board: a few changed bytes with gaps over 255 bytes."""
+    board = np.zeros(shape, dtype=np.uint8)
+    board[1, 2] = board[2, 3] = board[3, 1:4] = 1
+    board[250, 290:293] = 1
+    return evolve(board, steps)
+
+
+@pytest.mark.parametrize("history,interval", [
+    (mixed_history(), 8),
+    (mixed_history(), 1),
+    (glider_history(), 16),
+])
+def test_random_seeks(history, interval):
+    delta = DeltaHistory(history[0].shape, keyframe_interval=interval)
+    for board in history:
+        delta.append(board)
+    assert len(delta) == len(history)
+
+    rng = np.random.default_rng(1)
+    for t in rng.integers(0, len(history), size=3 * len(history)):
+        np.testing.assert_array_equal(delta[t], history[t], err_msg=f"generation {t}")
+    for t in range(1, len(history) + 1):
+        np.testing.assert_array_equal(delta[-t], history[-t])
+    with pytest.raises(IndexError):
+        delta[len(history)]
+
+
+def test_frame_kinds():
+    """The test histories exercise every frame kind and a wide gap dtype."""
+    delta = DeltaHistory((45, 70), keyframe_interval=8)
+    for board in mixed_history():
+        delta.append(board)
+    kinds = {kind for kind, _, _ in delta._frames}
+    assert kinds == {KEYFRAME, RLE_DELTA, DENSE_DELTA}
+
+    wide = DeltaHistory((300, 301), keyframe_interval=16)
+    for board in glider_history():
+        wide.append(board)
+    gap_dtypes = {a.dtype for kind, a, _ in wide._frames if kind == RLE_DELTA}
+    assert np.dtype(np.uint16) in gap_dtypes
+
+
+def test_slices_and_iteration():
+    history = mixed_history()
+    delta = DeltaHistory((45, 70), keyframe_interval=8)
+    for board in history:
+        delta.append(board)
+
+    expected = np.stack(history)
+    for index in (slice(None), slice(5, 30), slice(3, 47, 7), slice(None, None, -3), slice(-10, None),
+                  slice(20, 5, -4)):
+        np.testing.assert_array_equal(delta[index], expected[index], err_msg=str(index))
+    np.testing.assert_array_equal(np.stack(list(delta)), expected)
+
+
+def test_append_packed_matches_append():
+    shape = (37, 130)
+    dense, packed = DeltaHistory(shape, 8), DeltaHistory(shape, 8)
+    board = random_board(shape, 0.3, 2)
+    words = pack_grid(board)
+    history = []
+    for _ in range(30):
+        history.append(board)
+        dense.append(board)
+        packed.append_packed(words)
+        board = life_step_numpy(board)
+        words = life_step_bitpacked(words, shape[1])
+
+    assert packed.nbytes == dense.nbytes
+    for t in np.random.default_rng(3).permutation(len(history)):
+        np.testing.assert_array_equal(packed[t], history[t])
+        np.testing.assert_array_equal(dense[t], history[t])
+
+
+def test_wrong_shape_rejected():
+    delta = DeltaHistory((10, 70))
+    with pytest.raises(ValueError):
+        delta.append(np.zeros((10, 71), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        delta.append_packed(pack_grid(np.zeros((10, 130), dtype=np.uint8)))
+    assert len(delta) == 0
@@ -0,0 +1,423 @@
+"""
+Equivalence tests for the Game of Life engines.
+
+Every engine is checked generation by generation against life_step_numpy,
+on odd board shapes and widths that are not multiples of 64 (so packed
+words, tiles, strips and rank blocks all have ragged edges), and in every
+boundary mode the engine supports. The reference steps plain arrays with
+np.roll for the torus and HaloGrids for the "dead" and "reflect" modes;
+the naive engine, which shares no code with either, checks the reference
+itself in all three modes.
+
+The MPI test runs a script under `mpirun -n 4` and is skipped when mpirun
+or mpi4py is not available; the CuPy test needs a GPU.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from content.game_of_life import (iter_life_naive, iter_life_numpy, life_step_bitpacked, life_step_naive,
+                                  life_step_numpy, life_step_numpy_into, pack_grid,
+                                  simulate_life_bitpacked, simulate_life_naive,
+                                  simulate_life_numpy, unpack_grid)
+from content.game_of_life_checkpoint import Checkpointer
+from content.game_of_life_cycles import CycleDetector
+from content.game_of_life_ensemble import life_step_ensemble_into, simulate_life_ensemble
+from content.game_of_life_halo import BOUNDARIES, HaloGrid
+from content.game_of_life_init import random_board
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Odd heights and widths that are not multiples of 64
+SHAPES = [(37, 53), (20, 130), (65, 70)]
+
+# Square sizes for the simulate_* functions, which take N
+SIZES = [37, 70]
+
+# Generations compared per board
+STEPS = 24
+
+
+def reference(board: np.ndarray, steps: int = STEPS, boundary: str = "torus") -> list:
+    """
+    Return generations 0..steps of board stepped with life_step_numpy.
+
+    Args:
+        board (np.ndarray): Initial 2D board of 0s and 1s.
+        steps (int): Generations to step.
+        boundary (str): Boundary mode, one of BOUNDARIES.
+
+    Returns:
+        list[np.ndarray]: steps + 1 uint8 boards.
+    """
+    boards = [np.asarray(board, dtype=np.uint8)]
+    for _ in range(steps):
+        if boundary == "torus":
+            boards.append(life_step_numpy(boards[-1]))
+        else:
+            boards.append(life_step_numpy(HaloGrid(boards[-1], boundary)).to_array())
+    return boards
+
+
+def assert_same_history(history, expected):
+    """Assert two sequences of boards are equal, naming the first differing generation."""
+    assert len(history) == len(expected)
+    for t, (board, want) in enumerate(zip(history, expected)):
+        assert np.array_equal(board, want), f"generation {t} differs"
+
+
+def board_for(shape, seed=0, p_alive=0.3):
+    return random_board(shape, p_alive, seed)
+
+
+# -------------------------------------------------------------------
+# NumPy variants and the naive engine
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("shape", [(13, 17), (9, 70)])
+def test_naive(shape, boundary):
+    board = board_for(shape)
+    grid = board if boundary == "torus" else HaloGrid(board, boundary)
+    history = [board]
+    for _ in range(8):
+        grid = life_step_naive(grid)
+        history.append(grid.to_array() if isinstance(grid, HaloGrid) else grid)
+    assert_same_history(history, reference(board, 8, boundary))
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_halo_torus_and_into(shape):
+    board = board_for(shape)
+    expected = reference(board)
+    grid, out = HaloGrid(board), HaloGrid(board)
+    flat, flat_out = board.copy(), np.empty_like(board)
+    neighbours, scratch = np.empty_like(board), np.empty((2,) + shape, dtype=np.uint8)
+    halo_history, into_history = [board], [board]
+    for _ in range(STEPS):
+        grid, out = life_step_numpy(grid, out), grid
+        life_step_numpy_into(flat, flat_out, neighbours, scratch)
+        flat, flat_out = flat_out, flat
+        halo_history.append(grid.to_array())
+        into_history.append(flat.copy())
+    assert_same_history(halo_history, expected)
+    assert_same_history(into_history, expected)
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("N", SIZES)
+def test_simulate_numpy_and_iter(N, boundary):
+    expected = reference(random_board((N, N), 0.2, 5), STEPS - 1, boundary)
+    history = simulate_life_numpy(N, STEPS, record_history=True, boundary=boundary, seed=5)
+    assert_same_history(history, expected)
+    streamed = [grid.copy() for _, grid in iter_life_numpy(N, STEPS - 1, boundary=boundary, seed=5)]
+    assert_same_history(streamed, expected)
+
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_mem_opt_life_step_int(shape, boundary):
+    from content.game_of_life_mem_opt import life_step_int
+
+    board = board_for(shape)
+    grid, out = HaloGrid(board, boundary), HaloGrid(board, boundary)
+    neighbours = np.empty(shape, dtype=np.uint8)
+    history = [board]
+    for _ in range(STEPS):
+        nxt = life_step_int(grid, neighbours, out)
+        grid, out = nxt, grid
+        history.append(grid.to_array())
+    assert_same_history(history, reference(board, STEPS, boundary))
+
+    if boundary == "torus":
+        flat, history = board, [board]
+        for _ in range(STEPS):
+            flat = life_step_int(flat, neighbours)
+            history.append(flat)
+        assert_same_history(history, reference(board))
+
+
+# -------------------------------------------------------------------
+# Bit-packed, Numba, sparse, tiled, shared-memory and Hashlife engines
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("shape", SHAPES + [(31, 64), (17, 1)])
+def test_bitpacked(shape):
+    board = board_for(shape)
+    packed, history = pack_grid(board), [board]
+    for _ in range(STEPS):
+        packed = life_step_bitpacked(packed, shape[1])
+        history.append(unpack_grid(packed, shape[1]))
+    assert_same_history(history, reference(board))
+
+
+@pytest.mark.parametrize("N", SIZES)
+def test_simulate_bitpacked(N):
+    history = simulate_life_bitpacked(N, STEPS, record_history=True, seed=3)
+    assert_same_history(history, reference(random_board((N, N), 0.2, 3), STEPS - 1))
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_numba(shape):
+    numba_backend = pytest.importorskip("content.game_of_life_numba")
+    board = board_for(shape)
+    grid, out, history = board.copy(), np.empty_like(board), [board]
+    for _ in range(STEPS):
+        numba_backend.life_step_numba(grid, out)
+        grid, out = out, grid
+        history.append(grid.copy())
+    assert_same_history(history, reference(board))
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_sparse_step(shape):
+    from content.game_of_life_sparse import dense_to_sparse, life_step_sparse, sparse_to_dense
+
+    board = board_for(shape, p_alive=0.1)
+    cells, history = dense_to_sparse(board), [board]
+    for _ in range(STEPS):
+        cells = life_step_sparse(cells, shape)
+        history.append(sparse_to_dense(cells, shape))
+    assert_same_history(history, reference(board))
+
+
+@pytest.mark.parametrize("density_threshold", [0.0, 0.15, 1.0])
+@pytest.mark.parametrize("N", SIZES)
+def test_simulate_sparse(N, density_threshold):
+    """Dense only, switching between dense and sparse, and sparse from the start."""
+    from content.game_of_life_sparse import simulate_life_sparse
+
+    history = simulate_life_sparse(N, 60, record_history=True,
+                                   density_threshold=density_threshold, seed=4)
+    assert_same_history(history, reference(random_board((N, N), 0.2, 4), 59))
+
+
+@pytest.mark.parametrize("tile_size", [8, 16])
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("shape", SHAPES)
+def test_tiled(shape, boundary, tile_size):
+    """Long enough for most tiles to settle and be skipped."""
+    from content.game_of_life_tiled import TiledLife
+
+    board = board_for(shape)
+    engine, history = TiledLife(board, tile_size, boundary), [board]
+    for _ in range(80):
+        engine.step()
+        history.append(engine.grid.copy())
+    assert_same_history(history, reference(board, 80, boundary))
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_shared(shape):
+    from content.game_of_life_shared import life_run_shared
+
+    board = board_for(shape)
+    assert np.array_equal(life_run_shared(board, STEPS, workers=3), reference(board)[-1])
+
+
+def test_simulate_shared():
+    from content.game_of_life_shared import simulate_life_shared
+
+    history = simulate_life_shared(37, STEPS, record_history=True, workers=2, seed=6)
+    assert_same_history(history, reference(random_board((37, 37), 0.2, 6), STEPS - 1))
+
+
+@pytest.mark.parametrize("N", [16, 64])
+def test_hashlife(N):
+    from content.game_of_life_hashlife import HashLife, life_advance_hashlife, simulate_life_hashlife
+
+    board = board_for((N, N))
+    expected = reference(board, 40)
+    engine = HashLife()
+    for generations in (1, 7, 16, 33, 40):
+        assert np.array_equal(life_advance_hashlife(board, generations, engine), expected[generations])
+
+    history = simulate_life_hashlife(N, STEPS, record_history=True, seed=7)
+    assert_same_history(history, reference(random_board((N, N), 0.2, 7), STEPS - 1))
+
+
+def test_cupy():
+    cp = pytest.importorskip("cupy")
+    try:
+        gpus = cp.cuda.runtime.getDeviceCount()
+    except cp.cuda.runtime.CUDARuntimeError:
+        gpus = 0
+    if not gpus:
+        pytest.skip("no CUDA device")
+    from content.game_of_life import life_step_gpu_into
+
+    for shape in SHAPES:
+        board = board_for(shape)
+        grid = cp.asarray(board)
+        out, neighbours = cp.empty_like(grid), cp.empty_like(grid)
+        scratch = cp.empty((2,) + shape, dtype=cp.uint8)
+        history = [board]
+        for _ in range(STEPS):
+            life_step_gpu_into(grid, out, neighbours, scratch)
+            grid, out = out, grid
+            history.append(cp.asnumpy(grid))
+        assert_same_history(history, reference(board))
+
+    from content.game_of_life import simulate_life_cupy
+    detector = CycleDetector()
+    history = simulate_life_cupy(16, 400, record_history=True, detector=detector, seed=8)
+    assert detector.period is not None
+    assert_same_history(history, reference(random_board((16, 16), 0.2, 8), len(history) - 1))
+
+
+# -------------------------------------------------------------------
+# Batched ensemble
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("boundary", BOUNDARIES)
+@pytest.mark.parametrize("N", [9, 37])
+def test_ensemble_step(N, boundary):
+    boards = np.stack([board_for((N, N), seed) for seed in range(5)])
+    grid, out = HaloGrid(boards, boundary), HaloGrid(boards, boundary)
+    W, L = N + 2, grid.padded.size
+    rows = np.empty(L - 2, dtype=np.uint8)
+    neighbours = np.empty(L - 2 * W - 2, dtype=np.uint8)
+    history = [boards]
+    for _ in range(STEPS):
+        life_step_ensemble_into(grid, out, rows, neighbours)
+        grid, out = out, grid
+        history.append(grid.to_array())
+    for b, board in enumerate(boards):
+        assert_same_history([h[b] for h in history], reference(board, STEPS, boundary))
+
+
+def test_simulate_ensemble():
+    N, seeds, p_alive = 37, [0, 1, 2, 3], [0.1, 0.2, 0.3, 0.4]
+    populations, final = simulate_life_ensemble(N, STEPS, p_alive, seeds, return_final=True)
+    for b, (p, seed) in enumerate(zip(p_alive, seeds)):
+        expected = reference(random_board((N, N), p, seed))
+        assert np.array_equal(final[b], expected[-1])
+        assert list(populations[b]) == [int(board.sum()) for board in expected]
+
+
+# -------------------------------------------------------------------
+# Cycle detection and checkpoint/restart
+# -------------------------------------------------------------------
+
+def iter_history(iter_life):
+    """Give an iter_life_* generator the history-returning signature of simulate_life_*."""
+    def simulate(N, timesteps, record_history=True, **kwargs):
+        return [grid.copy() for _, grid in iter_life(N, timesteps, **kwargs)]
+    return simulate
+
+
+@pytest.mark.parametrize("engine", [
+    simulate_life_numpy, simulate_life_naive, simulate_life_bitpacked,
+    iter_history(iter_life_numpy), iter_history(iter_life_naive),
+], ids=["numpy", "naive", "bitpacked", "iter_numpy", "iter_naive"])
+def test_cycle_detector_stops_at_first_repeat(engine):
+    N, timesteps = 16, 400
+    detector = CycleDetector()
+    history = engine(N, timesteps, record_history=True, detector=detector, seed=8)
+    expected = reference(random_board((N, N), 0.2, 8), timesteps)
+    assert detector.period is not None and len(history) < timesteps
+    assert_same_history(history, expected[:len(history)])
+    stop = len(history)
+    assert np.array_equal(expected[stop], expected[stop - detector.period])
+
+
+@pytest.mark.parametrize("engine,boundaries", [
+    (simulate_life_numpy, BOUNDARIES),
+    (simulate_life_naive, BOUNDARIES),
+    (simulate_life_bitpacked, ("torus",)),
+])
+def test_checkpoint_resume(tmp_path, engine, boundaries):
+    """A run killed after 15 generations and resumed gives the uninterrupted generations."""
+    N, timesteps = 21, 30
+    for boundary in boundaries:
+        kwargs = {} if engine is simulate_life_bitpacked else {"boundary": boundary}
+        path = tmp_path / f"{boundary}.npz"
+        with Checkpointer(path, every=10) as checkpointer:
+            engine(N, 15, seed=9, checkpointer=checkpointer, **kwargs)
+        with Checkpointer(path, every=10, resume=True) as checkpointer:
+            history = engine(N, timesteps, record_history=True, checkpointer=checkpointer, **kwargs)
+        assert checkpointer.start == 10
+        expected = reference(random_board((N, N), 0.2, 9), timesteps - 1, boundary)
+        assert_same_history(history, expected[10:])
+
+
+def test_checkpoint_resume_mem_opt(tmp_path):
+    """simulate_and_animate resumes both the board and the alive counts."""
+    from content.game_of_life_mem_opt import simulate_and_animate
+
+    N, timesteps, boundary = 23, 30, "reflect"
+    path = tmp_path / "run.npz"
+    with Checkpointer(path, every=10) as checkpointer:
+        simulate_and_animate(N, 15, 0.2, tmp_path / "a.gif", boundary=boundary, seed=10,
+                             checkpointer=checkpointer)
+    with Checkpointer(path, every=10, resume=True) as checkpointer:
+        counts = simulate_and_animate(N, timesteps, 0.2, tmp_path / "b.gif", boundary=boundary,
+                                      checkpointer=checkpointer)
+    expected = reference(random_board((N, N), 0.2, 10), timesteps - 1, boundary)
+    assert np.array_equal(counts, np.sum(expected, axis=0))
+
+
+# -------------------------------------------------------------------
+# MPI
+# -------------------------------------------------------------------
+
+MPI_SCRIPT = textwrap.dedent("""
+    import sys
+    import numpy as np
+    from mpi4py import MPI
+    from content.game_of_life import life_step_numpy
+    from content.game_of_life_init import random_board
+    from content.game_of_life_mpi import LifeBlock, simulate_life_mpi
+
+    comm = MPI.COMM_WORLD
+    failures = []
+    for shape in {shapes!r}:
+        block = LifeBlock(*shape, comm=comm)
+        board = random_board(shape, 0.3, 0)
+        block.scatter(board if comm.Get_rank() == 0 else None)
+        for t in range({steps}):
+            block.step()
+            board = life_step_numpy(board)
+            gathered = block.gather()
+            if comm.Get_rank() == 0 and not np.array_equal(gathered, board):
+                failures.append(f"{{shape}} generation {{t + 1}}")
+    N = {size}
+    history = simulate_life_mpi(N, {steps}, record_history=True, seed=11)
+    if comm.Get_rank() == 0:
+        board = random_board((N, N), 0.2, 11)
+        for t, gathered in enumerate(history):
+            if not np.array_equal(gathered, board):
+                failures.append(f"simulate_life_mpi generation {{t}}")
+            board = life_step_numpy(board)
+    failures = comm.bcast(failures)
+    if failures:
+        sys.exit("MPI engine differs: " + ", ".join(failures))
+""")
+
+
+def test_mpi(tmp_path):
+    """The Cartesian-decomposed engine on 4 ranks matches life_step_numpy."""
+    pytest.importorskip("mpi4py")
+    mpirun = shutil.which("mpirun") or shutil.which("mpiexec")
+    if mpirun is None:
+        pytest.skip("mpirun not available")
+    script = tmp_path / "mpi_equivalence.py"
+    script.write_text(MPI_SCRIPT.format(shapes=SHAPES, steps=STEPS, size=SIZES[0]))
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT_DIR), os.environ.get("PYTHONPATH")])),
+        # Open MPI: allow root (containers) and more ranks than cores
+        "OMPI_ALLOW_RUN_AS_ROOT": "1",
+        "OMPI_ALLOW_RUN_AS_ROOT_CONFIRM": "1",
+        "OMPI_MCA_rmaps_base_oversubscribe": "1",
+    }
+    result = subprocess.run([mpirun, "-n", "4", sys.executable, str(script)],
+                            env=env, capture_output=True, text=True, timeout=300)
+    assert result.returncode == 0, result.stdout + result.stderr
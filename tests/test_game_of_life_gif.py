@@ -0,0 +1,100 @@
+"""
+Round-trip tests for the direct GIF encoder.
+
+write_gif encodes frames with GifImagePlugin.getheader/getdata, which are
+not part of Pillow's documented API (pyproject.toml pins the tested
+range). These tests write Game of Life histories, decode the GIF with
+Pillow's reader and compare every frame with its board: one pixel per
+cell, upscaled and block-reduced, with and without changed-rectangle
+frames, including generations where nothing changes.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from content.game_of_life import life_step_numpy
+from content.game_of_life_gif import GifWriter, frame_scaling, grey_palette, quantise, write_gif
+from content.game_of_life_init import random_board
+
+
+def life_history(shape=(23, 37), steps=12, seed=4):
+    """Generations 0..steps of a random board, with a still frame repeated at the end."""
+    history = [random_board(shape, 0.3, seed)]
+    for _ in range(steps):
+        history.append(life_step_numpy(history[-1]))
+    return history + [history[-1], history[-1]]
+
+
+def decode(path):
+    """Decode every frame of a GIF as a 2D array of grey levels, plus the frame durations."""
+    frames, durations = [], []
+    with Image.open(path) as im:
+        for k in range(im.n_frames):
+            im.seek(k)
+            frames.append(np.asarray(im.convert("L")))
+            durations.append(im.info["duration"])
+    return frames, durations
+
+
+@pytest.mark.parametrize("changed_rects", [True, False])
+def test_one_pixel_per_cell(tmp_path, changed_rects):
+    history = life_history()
+    path = tmp_path / "life.gif"
+    write_gif(history, path, interval=70, changed_rects=changed_rects)
+
+    frames, durations = decode(path)
+    assert len(frames) == len(history)
+    assert durations == [70] * len(history)
+    for t, (frame, board) in enumerate(zip(frames, history)):
+        # Dead cells are white, live cells black
+        np.testing.assert_array_equal(frame == 0, board == 1, err_msg=f"frame {t}")
+        assert set(np.unique(frame)) <= {0, 255}
+
+
+def test_upscaled(tmp_path):
+    history = life_history()
+    path = tmp_path / "life.gif"
+    write_gif(history, path, max_display=4 * 37)
+
+    frames, _ = decode(path)
+    assert frames[0].shape == (4 * 23, 4 * 37)
+    for frame, board in zip(frames, history):
+        np.testing.assert_array_equal(frame, np.kron(255 * (1 - board), np.ones((4, 4), dtype=np.uint8)))
+
+
+def test_block_reduced(tmp_path):
+    """Each block is drawn with the grey level of its live-cell fraction."""
+    history = life_history(shape=(45, 61))
+    path = tmp_path / "life.gif"
+    write_gif(history, path, max_display=20)
+
+    block, scale = frame_scaling(61, 20)
+    levels = min(block * block, 255) + 1
+    grey = np.array(grey_palette(levels)[::3], dtype=np.uint8)
+    frames, _ = decode(path)
+    assert block > 1 and scale == 1
+    for frame, board in zip(frames, history):
+        np.testing.assert_array_equal(frame, grey[quantise(board, block, 1, levels)])
+
+
+def test_writer_streams_and_copies(tmp_path):
+    """GifWriter copies each grid, so the caller may reuse its buffer."""
+    history = life_history()
+    path = tmp_path / "life.gif"
+    buffer = np.empty_like(history[0])
+    with GifWriter(path, buffer.shape, workers=2) as gif:
+        for board in history:
+            buffer[...] = board
+            gif.append(buffer)
+    assert gif.frames == len(history)
+
+    frames, _ = decode(path)
+    for frame, board in zip(frames, history):
+        np.testing.assert_array_equal(frame == 0, board == 1)
+
+
+def test_empty_history_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_gif([], tmp_path / "empty.gif")
+    assert not (tmp_path / "empty.gif").exists()
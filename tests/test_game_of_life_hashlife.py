@@ -0,0 +1,54 @@
+"""
+Memory-bound tests for the Hashlife engine.
+
+HashLife collects its canonical node table inside jumps, so a long
+advance() or advance_torus() must never hold more than max_nodes nodes, as
+long as the nodes in use fit in half the table. These tests run jumps whose
+unbounded table is larger than max_nodes, and check the peak table size,
+that memoised results survive collections, and that the boards are
+unchanged by collecting.
+"""
+
+import numpy as np
+import pytest
+
+from content.game_of_life import life_step_numpy
+from content.game_of_life_hashlife import HEADROOM, HashLife, life_advance_hashlife
+from content.game_of_life_init import random_board
+
+
+def test_advance_torus_peak_within_max_nodes():
+    """A 64² torus advanced 300 generations stays within max_nodes and matches life_step_numpy."""
+    grid = random_board((64, 64), 0.3, 5)
+    engine = HashLife(max_nodes=8192)
+    result = life_advance_hashlife(grid, 300, engine)
+
+    expected = grid
+    for _ in range(300):
+        expected = life_step_numpy(expected)
+    np.testing.assert_array_equal(result, expected)
+
+    stats = engine.stats()
+    assert stats["collections"] >= 2
+    assert stats["peak_nodes"] <= engine.max_nodes, stats
+    assert stats["results"] > 0, stats
+
+
+def test_advance_plane_peak_within_max_nodes():
+    """A pattern on the plane gives the same result with a small and an unbounded table."""
+    grid = random_board((32, 32), 0.3, 1)
+    bounded, unbounded = HashLife(max_nodes=4096), HashLife()
+    node, top, left = bounded.advance(bounded.from_array(grid), 1000)
+    ref, ref_top, ref_left = unbounded.advance(unbounded.from_array(grid), 1000)
+
+    assert (node.level, top, left) == (ref.level, ref_top, ref_left)
+    np.testing.assert_array_equal(bounded.to_array(node), unbounded.to_array(ref))
+    assert unbounded.stats()["peak_nodes"] > bounded.max_nodes
+    assert bounded.stats()["collections"] >= 1
+    assert bounded.stats()["peak_nodes"] <= bounded.max_nodes, bounded.stats()
+
+
+def test_max_nodes_below_headroom_rejected():
+    """A table too small to hold the headroom is refused."""
+    with pytest.raises(ValueError):
+        HashLife(max_nodes=HEADROOM)
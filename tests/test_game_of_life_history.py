@@ -0,0 +1,126 @@
+"""
+Round-trip tests for HistoryStore.
+
+Generations are appended (as grids or as pack_grid words), the store is
+closed and reopened read-only from its JSON sidecar, and every generation,
+slice and negative index must read back as the appended board. Widths that
+are not multiples of 8 or 64 check the row packing, and alive_counts over a
+store must match the sum of the boards whatever its chunk size.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from content.game_of_life import (life_step_bitpacked, life_step_numpy, pack_grid, simulate_life_bitpacked,
+                                  simulate_life_numpy)
+from content.game_of_life_history import HistoryStore
+from content.game_of_life_init import random_board
+from content.game_of_life_mem_opt import alive_counts
+
+
+def evolve(shape, steps, seed=3):
+    """Generations 0..steps - 1 of a random board."""
+    history = [random_board(shape, 0.3, seed)]
+    for _ in range(steps - 1):
+        history.append(life_step_numpy(history[-1]))
+    return history
+
+
+@pytest.mark.parametrize("shape", [(17, 23), (20, 64), (9, 130)])
+def test_append_and_reopen(tmp_path, shape):
+    history = evolve(shape, 25)
+    path = tmp_path / "run.npy"
+    with HistoryStore(path, shape=shape, capacity=40) as store:
+        for board in history:
+            store.append(board)
+        assert len(store) == len(history)
+
+    assert json.loads(path.with_suffix(".json").read_text()) == {"shape": list(shape), "length": len(history)}
+    store = HistoryStore(path)
+    assert store.shape == shape and store.capacity == 40 and len(store) == len(history)
+
+    for t in np.random.default_rng(0).permutation(len(history)):
+        np.testing.assert_array_equal(store[t], history[t], err_msg=f"generation {t}")
+        np.testing.assert_array_equal(store[t - len(history)], history[t])
+    expected = np.stack(history)
+    for index in (slice(None), slice(3, 20, 4), slice(None, None, -2), slice(-5, None), slice(10, 100)):
+        np.testing.assert_array_equal(store[index], expected[index], err_msg=str(index))
+    np.testing.assert_array_equal(np.stack(list(store)), expected)
+    with pytest.raises(IndexError):
+        store[len(history)]
+
+    with pytest.raises(ValueError):
+        store.append(history[0])
+
+
+def test_flush_makes_partial_run_readable(tmp_path):
+    """A reader opened after flush sees the generations written so far."""
+    history = evolve((12, 30), 10)
+    path = tmp_path / "run.npy"
+    writer = HistoryStore(path, shape=(12, 30), capacity=10)
+    for board in history[:6]:
+        writer.append(board)
+    writer.flush()
+
+    reader = HistoryStore(path)
+    assert len(reader) == 6
+    np.testing.assert_array_equal(reader[:], np.stack(history[:6]))
+    writer.close()
+
+
+def test_full_store_rejects_append(tmp_path):
+    history = evolve((8, 11), 3)
+    store = HistoryStore(tmp_path / "run.npy", shape=(8, 11), capacity=2)
+    store.append(history[0])
+    store.append(history[1])
+    with pytest.raises(IndexError):
+        store.append(history[2])
+    with pytest.raises(ValueError):
+        HistoryStore(tmp_path / "other.npy", shape=(8, 11))
+
+
+@pytest.mark.parametrize("shape", [(15, 37), (10, 64), (7, 150)])
+def test_append_packed_matches_append(tmp_path, shape):
+    history = evolve(shape, 20)
+    dense = HistoryStore(tmp_path / "dense.npy", shape=shape, capacity=20)
+    packed = HistoryStore(tmp_path / "packed.npy", shape=shape, capacity=20)
+    words = pack_grid(history[0])
+    for board in history:
+        dense.append(board)
+        packed.append_packed(words)
+        words = life_step_bitpacked(words, shape[1])
+    dense.close()
+    packed.close()
+
+    np.testing.assert_array_equal(np.load(tmp_path / "packed.npy"), np.load(tmp_path / "dense.npy"))
+    np.testing.assert_array_equal(HistoryStore(tmp_path / "packed.npy")[:], np.stack(history))
+
+
+def test_simulations_record_into_store(tmp_path):
+    """The NumPy and bit-packed backends record the same generations into a store."""
+    N, T = 70, 15
+    stores = [HistoryStore(tmp_path / f"{name}.npy", shape=(N, N), capacity=T) for name in ("numpy", "packed")]
+    simulate_life_numpy(N, T, p_alive=0.3, store=stores[0], seed=9)
+    simulate_life_bitpacked(N, T, p_alive=0.3, store=stores[1], seed=9)
+    reference = simulate_life_numpy(N, T, p_alive=0.3, record_history=True, seed=9)
+
+    assert len(stores[0]) == len(stores[1]) == len(reference)
+    for store in stores:
+        store.close()
+        np.testing.assert_array_equal(HistoryStore(store.path)[:], np.stack(reference))
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 64])
+def test_alive_counts(tmp_path, chunk):
+    history = evolve((21, 45), 30)
+    with HistoryStore(tmp_path / "run.npy", shape=(21, 45), capacity=30) as store:
+        for board in history:
+            store.append(board)
+
+    expected = np.sum(history, axis=0)
+    counts = alive_counts(HistoryStore(tmp_path / "run.npy"), chunk=chunk)
+    assert counts.dtype == np.uint32
+    np.testing.assert_array_equal(counts, expected)
+    np.testing.assert_array_equal(alive_counts(history, chunk=chunk), expected)
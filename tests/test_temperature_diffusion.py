@@ -0,0 +1,182 @@
+"""
+Tests for the temperature diffusion backends.
+
+Every backend is checked against the masked stencil of diffusion_step, or
+against a long explicit run where the scheme differs: the precomputed
+DiffusionOperator and the ocean-only SparseDiffusionOperator step for step
+(values and the NaN land pattern), Crank-Nicolson against explicit steps
+of a much smaller dt over the same simulated time, and the multigrid
+steady state against the limit of explicit stepping, including an enclosed
+basin that relaxes to its weighted mean. The fields are synthetic
+(synthetic_field and hand-built masks), so the model data is not needed.
+"""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from content.temperature_diffusion import (DiffusionOperator, ImplicitDiffusion, NetCDFWriter,
+                                           diffusion_step, iter_diffusion, iter_diffusion_implicit,
+                                           save_to_netcdf)
+from content.temperature_diffusion_multigrid import steady_state
+from content.temperature_diffusion_sparse import SparseDiffusionOperator, iter_diffusion_sparse
+from content.temperature_diffusion_synthetic import synthetic_field
+
+SHAPE = (8, 21, 26)
+
+
+def reference(temperature, num_timesteps, diffusion_coeff):
+    """Fields after 1..num_timesteps steps of diffusion_step."""
+    current = np.array(temperature)
+    mask = ~np.isnan(current)
+    fields = []
+    for _ in range(num_timesteps):
+        current = diffusion_step(current, current.copy(), mask, diffusion_coeff)
+        fields.append(current)
+    return fields
+
+
+def assert_same_fields(fields, expected, rtol):
+    """Compare two field sequences, NaN (land) pattern included."""
+    assert len(fields) == len(expected)
+    for t, (field, want) in enumerate(zip(fields, expected)):
+        np.testing.assert_array_equal(np.isnan(field), np.isnan(want), err_msg=f"land pattern, step {t + 1}")
+        np.testing.assert_allclose(field, want, rtol=rtol, err_msg=f"step {t + 1}")
+
+
+def enclosed_basin_field(shape=(7, 10, 11), seed=0):
+    """
+    A float64 field with some land and an ocean basin enclosed by land.
+
+    The basin (depth 2-3, lat 3-5, lon 3-6) is walled in on all sides, so it
+    touches no fixed outer-face cell.
+    """
+    rng = np.random.default_rng(seed)
+    field = 10 + 5 * rng.random(shape)
+    field[1:5, 2:7, 2:8] = np.nan
+    field[2:4, 3:6, 3:7] = 20 + rng.random((2, 3, 4))
+    field[5, 6:8, 1:3] = np.nan
+    return field
+
+
+@pytest.mark.parametrize("land_fraction", [0.0, 0.3, 0.6])
+def test_operator_matches_diffusion_step(land_fraction):
+    field = synthetic_field(SHAPE, land_fraction, seed=1)
+    expected = reference(field, 12, 0.4)
+    fields = [f.copy() for f in iter_diffusion(field, 12, 0.4)]
+    assert_same_fields(fields, expected, rtol=1e-5)
+
+    operator = DiffusionOperator(~np.isnan(field), 0.4)
+    current = operator.fill(field)
+    nxt = current.copy()
+    for _ in expected:
+        operator.step(current, nxt)
+        current, nxt = nxt, current
+    assert_same_fields([operator.with_land(current)], expected[-1:], rtol=1e-5)
+
+
+def test_uniform_ocean_stays_uniform_next_to_land():
+    """Cells next to land move towards the mean of their ocean neighbours only."""
+    field = np.full(SHAPE, 7.5, dtype=np.float32)
+    field[np.isnan(synthetic_field(SHAPE, 0.4, seed=2))] = np.nan
+    for step, current in enumerate(iter_diffusion(field, 20, 0.9), 1):
+        np.testing.assert_allclose(current[~np.isnan(field)], 7.5, rtol=1e-6, err_msg=f"step {step}")
+
+
+@pytest.mark.parametrize("land_fraction", [0.0, 0.3, 0.6])
+def test_sparse_matches_dense(land_fraction):
+    field = synthetic_field(SHAPE, land_fraction, seed=3)
+    dense = [f.copy() for f in iter_diffusion(field, 15, 0.3)]
+    sparse = [f.copy() for f in iter_diffusion_sparse(field, 15, 0.3)]
+    assert_same_fields(sparse, dense, rtol=1e-5)
+
+    operator = SparseDiffusionOperator(~np.isnan(field), 0.3)
+    assert operator.cells.size == np.count_nonzero(~np.isnan(field))
+    np.testing.assert_array_equal(operator.scatter(operator.gather(field)), field)
+
+
+def test_crank_nicolson_matches_fine_explicit():
+    """Crank-Nicolson with dt = 1 follows explicit steps of dt = 1/50 over the same time."""
+    field = synthetic_field((6, 16, 18), 0.3, seed=4).astype(np.float64)
+    k, steps, substeps = 0.2, 10, 50
+    solver = ImplicitDiffusion(field, k, dt=1.0, theta=0.5, rtol=1e-12)
+    implicit = [f.copy() for f in iter_diffusion_implicit(field, steps, k, dt=1.0, theta=0.5, solver=solver)]
+    explicit = [f.copy() for f in iter_diffusion(field, steps * substeps, k / substeps)][substeps - 1::substeps]
+
+    ocean = ~np.isnan(field)
+    change = np.abs(explicit[-1][ocean] - field[ocean]).max()
+    for t, (cn, fine) in enumerate(zip(implicit, explicit), 1):
+        np.testing.assert_array_equal(np.isnan(cn), np.isnan(fine))
+        # A few thousandths of the total change: the remaining gap is the
+        # O(dt) error of the fine explicit run
+        assert np.abs(cn[ocean] - fine[ocean]).max() < 5e-3 * change, t
+
+    # Backward Euler is only first order: further from the fine run than Crank-Nicolson
+    euler = [f.copy() for f in iter_diffusion_implicit(field, steps, k, dt=1.0, theta=1.0)]
+    assert np.abs(euler[-1] - explicit[-1])[ocean].max() > np.abs(implicit[-1] - explicit[-1])[ocean].max()
+
+
+def test_steady_state_matches_long_explicit_run():
+    field = enclosed_basin_field()
+    steady, _ = steady_state(field, tol=1e-12)
+    explicit = field
+    for explicit in iter_diffusion(field, 60000, 0.9):
+        pass
+
+    np.testing.assert_array_equal(np.isnan(steady), np.isnan(field))
+    np.testing.assert_allclose(steady, explicit, rtol=0, atol=1e-12)
+
+    # The enclosed basin relaxes to the neighbour-count weighted mean of its
+    # initial temperatures, different from the temperatures around it
+    basin = (slice(2, 4), slice(3, 6), slice(3, 7))
+    ocean = ~np.isnan(field)
+    count = sum(np.pad(ocean, 1)[1 + dz:1 + dz + ocean.shape[0], 1 + dy:1 + dy + ocean.shape[1],
+                                 1 + dx:1 + dx + ocean.shape[2]].astype(int)
+                for dz, dy, dx in ((-1, 0, 0), (1, 0, 0), (0, -1, 0), (0, 1, 0), (0, 0, -1), (0, 0, 1)))
+    mean = np.sum(count[basin] * field[basin]) / np.sum(count[basin])
+    np.testing.assert_allclose(steady[basin], mean, rtol=1e-12)
+    assert mean > 20
+
+
+def synthetic_dataset(shape=(4, 5, 6)):
+    """An xr.Dataset shaped like the model data, with coordinate attributes."""
+    depth, lat, lon = shape
+    thetao = synthetic_field(shape, 0.3, seed=5)[None]
+    return xr.Dataset(
+        {"thetao": (("time", "depth", "latitude", "longitude"), thetao,
+                    {"units": "degrees_C", "standard_name": "sea_water_potential_temperature"})},
+        coords={
+            "depth": ("depth", np.linspace(0.5, 100, depth, dtype=np.float32), {"units": "m"}),
+            "latitude": ("latitude", np.linspace(46.8, 65.2, lat, dtype=np.float32),
+                         {"units": "degrees_north"}),
+            "longitude": ("longitude", np.linspace(-13.8, 6.2, lon, dtype=np.float32),
+                          {"units": "degrees_east"}),
+        },
+    )
+
+
+def test_netcdf_round_trip(tmp_path):
+    data = synthetic_dataset()
+    initial = data["thetao"].isel(time=0).values
+    fields = [f.copy() for f in iter_diffusion(initial, 5, 0.3)]
+    path = tmp_path / "out.nc"
+    save_to_netcdf(data, iter(fields), path, 4)
+
+    with xr.open_dataset(path) as written:
+        assert written["thetao"].dims == ("time", "depth", "latitude", "longitude")
+        assert written["thetao"].dtype == np.float32
+        assert written["thetao"].attrs["units"] == "degrees_C"
+        np.testing.assert_array_equal(written["time"].values, [1, 2, 3, 4])
+        for name in ("depth", "latitude", "longitude"):
+            np.testing.assert_array_equal(written[name].values, data[name].values)
+            assert written[name].attrs["units"] == data[name].attrs["units"]
+        np.testing.assert_array_equal(written["thetao"].values, np.stack(fields[:4]))
+
+    # Appending past the fields written above extends the unlimited time axis
+    with NetCDFWriter(data, tmp_path / "appended.nc") as writer:
+        for field in fields:
+            writer.append(field)
+        assert writer.steps == len(fields)
+    with xr.open_dataset(tmp_path / "appended.nc") as written:
+        assert written.sizes["time"] == len(fields)
+        np.testing.assert_array_equal(written["thetao"].values[-1], fields[-1])